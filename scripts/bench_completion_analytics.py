@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# bench_completion_analytics.py
+"""
+Throughput and memory of the streaming completion-log analytics vs raw read speed.
+
+Writes a synthetic game_log.csv of --size-mb (king-path boards from the path
+builder, iso_now-style timestamps), then times:
+
+  read        reading the file in the same chunks without parsing (disk or page-cache speed)
+  analyze     completion_analytics.analyze in this process, and its tracemalloc peak (second pass)
+  workers=N   the same over a process pool, for each --workers value
+
+    python scripts/bench_completion_analytics.py --size-mb 1024 --workers 2 4
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from completion_analytics import CHUNK_BYTES, analyze, iter_chunks  # noqa: E402
+from completion_logger import FIELDNAMES  # noqa: E402
+from path_builder import WarnsdorffPathBuilder  # noqa: E402
+
+
+def make_lines(count: int, seed: int) -> List[bytes]:
+    rng = random.Random(seed)
+    builder = WarnsdorffPathBuilder(size=5, seed=seed)
+    boards = [builder.build(one_pos=rng.randrange(25)).engine.flatten_board() for _ in range(256)]
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    lines = []
+    for i in range(count):
+        when = start + timedelta(microseconds=rng.randrange(365 * 24 * 3600 * 10 ** 6))
+        lines.append(f"player{rng.randrange(5000)},{when.isoformat()},{1 + i % 2},{rng.randrange(25)},"
+                     f"{rng.choice(boards)}\r\n".encode())
+    return lines
+
+
+def write_log(path: str, size_mb: int, seed: int) -> int:
+    """A log of about size_mb MiB, repeating a pool of distinct lines; returns the line count."""
+    lines = make_lines(50000, seed)
+    block = b"".join(lines)
+    target = size_mb * 2 ** 20
+    written = 0
+    count = 0
+    with open(path, "wb") as f:
+        f.write((",".join(FIELDNAMES) + "\r\n").encode())
+        while written < target:
+            f.write(block)
+            written += len(block)
+            count += len(lines)
+    return count
+
+
+def read_only(path: str, chunk_bytes: int) -> int:
+    return sum(len(chunk) for chunk in iter_chunks(path, chunk_bytes=chunk_bytes))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--workers", type=int, nargs="*", default=[os.cpu_count() or 1])
+    parser.add_argument("--chunk-mb", type=float, default=CHUNK_BYTES / 2 ** 20)
+    parser.add_argument("--log", help="analyse this log instead of writing a synthetic one")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    chunk_bytes = int(args.chunk_mb * 2 ** 20)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.log or os.path.join(tmp, "game_log.csv")
+        if not args.log:
+            start = time.perf_counter()
+            count = write_log(path, args.size_mb, args.seed)
+            print(f"wrote {count:,} records in {time.perf_counter() - start:.1f}s")
+        mib = os.path.getsize(path) / 2 ** 20
+        print(f"{path}: {mib:,.0f} MiB, chunks of {args.chunk_mb:g} MiB\n")
+        print(f"{'run':<12} {'seconds':>8} {'MiB/s':>8} {'records/s':>12} {'peak MiB':>9}")
+
+        start = time.perf_counter()
+        read_only(path, chunk_bytes)
+        seconds = time.perf_counter() - start
+        print(f"{'read':<12} {seconds:>8.2f} {mib / seconds:>8.0f} {'':>12} {'':>9}")
+
+        start = time.perf_counter()
+        stats = analyze(path, 1, chunk_bytes)
+        seconds = time.perf_counter() - start
+        tracemalloc.start()   # separate pass: tracing slows the allocations down
+        analyze(path, 1, chunk_bytes)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{'analyze':<12} {seconds:>8.2f} {mib / seconds:>8.0f} {stats.rows / seconds:>12,.0f} "
+              f"{peak / 2 ** 20:>9.1f}")
+
+        for workers in args.workers:
+            if workers <= 1:
+                continue
+            start = time.perf_counter()
+            pooled = analyze(path, workers, chunk_bytes)
+            seconds = time.perf_counter() - start
+            assert pooled.to_dict() == stats.to_dict()
+            print(f"{f'workers={workers}':<12} {seconds:>8.2f} {mib / seconds:>8.0f} "
+                  f"{pooled.rows / seconds:>12,.0f} {'':>9}")
+
+
+if __name__ == "__main__":
+    main()
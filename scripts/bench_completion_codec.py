@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# bench_completion_codec.py
+"""
+Size and scan speed of the binary completion log vs the CSV log.
+
+Writes the same synthetic completions (king-path boards from the path builder,
+iso_now-style timestamps with microseconds) with CompletionLogger and converts
+the CSV with csv_to_binary. Reports both file sizes, the conversion rates and
+the time of one sequential scan (best score per level) over each file: the CSV
+through csv.DictReader, the binary log through BinaryLogReader.fields() on the
+memory-mapped records, and a full decode of every binary record.
+
+    python scripts/bench_completion_codec.py --records 200000
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from completion_codec import BinaryLogReader, binary_to_csv, csv_to_binary  # noqa: E402
+from completion_logger import BufferedCompletionLogger, CompletionRecord  # noqa: E402
+from path_builder import WarnsdorffPathBuilder  # noqa: E402
+
+
+def write_csv(path: str, count: int, players: int, seed: int) -> None:
+    rng = random.Random(seed)
+    builder = WarnsdorffPathBuilder(size=5, seed=seed)
+    boards = [builder.build(one_pos=rng.randrange(25)).engine.flatten_board() for _ in range(256)]
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    with BufferedCompletionLogger(path, batch_size=4096, durability="none") as logger:
+        for i in range(count):
+            when = start + timedelta(microseconds=rng.randrange(365 * 24 * 3600 * 10 ** 6))
+            logger.append_record(CompletionRecord(f"player{rng.randrange(players)}", when.isoformat(),
+                                                  1 + i % 2, rng.randrange(25), rng.choice(boards)))
+
+
+def scan_csv(path: str) -> Dict[int, int]:
+    best: Dict[int, int] = {}
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            level, points = int(row["level"]), int(row["points"])
+            if points > best.get(level, -1):
+                best[level] = points
+    return best
+
+
+def scan_binary(path: str) -> Dict[int, int]:
+    best: Dict[int, int] = {}
+    with BinaryLogReader(path) as reader:
+        for _, _, level, points in reader.fields():
+            if points > best.get(level, -1):
+                best[level] = points
+    return best
+
+
+def decode_all(path: str) -> int:
+    with BinaryLogReader(path) as reader:
+        return sum(1 for _ in reader)
+
+
+def timed(fn: Callable[[], object]) -> Tuple[float, object]:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=200000)
+    parser.add_argument("--players", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    n = args.records
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "game_log.csv")
+        bin_path = os.path.join(tmp, "game_log.bin")
+        write_csv(csv_path, n, args.players, args.seed)
+        encode_s, _ = timed(lambda: csv_to_binary(csv_path, bin_path))
+        decode_s, _ = timed(lambda: binary_to_csv(bin_path, os.path.join(tmp, "back.csv")))
+        csv_size, bin_size = os.path.getsize(csv_path), os.path.getsize(bin_path)
+        with open(csv_path, "rb") as a, open(os.path.join(tmp, "back.csv"), "rb") as b:
+            identical = a.read() == b.read()
+
+        csv_scan_s, csv_best = timed(lambda: scan_csv(csv_path))
+        bin_scan_s, bin_best = timed(lambda: scan_binary(bin_path))
+        full_s, _ = timed(lambda: decode_all(bin_path))
+        assert csv_best == bin_best
+
+    print(f"{n} records, {args.players} players")
+    print(f"  CSV     {csv_size:>14,} bytes  {csv_size / n:6.1f} B/record")
+    print(f"  binary  {bin_size:>14,} bytes  {bin_size / n:6.1f} B/record  ({csv_size / bin_size:.2f}x smaller)")
+    print(f"  encode (CSV -> binary) {n / encode_s:>12,.0f} records/s")
+    print(f"  decode (binary -> CSV) {n / decode_s:>12,.0f} records/s  round trip identical: {identical}")
+    print(f"\nscan: best points per level")
+    print(f"  CSV DictReader         {csv_scan_s * 1000:>9.1f} ms")
+    print(f"  binary fields()        {bin_scan_s * 1000:>9.1f} ms  ({csv_scan_s / bin_scan_s:.1f}x faster)")
+    print(f"  binary full decode     {full_s * 1000:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# bench_completion_leaderboard.py
+"""
+Cost of the in-memory top-K Leaderboard: updates, warm start and snapshots.
+
+For each --k:
+
+  add ns       Leaderboard.add per completion over --records random records (most miss the board)
+  hit ns       add when every completion makes the board (rising points: heapreplace each time)
+  top us       top() after each update (copy + sort of k entries), and cached between updates
+  busy top us  cached top() while another thread keeps adding
+
+Then the warm start: one streaming pass over a --records CSV log.
+
+    python scripts/bench_completion_leaderboard.py --records 1000000 --k 10 100 1000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from completion_leaderboard import Leaderboard  # noqa: E402
+from completion_logger import CompletionRecord, RotatingCompletionLogger  # noqa: E402
+
+
+def make_records(count: int, seed: int) -> List[CompletionRecord]:
+    rng = random.Random(seed)
+    board = ";".join(str(n) for n in range(1, 26))
+    return [CompletionRecord(f"player{rng.randrange(5000)}",
+                             f"2026-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}T00:00:00+00:00",
+                             1 + i % 2, rng.randrange(25), board)
+            for i in range(count)]
+
+
+def ns_per(seconds: float, count: int) -> float:
+    return seconds / count * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=200000)
+    parser.add_argument("--k", type=int, nargs="*", default=[10, 100, 1000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    records = make_records(args.records, args.seed)
+    rising = [CompletionRecord("p", "2026-01-01T00:00:00+00:00", 1, n, "") for n in range(100000)]
+    print(f"{args.records:,} records")
+    print(f"{'k':>6} {'add ns':>8} {'hit ns':>8} {'top us':>8} {'cached us':>10} {'busy top us':>12}")
+    for k in args.k:
+        board = Leaderboard(k)
+        start = time.perf_counter()
+        for record in records:
+            board.add(record)
+        add = ns_per(time.perf_counter() - start, len(records))
+
+        hits = Leaderboard(k)
+        start = time.perf_counter()
+        for record in rising:
+            hits.add(record)
+        hit = ns_per(time.perf_counter() - start, len(rising))
+
+        fresh, cached = 0.0, 0.0
+        for record in rising[:2000]:
+            hits.add(CompletionRecord(record.player_name, record.timestamp_iso, 1, record.points + 10 ** 6, ""))
+            start = time.perf_counter()
+            hits.top(1)
+            fresh += time.perf_counter() - start
+            start = time.perf_counter()
+            hits.top(1)
+            cached += time.perf_counter() - start
+
+        stop = threading.Event()
+
+        def writer() -> None:
+            i = 0
+            while not stop.is_set():
+                board.add(records[i % len(records)])
+                i += 1
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        reads = 0
+        start = time.perf_counter()
+        while time.perf_counter() - start < 0.5:
+            board.top(1)
+            reads += 1
+        busy = (time.perf_counter() - start) / reads * 1e6
+        stop.set()
+        thread.join()
+        print(f"{k:>6} {add:>8.0f} {hit:>8.0f} {fresh / 2000 * 1e6:>8.1f} {cached / 2000 * 1e6:>10.2f} "
+              f"{busy:>12.2f}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "game_log.csv")
+        with RotatingCompletionLogger(path, max_bytes=8 << 20) as logger:
+            for record in records:
+                logger.append_record(record)
+        start = time.perf_counter()
+        loaded = Leaderboard(args.k[0]).load(path)
+        seconds = time.perf_counter() - start
+    print(f"\nwarm start: {loaded:,} records (rotated, gzip) in {seconds:.2f}s = {loaded / seconds:,.0f} records/s")
+
+
+if __name__ == "__main__":
+    main()
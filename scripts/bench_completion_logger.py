@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# bench_completion_logger.py
+"""
+Throughput of CompletionLogger vs BufferedCompletionLogger, in records/second.
+
+Appends the same records from one or more threads to a fresh log in a temporary
+directory. Each run is timed from the first append until close() returns, so
+the buffered loggers include their final flush. The buffered logger runs under
+each durability policy.
+
+    python scripts/bench_completion_logger.py --records 50000 --threads 4
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from typing import Callable, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from completion_logger import (  # noqa: E402
+    DURABILITY_POLICIES, BufferedCompletionLogger, CompletionLogger, CompletionRecord,
+)
+
+
+def make_records(count: int) -> List[CompletionRecord]:
+    return [CompletionRecord(player_name=f"player{i % 100}",
+                             timestamp_iso=f"2026-02-07T12:{i // 60 % 60:02d}:{i % 60:02d}+00:00",
+                             level=1 + i % 2, points=i % 17,
+                             board_flat=";".join(str((i + k) % 25 + 1) for k in range(25)))
+            for i in range(count)]
+
+
+def run(append: Callable[[CompletionRecord], None], records: List[CompletionRecord], threads: int) -> float:
+    share = [records[n::threads] for n in range(threads)]
+
+    def worker(part: List[CompletionRecord]) -> None:
+        for record in part:
+            append(record)
+
+    workers = [threading.Thread(target=worker, args=(part,)) for part in share]
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    return start
+
+
+def bench_plain(path: str, records: List[CompletionRecord], threads: int) -> float:
+    logger = CompletionLogger(path)
+    lock = threading.Lock()   # the plain logger is not thread-safe: serialize appends
+
+    def append(record: CompletionRecord) -> None:
+        with lock:
+            logger.append_record(record)
+
+    start = run(append if threads > 1 else logger.append_record, records, threads)
+    return time.perf_counter() - start
+
+
+def bench_buffered(path: str, records: List[CompletionRecord], threads: int, durability: str,
+                   batch_size: int) -> float:
+    logger = BufferedCompletionLogger(path, batch_size=batch_size, durability=durability)
+    start = run(logger.append_record, records, threads)
+    logger.close()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--threads", type=int, default=1, help="threads appending concurrently")
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args()
+
+    records = make_records(args.records)
+    with tempfile.TemporaryDirectory() as tmp:
+        results = [("CompletionLogger", bench_plain(os.path.join(tmp, "plain.csv"), records, args.threads))]
+        for durability in DURABILITY_POLICIES:
+            path = os.path.join(tmp, f"buffered_{durability}.csv")
+            seconds = bench_buffered(path, records, args.threads, durability, args.batch_size)
+            results.append((f"Buffered ({durability})", seconds))
+
+    base = args.records / results[0][1]
+    print(f"{args.records} records, {args.threads} thread(s), batch size {args.batch_size}")
+    print(f"{'logger':<20} {'seconds':>9} {'records/s':>12} {'speedup':>8}")
+    for name, seconds in results:
+        rate = args.records / seconds
+        print(f"{name:<20} {seconds:>9.3f} {rate:>12,.0f} {rate / base:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# bench_completion_rotation.py
+"""
+Append cost and archive size of RotatingCompletionLogger vs CompletionLogger.
+
+Writes --records realistic records (king-path boards from the path builder,
+iso_now-style timestamps, a pool of player names) to a fresh log with each
+logger and reports:
+
+  appends/s    single-thread append rate; the rotating run includes waiting for compression
+  hot MiB      size of the active log file when the run ends
+  archive MiB  total size of the closed segments (gzip) or the whole plain log
+  ratio        how much smaller the archive is than the same records uncompressed
+
+    python scripts/bench_completion_rotation.py --records 200000 --max-mb 4
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from completion_logger import (  # noqa: E402
+    CompletionLogger, CompletionRecord, RotatingCompletionLogger, iter_log_records, log_segments,
+)
+from path_builder import WarnsdorffPathBuilder  # noqa: E402
+
+
+def make_records(count: int, seed: int) -> List[CompletionRecord]:
+    rng = random.Random(seed)
+    builder = WarnsdorffPathBuilder(size=5, seed=seed)
+    boards = [builder.build(one_pos=rng.randrange(25)).engine.flatten_board() for _ in range(256)]
+    when = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    records = []
+    for i in range(count):
+        when += timedelta(microseconds=rng.randrange(2 * 10 ** 6))
+        records.append(CompletionRecord(f"player{rng.randrange(5000)}", when.isoformat(), 1 + i % 2,
+                                        rng.randrange(25), rng.choice(boards)))
+    return records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=100000)
+    parser.add_argument("--max-mb", type=float, default=4.0, help="segment size of the rotating logger")
+    parser.add_argument("--compresslevel", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    records = make_records(args.records, args.seed)
+    mib = 2 ** 20
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = os.path.join(tmp, "plain", "game_log.csv")
+        rotated = os.path.join(tmp, "rotated", "game_log.csv")
+        os.makedirs(os.path.dirname(plain))
+        os.makedirs(os.path.dirname(rotated))
+
+        logger = CompletionLogger(plain)
+        start = time.perf_counter()
+        for record in records:
+            logger.append_record(record)
+        plain_seconds = time.perf_counter() - start
+        plain_size = os.path.getsize(plain)
+
+        start = time.perf_counter()
+        with RotatingCompletionLogger(rotated, max_bytes=int(args.max_mb * mib),
+                                      compresslevel=args.compresslevel) as rotating:
+            for record in records:
+                rotating.append_record(record)
+            append_seconds = time.perf_counter() - start
+        rotated_seconds = time.perf_counter() - start
+        segments = log_segments(rotated)
+        hot = os.path.getsize(rotated)
+        archive = sum(os.path.getsize(s) for s in segments[:-1])
+
+        start = time.perf_counter()
+        assert sum(1 for _ in iter_log_records(rotated)) == len(records)
+        read_seconds = time.perf_counter() - start
+
+    print(f"{len(records):,} records, {len(segments) - 1} closed segments of {args.max_mb:g} MiB, "
+          f"gzip level {args.compresslevel}")
+    print(f"{'logger':<18} {'appends/s':>10} {'hot MiB':>8} {'archive MiB':>12} {'ratio':>6}")
+    print(f"{'CompletionLogger':<18} {len(records) / plain_seconds:>10,.0f} {plain_size / mib:>8.1f} "
+          f"{plain_size / mib:>12.1f} {1:>5.1f}x")
+    print(f"{'Rotating':<18} {len(records) / rotated_seconds:>10,.0f} {hot / mib:>8.1f} "
+          f"{archive / mib:>12.1f} {(plain_size - hot) / archive:>5.1f}x")
+    print(f"rotating appends alone: {len(records) / append_seconds:,.0f}/s; "
+          f"reading every record back: {len(records) / read_seconds:,.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# bench_completion_store.py
+"""
+Load rate and query latency of CompletionStore at large record counts.
+
+Builds a database of synthetic completions (players, a year of UTC timestamps,
+both levels, game-like point spreads) with CompletionStore.import_rows, then
+times the leaderboard and player queries; each query is run --repeats times and
+the median and max are reported in milliseconds. For comparison, the same
+leaderboard is answered by scanning a CSV log of --csv-records rows, which is
+what CompletionLogger users have to do today.
+
+The database is kept at --db, so later runs with the same --records skip the
+load:
+
+    python scripts/bench_completion_store.py --records 10000000 --db /tmp/completions.db
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterator, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from completion_logger import CompletionLogger, CompletionRecord  # noqa: E402
+from completion_store import CompletionStore, Row, read_csv_rows  # noqa: E402
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+SPAN_SECONDS = 365 * 24 * 3600
+
+
+def make_rows(count: int, players: int, seed: int) -> Iterator[Row]:
+    rng = random.Random(seed)
+    boards = [";".join(map(str, rng.sample(range(1, 26), 25))) for _ in range(64)]
+    step = SPAN_SECONDS / count   # timestamps increase with the row id, as in a real log
+    for i in range(count):
+        when = START + timedelta(seconds=int(i * step))
+        level = 1 + (rng.random() < 0.4)
+        points = min(int(rng.expovariate(0.4)), 24) if level == 1 else rng.randrange(0, 25)
+        yield (f"player{rng.randrange(players)}", when.isoformat(), level, points, boards[i % 64])
+
+
+def timed(query: Callable[[], list], repeats: int) -> Tuple[float, float, int]:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        rows = query()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), max(samples), len(rows)
+
+
+def csv_leaderboard(path: str, level: int, limit: int) -> List[Row]:
+    rows = [row for row in read_csv_rows(path) if row[2] == level]
+    rows.sort(key=lambda row: -row[3])
+    return rows[:limit]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=1000000)
+    parser.add_argument("--players", type=int, default=20000)
+    parser.add_argument("--db", help="database file to build or reuse (default: temporary)")
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--csv-records", type=int, default=200000, help="rows in the CSV scan comparison (0 to skip)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    db_path = args.db or os.path.join(tmp.name, "completions.db")
+    store = CompletionStore(db_path)
+    if store.count() != args.records:
+        if store.count():
+            store.close()
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(db_path + suffix):
+                    os.remove(db_path + suffix)
+            store = CompletionStore(db_path)
+        start = time.perf_counter()
+        store.import_rows(make_rows(args.records, args.players, args.seed))
+        seconds = time.perf_counter() - start
+        print(f"loaded {args.records} records in {seconds:.1f}s ({args.records / seconds:,.0f} records/s), "
+              f"{os.path.getsize(db_path) / 2 ** 20:.0f} MiB")
+    else:
+        print(f"reusing {db_path} ({args.records} records)")
+
+    last = START + timedelta(seconds=SPAN_SECONDS)
+    week = (last - timedelta(days=7)).isoformat()
+    day = (last - timedelta(days=1)).isoformat()
+    queries = [
+        ("leaderboard level 1, top 10", lambda: store.leaderboard(1, 10)),
+        ("leaderboard level 2, top 10", lambda: store.leaderboard(2, 10)),
+        ("leaderboard level 2, top 100", lambda: store.leaderboard(2, 100)),
+        ("leaderboard level 2, last week", lambda: store.leaderboard(2, 10, since=week)),
+        ("leaderboard level 1, last day", lambda: store.leaderboard(1, 10, since=day)),
+        ("player history, newest 20", lambda: store.player_history("player7", 20)),
+        ("player history, all", lambda: store.player_history("player7")),
+        ("player history, level 2 last week", lambda: store.player_history("player7", level=2, since=week)),
+        ("player best, level 1", lambda: [store.player_best("player7", 1)]),
+    ]
+    print(f"\n{'query':<36} {'median ms':>10} {'max ms':>9} {'rows':>6}")
+    for name, query in queries:
+        median, worst, rows = timed(query, args.repeats)
+        print(f"{name:<36} {median:>10.3f} {worst:>9.3f} {rows:>6}")
+    store.close()
+
+    if args.csv_records:
+        csv_path = os.path.join(tmp.name, "game_log.csv")
+        logger = CompletionLogger(csv_path)
+        with open(csv_path, "w", newline="", encoding="utf-8"):
+            pass
+        rows = list(make_rows(args.csv_records, args.players, args.seed))
+        logger.append_record(CompletionRecord(*rows[0]))
+        with open(csv_path, "a", newline="", encoding="utf-8") as f:
+            f.writelines(",".join(map(str, row)) + "\n" for row in rows[1:])
+        median, worst, _ = timed(lambda: csv_leaderboard(csv_path, 2, 10), 3)
+        print(f"\nCSV scan, leaderboard level 2 ({args.csv_records} rows): {median:.1f} ms")
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
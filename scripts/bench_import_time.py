@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# bench_import_time.py
+"""
+Cold-start import time of main.py, game_logic and gui.window, and launch to first frame.
+
+Each import target is imported in a fresh interpreter (from src/) several times,
+timed with `python -X importtime`. The median cumulative import time is checked
+against that target's budget, and the slowest modules of the median run are
+listed. main and game_logic also fail if they import pygame. gui.window is the
+import main() does before it opens the window, with pygame and the GUI modules.
+
+first_frame launches main.main() under the SDL dummy drivers and stops the
+process at its first display flip/update. It is timed as wall time from process
+start, so it also covers pygame.init, fonts and the window's first draw.
+
+The exit status is non-zero on any failure, so the script can guard startup in CI.
+
+    python scripts/bench_import_time.py --runs 9 --main-budget-ms 80 --first-frame-budget-ms 600
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# target name -> module imported in the fresh interpreter
+TARGETS = {"main": "main", "game_logic": "game_logic", "gui.window": "gui.window"}
+FORBIDDEN = ("pygame",)
+PYGAME_FREE = ("main", "game_logic")   # targets that fail when they import a FORBIDDEN module
+
+# run in src/: exit at the first frame main.main() puts on screen
+FIRST_FRAME = """
+import os, pygame
+def first_frame(*args):
+    os._exit(0)
+pygame.display.flip = pygame.display.update = first_frame
+import main
+main.main()
+"""
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """Return (module, self_us, cumulative_us, depth) rows from -X importtime output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def measure(module: str) -> Dict[str, object]:
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=SRC, env=env, capture_output=True, text=True, check=True)
+    rows = parse_importtime(proc.stderr)
+    total = next(cum for name, _, cum, depth in rows if name == module and depth == 0)
+    return {"total_us": total, "rows": rows}
+
+
+def measure_first_frame() -> float:
+    """Seconds from launching an interpreter to the first frame of main.main()."""
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1", SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", FIRST_FRAME], cwd=SRC, env=env, check=True, timeout=60)
+    return time.perf_counter() - start
+
+
+def bench_target(module: str, runs: int) -> Dict[str, object]:
+    results = sorted((measure(module) for _ in range(runs)), key=lambda r: r["total_us"])
+    median = results[len(results) // 2]
+    modules = {name for name, _, _, _ in median["rows"]}
+    return {
+        "median_ms": median["total_us"] / 1000,
+        "min_ms": results[0]["total_us"] / 1000,
+        "max_ms": results[-1]["total_us"] / 1000,
+        "forbidden": sorted({name.split(".")[0] for name in modules} & set(FORBIDDEN)),
+        "slowest": sorted(median["rows"], key=lambda row: row[1], reverse=True),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7, help="fresh interpreters per target")
+    parser.add_argument("--main-budget-ms", type=float, default=80.0)
+    parser.add_argument("--game-logic-budget-ms", type=float, default=50.0)
+    parser.add_argument("--gui-budget-ms", type=float, default=400.0, help="budget of gui.window")
+    parser.add_argument("--first-frame-budget-ms", type=float, default=600.0)
+    parser.add_argument("--top", type=int, default=8, help="slowest modules to list per target")
+    args = parser.parse_args()
+    budgets = {"main": args.main_budget_ms, "game_logic": args.game_logic_budget_ms,
+               "gui.window": args.gui_budget_ms}
+
+    failed = False
+    for target, module in TARGETS.items():
+        r = bench_target(module, args.runs)
+        if target not in PYGAME_FREE:
+            r["forbidden"] = []
+        ok = r["median_ms"] <= budgets[target] and not r["forbidden"]
+        failed |= not ok
+        print(f"{target}: median {r['median_ms']:.1f} ms (min {r['min_ms']:.1f}, max {r['max_ms']:.1f}), "
+              f"budget {budgets[target]:.0f} ms -> {'ok' if ok else 'FAIL'}")
+        if r["forbidden"]:
+            print(f"  imports {', '.join(r['forbidden'])}")
+        for name, self_us, cumulative_us, _ in r["slowest"][:args.top]:
+            print(f"  {self_us / 1000:>7.2f} ms self {cumulative_us / 1000:>8.2f} ms cumulative  {name}")
+
+    frames = sorted(measure_first_frame() * 1000 for _ in range(args.runs))
+    median = frames[len(frames) // 2]
+    ok = median <= args.first_frame_budget_ms
+    failed |= not ok
+    print(f"first_frame: median {median:.1f} ms (min {frames[0]:.1f}, max {frames[-1]:.1f}), "
+          f"budget {args.first_frame_budget_ms:.0f} ms -> {'ok' if ok else 'FAIL'}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+# bench_logic.py
+"""
+Microbenchmarks for the game logic hot paths, per game stage.
+
+Positions come from fixed seeds. Level 1 boards are played along the best-score
+path and Level 2 rings along the matching solution, then cut at an early, mid
+and late stage (numbers already placed). Every operation is run against every
+seed's position for that stage:
+
+  level 1   is_valid_move (all 25 cells), get_valid_cells, place_number, undo
+  level 2   get_valid_ring_cells, place_number, undo, reset_lv2
+
+Mutating operations time a short run of moves along the path (or the undo of
+one), with setup and restore left out of the timing. Reported per op: median
+ns over all rounds; bytes/op, the tracemalloc peak above the starting level
+(transient plus kept); and net blocks/op, memory blocks allocated minus freed
+by the ops while their results are still held (sys.getallocatedblocks; negative
+when an op frees more than it allocates, as undo does).
+
+    python scripts/bench_logic.py
+    python scripts/bench_logic.py --json --output logic_bench.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from game_logic import GameState, Level1Logic, Level1Optimizer, Level2Logic  # noqa: E402
+
+# numbers placed (after the 1) when each stage's position is taken
+STAGES = {"early": 2, "mid": 11, "late": 20}
+RUN = 3   # moves per timed place_number / undo run
+
+
+@dataclass
+class Case:
+    """One operation at one position: prepare and restore are untimed, timed returns the op results."""
+    prepare: Callable[[], None]
+    timed: Callable[[], list]
+    restore: Callable[[], None]
+
+
+@dataclass
+class Result:
+    level: int
+    op: str
+    stage: str
+    ns_per_op: float
+    bytes_per_op: float
+    net_blocks_per_op: float
+
+
+class Game:
+    """A seeded game: its Level 1 path and Level 2 solution, replayable to any stage."""
+
+    def __init__(self, seed: int) -> None:
+        state = GameState()
+        state.start_level1_with_random_one(random.Random(seed))
+        self.one = state.last_pos
+        self.path = Level1Optimizer().best_completion(state)[1]
+        level1 = Level1Logic(state)
+        for cell in self.path:
+            level1.place_number(*cell)
+        state.start_level2([row[:] for row in state.board])
+        self.ring = [cell for _, cell in Level2Logic(state).get_solution()]
+
+    def level1_at(self, placed: int) -> Tuple[GameState, Level1Logic]:
+        state = GameState()
+        state.original_one_pos = self.one
+        state.reset_level1()
+        logic = Level1Logic(state)
+        for cell in self.path[:placed]:
+            logic.place_number(*cell)
+        return state, logic
+
+    def level2_at(self, placed: int) -> Tuple[GameState, Level2Logic]:
+        state, level1 = self.level1_at(len(self.path))
+        state.start_level2([row[:] for row in state.board])
+        logic = Level2Logic(state)
+        for cell in self.ring[:placed]:
+            logic.place_number(*cell)
+        return state, logic
+
+
+def _nothing() -> None:
+    pass
+
+
+def _repeat(op: Callable[[], object], n: int) -> Callable[[], list]:
+    def timed() -> list:
+        return [op() for _ in range(n)]
+    return timed
+
+
+def level1_cases(game: Game, placed: int, n: int) -> Dict[str, Case]:
+    state, logic = game.level1_at(placed)
+    cells = [(row, col) for row in range(5) for col in range(5)] * max(1, n // 25)
+    moves = game.path[placed:placed + RUN]
+    is_valid_move, place_number, undo = logic.is_valid_move, logic.place_number, state.undo
+
+    def place_run() -> list:
+        return [place_number(row, col) for row, col in moves]
+
+    def undo_run() -> list:
+        return [undo() for _ in moves]
+
+    def place_moves() -> None:
+        for row, col in moves:
+            place_number(row, col)
+
+    def undo_moves() -> None:
+        for _ in moves:
+            undo()
+
+    return {
+        "is_valid_move": Case(_nothing, lambda: [is_valid_move(row, col) for row, col in cells], _nothing),
+        "get_valid_cells": Case(_nothing, _repeat(logic.get_valid_cells, n), _nothing),
+        "place_number": Case(_nothing, place_run, undo_moves),
+        "undo": Case(place_moves, undo_run, _nothing),
+    }
+
+
+def level2_cases(game: Game, placed: int, n: int) -> Dict[str, Case]:
+    state, logic = game.level2_at(placed)
+    moves = game.ring[placed:placed + RUN]
+    place_number, undo = logic.place_number, state.undo
+    get_valid_ring_cells = logic.get_valid_ring_cells
+
+    def place_run() -> list:
+        return [place_number(row, col) for row, col in moves]
+
+    def undo_run() -> list:
+        return [undo() for _ in moves]
+
+    def place_moves() -> None:
+        for row, col in moves:
+            place_number(row, col)
+
+    def undo_moves() -> None:
+        for _ in moves:
+            undo()
+
+    def reset() -> list:
+        return [state.reset_lv2()]
+
+    def replay() -> None:
+        for row, col in game.ring[:placed]:
+            place_number(row, col)
+
+    return {
+        "get_valid_ring_cells": Case(_nothing, _repeat(lambda: get_valid_ring_cells(state.current_num), n), _nothing),
+        "place_number": Case(_nothing, place_run, undo_moves),
+        "undo": Case(place_moves, undo_run, _nothing),
+        "reset_lv2": Case(_nothing, reset, replay),
+    }
+
+
+def time_case(case: Case, rounds: int) -> List[float]:
+    samples = []
+    perf_counter_ns = time.perf_counter_ns
+    for _ in range(rounds):
+        case.prepare()
+        start = perf_counter_ns()
+        results = case.timed()
+        samples.append((perf_counter_ns() - start) / len(results))
+        case.restore()
+    return samples
+
+
+def allocations(case: Case) -> Tuple[float, float]:
+    """(bytes/op, net blocks/op) for one timed call."""
+    case.prepare()
+    blocks_before = sys.getallocatedblocks()
+    results = case.timed()
+    blocks = (sys.getallocatedblocks() - blocks_before) / len(results)
+    del results
+    case.restore()
+
+    case.prepare()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        results = case.timed()
+        peak = tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+    per_op = peak / len(results)
+    del results
+    case.restore()
+    return per_op, blocks
+
+
+def run(seeds: List[int], rounds: int, n: int) -> List[Result]:
+    games = [Game(seed) for seed in seeds]
+    results = []
+    for level, make_cases in ((1, level1_cases), (2, level2_cases)):
+        for stage, placed in STAGES.items():
+            samples: Dict[str, List[float]] = {}
+            allocs: Dict[str, List[Tuple[float, float]]] = {}
+            for game in games:
+                for op, case in make_cases(game, placed, n).items():
+                    samples.setdefault(op, []).extend(time_case(case, rounds))
+                    allocs.setdefault(op, []).append(allocations(case))
+            for op in samples:
+                results.append(Result(
+                    level=level, op=op, stage=stage,
+                    ns_per_op=statistics.median(samples[op]),
+                    bytes_per_op=statistics.mean(a[0] for a in allocs[op]),
+                    net_blocks_per_op=statistics.mean(a[1] for a in allocs[op]),
+                ))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0, 1, 2, 3, 4])
+    parser.add_argument("--rounds", type=int, default=200, help="timed rounds per op, position and seed")
+    parser.add_argument("--ops", type=int, default=100, help="calls per round for read-only ops")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    args = parser.parse_args()
+
+    results = run(args.seeds, args.rounds, args.ops)
+    report = {
+        "python": platform.python_version(),
+        "seeds": args.seeds,
+        "rounds": args.rounds,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": [asdict(r) for r in results],
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"{'lvl':>3} {'op':<22} {'stage':<6} {'ns/op':>9} {'bytes/op':>9} {'net blocks/op':>14}")
+    for r in results:
+        print(f"{r.level:>3} {r.op:<22} {r.stage:<6} {r.ns_per_op:>9.0f} {r.bytes_per_op:>9.1f} {r.net_blocks_per_op:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# bench_path_builder.py
+"""
+Success rate and build time of WarnsdorffPathBuilder per board size.
+
+    python scripts/bench_path_builder.py --sizes 5 20 100 500 --boards 20
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from path_builder import WarnsdorffPathBuilder  # noqa: E402
+
+
+def bench_size(size: int, boards: int, seed: int, max_attempts: int) -> dict:
+    builder = WarnsdorffPathBuilder(size=size, max_attempts=max_attempts, seed=seed)
+    successes = 0
+    first_try = 0
+    times = []
+    for _ in range(boards):
+        start = time.perf_counter()
+        result = builder.build()
+        times.append(time.perf_counter() - start)
+        if result.success:
+            successes += 1
+            if result.attempts == 1:
+                first_try += 1
+    times.sort()
+    return {
+        "size": size,
+        "boards": boards,
+        "success_rate": successes / boards,
+        "first_try_rate": first_try / boards,
+        "median_s": times[len(times) // 2],
+        "max_s": times[-1],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 10, 20, 50, 100, 200, 500])
+    parser.add_argument("--boards", type=int, default=10, help="random starts per size")
+    parser.add_argument("--attempts", type=int, default=4, help="max attempts per board")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'N':>5} {'boards':>6} {'success':>8} {'1st try':>8} {'median s':>9} {'max s':>8}")
+    for size in args.sizes:
+        r = bench_size(size, args.boards, args.seed, args.attempts)
+        print(f"{r['size']:>5} {r['boards']:>6} {r['success_rate']:>8.1%} {r['first_try_rate']:>8.1%} "
+              f"{r['median_s']:>9.4f} {r['max_s']:>8.4f}")
+
+
+if __name__ == "__main__":
+    main()
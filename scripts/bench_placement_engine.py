@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# bench_placement_engine.py
+"""
+Scaling benchmark for SequentialPlacementEngine.
+
+For each board size N it plays a full Level 1 game (a snake path with the
+adjacency rule on), then validates every ring cell for a sample of Level 2
+numbers, and reports moves/second, checks/second, peak memory and the memory
+retained per move in steady state.
+
+    python scripts/bench_placement_engine.py --sizes 5 50 200 1000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from sequential_placement_engine import SequentialPlacementEngine  # noqa: E402
+
+
+def snake_order(size: int):
+    for row in range(size):
+        cols = range(size) if row % 2 == 0 else range(size - 1, -1, -1)
+        for col in cols:
+            yield row * size + col
+
+
+def play_level1(size: int, order) -> SequentialPlacementEngine:
+    engine = SequentialPlacementEngine(size=size, enforce_adjacency=True)
+    engine.start_new_level1(one_pos=0)
+    place = engine.try_place_on_cell
+    for idx in order:
+        place(idx)
+    assert engine.is_complete()
+    return engine
+
+
+def measure_memory(size: int, order) -> tuple:
+    """Return (board bytes, peak bytes, retained bytes per move in the second half)."""
+    tracemalloc.start()
+    engine = SequentialPlacementEngine(size=size, enforce_adjacency=True)
+    engine.start_new_level1(one_pos=0)
+    board_bytes = tracemalloc.get_traced_memory()[0]
+
+    half = len(order) // 2
+    place = engine.try_place_on_cell
+    for i in range(half):
+        place(order[i])
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(half, len(order)):
+        place(order[i])
+    after = tracemalloc.get_traced_memory()[0]
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    second_half = len(order) - half
+    return board_bytes, peak, (after - before) / second_half if second_half else 0.0
+
+
+def bench_size(size: int) -> dict:
+    order = list(snake_order(size))[1:]
+
+    start = time.perf_counter()
+    engine = play_level1(size, order)
+    elapsed = time.perf_counter() - start
+
+    # Level 2: validate every ring cell for a sample of numbers
+    engine.start_level2()
+    ring_cells = [engine.ring_position(i) for i in range(engine.ring_size())]
+    sample = range(2, min(engine.last_ring_number(), 2 + 200) + 1)
+    check = engine.check_ring_cell
+    checks = 0
+    start = time.perf_counter()
+    for num in sample:
+        engine.next_number = num
+        for ring_row, ring_col in ring_cells:
+            check(ring_row, ring_col)
+        checks += len(ring_cells)
+    elapsed2 = time.perf_counter() - start
+
+    board_bytes, peak, per_move = measure_memory(size, order)
+    return {
+        "size": size,
+        "moves": len(order),
+        "moves_per_sec": len(order) / elapsed if elapsed else float("inf"),
+        "ring_checks_per_sec": checks / elapsed2 if elapsed2 else float("inf"),
+        "board_bytes": board_bytes,
+        "peak_bytes": peak,
+        "retained_bytes_per_move": per_move,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 10, 50, 100, 500, 1000])
+    args = parser.parse_args()
+
+    print(f"{'N':>6} {'moves':>10} {'moves/s':>12} {'ring chk/s':>12} "
+          f"{'board MB':>9} {'peak MB':>8} {'B/move':>7}")
+    for size in args.sizes:
+        r = bench_size(size)
+        print(f"{r['size']:>6} {r['moves']:>10} {r['moves_per_sec']:>12,.0f} "
+              f"{r['ring_checks_per_sec']:>12,.0f} {r['board_bytes'] / 1e6:>9.2f} "
+              f"{r['peak_bytes'] / 1e6:>8.2f} {r['retained_bytes_per_move']:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+#!/usr/bin/env python
+# bench_render.py
+"""
+Headless rendering benchmark for GameWindow, full vs dirty redraw.
+
+Runs offscreen with the SDL dummy video and audio drivers. Two kinds of scene
+are measured:
+
+  play                   a scripted game: Level 1 along a fixed best-score path,
+                         then Level 2 along the matching solution, with hover
+                         moves, an undo and messages; one frame per step
+  level1, level2, win    steady state: a board in progress (or the win screen)
+                         redrawn with nothing changing
+
+For each scene and mode it reports frames/second, how far traced memory peaks
+above its pre-frame level and how many frames allocated at all (separate
+tracemalloc pass) and, with --calls, per-call costs of the window phases and
+BoardRenderer draw calls (separate FrameProfiler pass).
+
+The regression gate does not use absolute times, which differ from machine to
+machine. Each of --rounds rounds first times a fixed reference frame (a 5x5 grid
+of rects and rendered numbers drawn with plain pygame, no game code), then every
+scene. A scene's cost is its frame time divided by the reference frame time of
+the same round, and the median over the rounds is compared with the stored
+baseline ratio. A scene fails when ratio > baseline * (1 + tolerance) + slack
+(slack in us, converted with the reference time).
+
+    python scripts/bench_render.py
+    python scripts/bench_render.py --scenes play --repeats 50 --calls
+    python scripts/bench_render.py --update-baseline
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame  # noqa: E402
+
+from game_logic import GameState, Level1Logic, Level1Optimizer, Level2Logic  # noqa: E402
+from gui.profiler import FrameProfiler  # noqa: E402
+from gui.window import GameWindow  # noqa: E402
+
+SCENES = ("play", "level1", "level2", "win")
+MODES = ("full", "dirty")
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_render_baseline.json")
+NEVER = 2 ** 40   # message timer that does not expire during a run
+
+Step = Tuple[str, object]
+
+
+@dataclass
+class Script:
+    """Steps of a scripted game, one frame each, worked out before anything is timed."""
+    steps: List[Step] = field(default_factory=list)
+    level2_start: int = 0   # index of the first Level 2 step
+
+
+def make_script(seed: int) -> Script:
+    rng = random.Random(seed)
+    state = GameState()
+    level1 = Level1Logic(state)
+    state.start_level1_with_random_one(rng)
+    one = state.last_pos
+    path = Level1Optimizer().best_completion(state)[1]
+    for row, col in path:
+        level1.place_number(row, col)
+    state.start_level2([row[:] for row in state.board])
+    ring_cells = [cell for _, cell in Level2Logic(state).get_solution()]
+
+    script = Script()
+    steps = script.steps
+    steps.append(("start", one))
+    for i, cell in enumerate(path):
+        steps.append(("hover", (rng.randrange(5), rng.randrange(5))))
+        steps.append(("place", cell))
+        if i == 5:
+            steps += [("undo", None), ("place", cell)]
+        if i == 8:
+            steps.append(("message", "Cell is already occupied!"))
+        if i == 12:
+            steps.append(("message", ""))
+    script.level2_start = len(steps)
+    steps.append(("message", ""))   # the previous frame's _update moved to level 2 and showed a message
+    for i, cell in enumerate(ring_cells):
+        steps.append(("hover", (rng.randrange(7), rng.randrange(7))))
+        steps.append(("place", cell))
+        if i == 4:
+            steps += [("undo", None), ("place", cell)]
+    steps.append(("hover", (0, 0)))   # win screen
+    return script
+
+
+def apply_step(window: GameWindow, step: Step) -> None:
+    kind, arg = step
+    state = window.game_state
+    if kind == "start":
+        state.original_one_pos = arg
+        state.reset_level1()
+    elif kind == "hover":
+        window.hover_cell = arg
+    elif kind == "place":
+        logic = window.level1_logic if state.level == 1 else window.level2_logic
+        logic.place_number(*arg)
+    elif kind == "undo":
+        state.undo()
+    elif kind == "message":
+        window.message = arg
+        window.message_timer = NEVER
+
+
+def make_window(dirty: bool, profiler: Optional[FrameProfiler] = None) -> GameWindow:
+    state = GameState()
+    window = GameWindow(dirty_rendering=dirty, profiler=profiler)
+    window.set_game_components(state, Level1Logic(state), Level2Logic(state))
+    return window
+
+
+def frame(window: GameWindow) -> None:
+    window._update()
+    window._draw()
+
+
+def play(window: GameWindow, steps: List[Step]) -> None:
+    for step in steps:
+        apply_step(window, step)
+        frame(window)
+
+
+def prepare(window: GameWindow, scene: str, script: Script) -> None:
+    """Bring the window to the scene's starting point and draw its first frame (builds caches)."""
+    if scene == "play":
+        play(window, script.steps)   # one warm-up game
+        return
+    stop = {"level1": script.level2_start // 2,
+            "level2": (script.level2_start + len(script.steps)) // 2,
+            "win": len(script.steps)}[scene]
+    play(window, script.steps[:stop])
+    window.message = ""
+    window.hover_cell = (0, 0)
+    frame(window)
+
+
+def frame_steps(scene: str, script: Script, frames: int, repeats: int) -> List[Optional[Step]]:
+    """What to apply before each measured frame (None: redraw unchanged)."""
+    if scene == "play":
+        return script.steps * repeats
+    return [None] * frames
+
+
+def time_scene(scene: str, dirty: bool, script: Script, frames: int, repeats: int) -> float:
+    window = make_window(dirty)
+    prepare(window, scene, script)
+    steps = frame_steps(scene, script, frames, repeats)
+    start = time.perf_counter()
+    for step in steps:
+        if step is not None:
+            apply_step(window, step)
+        frame(window)
+    return (time.perf_counter() - start) / len(steps)
+
+
+def reference_frame(surface: pygame.Surface, font: pygame.font.Font) -> None:
+    """A fixed full redraw that uses no game code: fill, 25 cells, 25 rendered numbers."""
+    surface.fill((30, 30, 30))
+    for i in range(25):
+        rect = pygame.Rect(50 + i % 5 * 100, 150 + i // 5 * 100, 96, 96)
+        pygame.draw.rect(surface, (200, 200, 200), rect)
+        pygame.draw.rect(surface, (0, 0, 0), rect, 2)
+        surface.blit(font.render(str(i + 1), True, (0, 0, 0)), rect.move(30, 30))
+
+
+def time_reference(frames: int) -> float:
+    pygame.font.init()
+    surface = pygame.Surface((600, 720))
+    font = pygame.font.Font(None, 36)
+    reference_frame(surface, font)   # warm-up
+    start = time.perf_counter()
+    for _ in range(frames):
+        reference_frame(surface, font)
+    return (time.perf_counter() - start) / frames
+
+
+def measure_times(pairs: List[Tuple[str, str]], args: argparse.Namespace,
+                  script: Script) -> Tuple[float, Dict[str, Tuple[float, float]]]:
+    """
+    Median reference frame time, and per scene/mode the median frame time and the
+    median ratio to the reference frame timed in the same round (seconds).
+    """
+    references = []
+    samples: Dict[str, List[Tuple[float, float]]] = {f"{scene}/{mode}": [] for scene, mode in pairs}
+    for _ in range(args.rounds):
+        reference = time_reference(args.reference_frames)
+        references.append(reference)
+        for scene, mode in pairs:
+            seconds = time_scene(scene, mode == "dirty", script, args.frames, args.repeats)
+            samples[f"{scene}/{mode}"].append((seconds, seconds / reference))
+    return statistics.median(references), {
+        key: (statistics.median(s for s, _ in runs), statistics.median(r for _, r in runs))
+        for key, runs in samples.items()}
+
+
+def _traced_bytes() -> int:
+    # traced memory, leaving out the counters kept here and tracemalloc's own bookkeeping
+    snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, __file__),
+                                                          tracemalloc.Filter(False, tracemalloc.__file__)])
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+def count_allocations(scene: str, dirty: bool, script: Script, frames: int) -> dict:
+    window = make_window(dirty)
+    prepare(window, scene, script)
+    steps = frame_steps(scene, script, frames, 1)
+    tracemalloc.start()
+    try:
+        start_bytes = _traced_bytes()
+        allocating = 0
+        peak_total = 0
+        for step in steps:
+            if step is not None:
+                apply_step(window, step)
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            frame(window)
+            peak = tracemalloc.get_traced_memory()[1] - before
+            if peak:
+                allocating += 1
+                peak_total += peak
+        retained = _traced_bytes() - start_bytes
+    finally:
+        tracemalloc.stop()
+    return {
+        "peak_bytes_per_frame": peak_total / len(steps),
+        "allocating_frames": allocating,
+        "frames": len(steps),
+        "retained_bytes": retained,
+    }
+
+
+def profile_calls(scene: str, dirty: bool, script: Script, frames: int, repeats: int) -> Dict[str, dict]:
+    profiler = FrameProfiler(size=1 << 16)
+    window = make_window(dirty, profiler)
+    prepare(window, scene, script)
+    profiler.reset()   # drop the warm-up samples
+    for step in frame_steps(scene, script, frames, repeats):
+        if step is not None:
+            apply_step(window, step)
+        start = time.perf_counter()
+        frame(window)
+        profiler.record("frame", time.perf_counter() - start)
+    profiler.detach()
+    return profiler.summary()
+
+
+def bench(scene: str, mode: str, args: argparse.Namespace, script: Script, seconds: float, ratio: float) -> dict:
+    dirty = mode == "dirty"
+    result = {"scene": scene, "mode": mode, "us_per_frame": seconds * 1e6, "fps": 1 / seconds,
+              "reference_ratio": ratio}
+    result.update(count_allocations(scene, dirty, script, args.frames))
+    if args.calls:
+        result["calls"] = profile_calls(scene, dirty, script, args.frames, args.repeats)
+    return result
+
+
+def compare(results: List[dict], baseline: Dict[str, float], reference_us: float, tolerance: float,
+            slack_us: float) -> List[str]:
+    """Print each frame/reference ratio against the baseline; return the scene/mode keys that regressed."""
+    regressions = []
+    slack = slack_us / reference_us
+    print(f"\nvs baseline, in reference frames of {reference_us:.1f} us (tolerance +{tolerance:.0%} + {slack_us:g} us):")
+    for r in results:
+        key = f"{r['scene']}/{r['mode']}"
+        base = baseline.get(key)
+        if base is None:
+            print(f"  {key:<13} no baseline")
+            continue
+        ratio = r["reference_ratio"]
+        change = ratio / base - 1
+        # the absolute slack keeps sub-microsecond idle frames from failing on timer noise
+        regressed = ratio > base * (1 + tolerance) + slack
+        if regressed:
+            regressions.append(key)
+        print(f"  {key:<13} {base:>9.4g} -> {ratio:>9.4g} ({change:+.1%})"
+              f"{'  REGRESSION' if regressed else ''}")
+    return regressions
+
+
+def print_results(results: List[dict]) -> None:
+    print(f"{'scene':<7} {'mode':<6} {'frames/s':>10} {'us/frame':>10} {'peak B/frame':>13} "
+          f"{'alloc frames':>13} {'retained B':>11}")
+    for r in results:
+        allocating = f"{r['allocating_frames']}/{r['frames']}"
+        print(f"{r['scene']:<7} {r['mode']:<6} {r['fps']:>10.0f} {r['us_per_frame']:>10.1f} "
+              f"{r['peak_bytes_per_frame']:>13.1f} {allocating:>13} {r['retained_bytes']:>11}")
+    for r in results:
+        if "calls" not in r:
+            continue
+        print(f"\n{r['scene']}/{r['mode']} per-call costs:")
+        print(f"  {'phase':<32} {'calls':>8} {'mean us':>9} {'p50 us':>9} {'p95 us':>9} {'max us':>9}")
+        for phase, s in sorted(r["calls"].items(), key=lambda item: -item[1]["mean_ms"] * item[1]["count"]):
+            print(f"  {phase:<32} {s['count']:>8} {s['mean_ms'] * 1000:>9.1f} {s['p50_ms'] * 1000:>9.1f} "
+                  f"{s['p95_ms'] * 1000:>9.1f} {s['max_ms'] * 1000:>9.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scenes", nargs="+", choices=SCENES, default=list(SCENES))
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--frames", type=int, default=300, help="frames per steady-state scene and round")
+    parser.add_argument("--repeats", type=int, default=3, help="scripted games per play measurement and round")
+    parser.add_argument("--rounds", type=int, default=5, help="timing rounds; medians are reported")
+    parser.add_argument("--reference-frames", type=int, default=200, help="reference frames per round")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--calls", action="store_true", help="also report per-call costs")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="baseline JSON (scene/mode -> frame time / reference frame time)")
+    parser.add_argument("--update-baseline", action="store_true", help="store this run's ratios as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown vs the baseline")
+    parser.add_argument("--slack-us", type=float, default=2.0, help="allowed absolute slowdown per frame")
+    parser.add_argument("--json", action="store_true", help="print the full result as JSON")
+    args = parser.parse_args()
+
+    script = make_script(args.seed)
+    pairs = [(scene, mode) for scene in args.scenes for mode in args.modes]
+    reference_us, times = measure_times(pairs, args, script)
+    reference_us *= 1e6
+    results = [bench(scene, mode, args, script, *times[f"{scene}/{mode}"]) for scene, mode in pairs]
+    pygame.quit()
+    if args.json:
+        print(json.dumps({"reference_us": reference_us, "results": results}, indent=2))
+    else:
+        print(f"reference frame: {reference_us:.1f} us (median of {args.rounds} rounds)\n")
+        print_results(results)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    if args.update_baseline:
+        baseline.update({f"{r['scene']}/{r['mode']}": float(f"{r['reference_ratio']:.4g}") for r in results})
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nbaseline written to {args.baseline}")
+    elif baseline and compare(results, baseline, reference_us, args.tolerance, args.slack_us):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
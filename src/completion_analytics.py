@@ -0,0 +1,323 @@
+# completion_analytics.py
+"""
+Streaming analytics over the completion log (game_log.csv).
+
+The log is read in fixed-size byte chunks, so memory use stays flat however big
+it grows, and each chunk is parsed with NumPy straight from the bytes: every
+line is split at its last four commas (a quoted player name may contain
+commas), and all boards of the chunk become one (rows, 25) array. Reported per
+level:
+
+  points          distribution of points
+  start cells     where the 1 was, as a 5x5 grid
+  diagonal moves  share of diagonal moves, overall and per move (1->2 ... 24->25)
+
+and over all records, completions per hour of day and per day, as written in
+the timestamps (UTC for iso_now). Start cells and diagonal moves cover boards
+that are king paths, as every completed board is. With --workers the file is
+split into byte segments (each line belongs to the segment its first byte is
+in) that are analysed by a process pool and merged.
+
+    python src/completion_analytics.py game_log.csv --workers 4 --json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+BOARD_SIZE = 5
+CELLS = BOARD_SIZE * BOARD_SIZE
+HEADER_PREFIX = b"player_name,"
+CHUNK_BYTES = 1 << 20   # larger chunks run slower: the per-chunk arrays fall out of cache
+SEGMENT_BYTES = 64 << 20
+
+NL, CR, COMMA, SEMI, ZERO = (ord(c) for c in "\n\r,;0")
+
+# offsets of the digits of YYYY-MM-DDTHH in a timestamp, and their weights in (year, month, day, hour)
+TIME_DIGITS = np.array([0, 1, 2, 3, 5, 6, 8, 9, 11, 12])
+TIME_WEIGHTS = np.zeros((10, 4), dtype=np.int64)
+for _i, (_field, _weight) in enumerate([(0, 1000), (0, 100), (0, 10), (0, 1), (1, 10), (1, 1),
+                                        (2, 10), (2, 1), (3, 10), (3, 1)]):
+    TIME_WEIGHTS[_i, _field] = _weight
+
+# MOVE_KIND[a * 25 + b]: kind of the step from cell a to cell b
+NO_MOVE, STRAIGHT, DIAGONAL = 0, 1, 2
+MOVE_KIND = np.zeros(CELLS * CELLS, dtype=np.int8)
+for _a in range(CELLS):
+    for _b in range(CELLS):
+        _d_row, _d_col = abs(_a // BOARD_SIZE - _b // BOARD_SIZE), abs(_a % BOARD_SIZE - _b % BOARD_SIZE)
+        if max(_d_row, _d_col) == 1:
+            MOVE_KIND[_a * CELLS + _b] = DIAGONAL if _d_row == _d_col else STRAIGHT
+
+
+def _add(counts: Dict[int, np.ndarray], key: int, values: np.ndarray) -> None:
+    old = counts.get(key)
+    if old is None:
+        counts[key] = values.copy()
+    elif len(old) >= len(values):
+        old[:len(values)] += values
+    else:
+        values = values.copy()
+        values[:len(old)] += old
+        counts[key] = values
+
+
+@dataclass
+class LogStats:
+    rows: int = 0
+    skipped: int = 0      # lines that are not completion records
+    untimed: int = 0      # records whose timestamp could not be read
+    # per level: count per points value, king-path boards, start cells (25), diagonal moves per move (24)
+    points: Dict[int, np.ndarray] = field(default_factory=dict)
+    paths: Counter = field(default_factory=Counter)
+    start_cells: Dict[int, np.ndarray] = field(default_factory=dict)
+    diagonal_moves: Dict[int, np.ndarray] = field(default_factory=dict)
+    hours: np.ndarray = field(default_factory=lambda: np.zeros(24, dtype=np.int64))
+    days: Counter = field(default_factory=Counter)   # days since 1970-01-01 -> completions
+
+    def merge(self, other: "LogStats") -> None:
+        self.rows += other.rows
+        self.skipped += other.skipped
+        self.untimed += other.untimed
+        for mine, theirs in ((self.points, other.points), (self.start_cells, other.start_cells),
+                             (self.diagonal_moves, other.diagonal_moves)):
+            for level, values in theirs.items():
+                _add(mine, level, values)
+        self.paths.update(other.paths)
+        self.hours += other.hours
+        self.days.update(other.days)
+
+    def to_dict(self) -> Dict[str, object]:
+        levels = {}
+        for level in sorted(self.points):
+            points = self.points[level]
+            records = int(points.sum())
+            paths = self.paths[level]
+            diagonal = self.diagonal_moves.get(level, np.zeros(CELLS - 1, dtype=np.int64))
+            levels[str(level)] = {
+                "records": records,
+                "mean_points": float(points @ np.arange(len(points)) / records) if records else 0.0,
+                "points": {str(p): int(c) for p, c in enumerate(points) if c},
+                "king_path_boards": paths,
+                "start_cells": (self.start_cells[level].reshape(BOARD_SIZE, BOARD_SIZE).tolist()
+                                if level in self.start_cells else []),
+                "diagonal_move_rate": float(diagonal.sum() / (paths * (CELLS - 1))) if paths else 0.0,
+                "diagonal_rate_by_move": (diagonal / paths).round(4).tolist() if paths else [],
+            }
+        return {
+            "records": self.rows,
+            "skipped_lines": self.skipped,
+            "records_without_time": self.untimed,
+            "levels": levels,
+            "completions_by_hour": self.hours.tolist(),
+            "completions_by_day": {str(np.datetime64(day, "D")): count for day, count in sorted(self.days.items())},
+        }
+
+
+def iter_chunks(path: str, start: int = 0, end: Optional[int] = None,
+                chunk_bytes: int = CHUNK_BYTES) -> Iterator[bytes]:
+    """Whole lines of the file whose first byte is in [start, end), about chunk_bytes at a time."""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        end = size if end is None else min(end, size)
+        if start:
+            f.seek(start - 1)
+            f.readline()   # the line running into start belongs to the previous segment
+        buf_start = f.tell()
+        tail = b""
+        while True:
+            limit = end - buf_start   # lines must start before this index of buf
+            if limit <= 0:
+                return
+            block = f.read(chunk_bytes)
+            buf = tail + block
+            if not block:
+                if buf:
+                    yield buf if buf.endswith(b"\n") else buf + b"\n"
+                return
+            cut = buf.rfind(b"\n") + 1
+            if cut >= limit:
+                yield buf[:buf.find(b"\n", limit - 1) + 1]
+                return
+            if cut:
+                yield buf[:cut]
+            tail = buf[cut:]
+            buf_start += cut
+
+
+def _small_ints(digits: np.ndarray, begin: np.ndarray, end: np.ndarray, ok: np.ndarray,
+                max_digits: int = 3) -> np.ndarray:
+    """Decimal values of digits[begin:end] per row; rows that are not 1..max_digits digits are cleared in ok."""
+    length = end - begin
+    ok &= (length >= 1) & (length <= max_digits)
+    value = np.zeros(len(begin), dtype=np.int64)
+    last = len(digits) - 1
+    for i in range(max_digits):
+        inside = i < length
+        digit = digits[np.minimum(begin + i, last)]
+        ok &= ~inside | (digit <= 9)
+        value = np.where(inside, value * 10 + digit, value)
+    return value
+
+
+def _days_from_civil(year: np.ndarray, month: np.ndarray, day: np.ndarray) -> np.ndarray:
+    # days since 1970-01-01 of a proleptic Gregorian date
+    year = year - (month <= 2)
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def _add_times(stats: LogStats, digits: np.ndarray, begin: np.ndarray, end: np.ndarray) -> None:
+    # YYYY-MM-DDTHH at the start of each timestamp: one gather of the ten digits, weighted into fields
+    ok = end - begin >= 13
+    found = digits[np.minimum(begin[:, None] + TIME_DIGITS, len(digits) - 1)]
+    ok &= (found <= 9).all(axis=1)
+    year, month, day, hour = (found[ok].astype(np.int64) @ TIME_WEIGHTS).T
+    valid = (month >= 1) & (month <= 12) & (day >= 1) & (day <= 31) & (hour <= 23)
+    stats.untimed += len(begin) - int(np.count_nonzero(valid))
+    stats.hours += np.bincount(hour[valid], minlength=24)
+    days, counts = np.unique(_days_from_civil(year[valid], month[valid], day[valid]), return_counts=True)
+    stats.days.update(dict(zip(days.tolist(), counts.tolist())))
+
+
+def _parse_boards(data: np.ndarray, digits: np.ndarray, begin: np.ndarray, end: np.ndarray,
+                  ok: np.ndarray) -> np.ndarray:
+    """(rows, 25) numbers of the ';'-joined boards in data[begin:end]; malformed boards are cleared in ok."""
+    semis = np.flatnonzero(data == SEMI)
+    if len(semis) < CELLS - 1:
+        ok[:] = False
+        return np.zeros((len(begin), CELLS), dtype=np.uint8)
+    first = np.searchsorted(semis, begin)
+    ok &= np.searchsorted(semis, end) - first == CELLS - 1
+    if len(semis) == len(begin) * (CELLS - 1) and ok.all():
+        seps = semis.reshape(-1, CELLS - 1)   # the usual case: every ';' is in a well-formed board
+    else:
+        seps = semis[np.minimum(np.where(ok, first, 0)[:, None] + np.arange(CELLS - 1), len(semis) - 1)]
+    # each number ends just before a ';' (or the end of the line); the field starts after a ',',
+    # so a digit two places before the end means two digits, and one three places before means too many
+    ends = np.concatenate([seps, end[:, None]], axis=1)
+    ones = digits[ends - 1]
+    tens = digits[ends - 2]
+    two = tens <= 9
+    ok &= ((ones <= 9) & ~(two & (digits[ends - 3] <= 9))).all(axis=1)
+    return np.where(two, tens, 0) * 10 + ones
+
+
+def _add_boards(stats: LogStats, level: int, boards: np.ndarray) -> None:
+    # pos[:, n]: cell of number n (columns 0 and 26 catch numbers outside 1..25); 25 cells hold all
+    # of 1..25 only if the board is a permutation
+    pos = np.full((len(boards), CELLS + 2), -1, dtype=np.int32)
+    pos[np.arange(len(boards))[:, None], np.minimum(boards, CELLS + 1)] = np.arange(CELLS, dtype=np.int32)
+    pos = pos[:, 1:-1]
+    pos = pos[(pos >= 0).all(axis=1)]
+    kind = MOVE_KIND[pos[:, :-1] * CELLS + pos[:, 1:]]
+    king = (kind != NO_MOVE).all(axis=1)
+    stats.paths[level] += int(np.count_nonzero(king))
+    _add(stats.start_cells, level, np.bincount(pos[king, 0], minlength=CELLS))
+    _add(stats.diagonal_moves, level, (kind[king] == DIAGONAL).sum(axis=0))
+
+
+def analyze_chunk(chunk: bytes, stats: LogStats) -> None:
+    """Add the completion records of a chunk of whole lines to stats."""
+    data = np.frombuffer(chunk, dtype=np.uint8)
+    digits = data - np.uint8(ZERO)   # wraps: anything above 9 is not a digit
+    newlines = np.flatnonzero(data == NL)
+    if not len(newlines):
+        return
+    commas = np.flatnonzero(data == COMMA)
+    if len(commas) < 4:
+        stats.skipped += len(newlines)
+        return
+    line_start = np.concatenate([[0], newlines[:-1] + 1])
+    line_end = newlines - (data[newlines - 1] == CR)
+    # player_name may hold commas; the last four commas of a line start the other fields
+    last = np.searchsorted(commas, line_end)
+    ok = last >= 4
+    c1, c2, c3, c4 = (commas[np.where(ok, last, 4) - k] for k in (4, 3, 2, 1))
+    ok &= c1 >= line_start
+    level = _small_ints(digits, c2 + 1, c3, ok)
+    points = _small_ints(digits, c3 + 1, c4, ok)
+    board_ok = ok.copy()
+    boards = _parse_boards(data, digits, c4 + 1, line_end, board_ok)
+
+    stats.skipped += int(np.count_nonzero(~ok))
+    stats.rows += int(np.count_nonzero(ok))
+    _add_times(stats, digits, c1[ok] + 1, c2[ok])
+    level, points, boards, board_ok = level[ok], points[ok], boards[ok], board_ok[ok]
+    for lvl in np.unique(level).tolist():
+        mask = level == lvl
+        _add(stats.points, lvl, np.bincount(points[mask]))
+        _add_boards(stats, lvl, boards[mask & board_ok])
+
+
+def analyze_segment(task: Tuple[str, int, Optional[int], int]) -> LogStats:
+    """Worker entry point: analyse the lines starting in [start, end) of the log."""
+    path, start, end, chunk_bytes = task
+    stats = LogStats()
+    for i, chunk in enumerate(iter_chunks(path, start, end, chunk_bytes)):
+        if i == 0 and start == 0 and chunk.startswith(HEADER_PREFIX):
+            chunk = chunk[chunk.find(b"\n") + 1:]
+        analyze_chunk(chunk, stats)
+    return stats
+
+
+def make_tasks(path: str, segment_bytes: int, chunk_bytes: int) -> List[Tuple[str, int, Optional[int], int]]:
+    size = os.path.getsize(path)
+    return [(path, begin, begin + segment_bytes, chunk_bytes) for begin in range(0, max(size, 1), segment_bytes)]
+
+
+def analyze(path: str, workers: int = 1, chunk_bytes: int = CHUNK_BYTES,
+            segment_bytes: int = SEGMENT_BYTES) -> LogStats:
+    if workers <= 1:
+        return analyze_segment((path, 0, None, chunk_bytes))
+    total = LogStats()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for stats in pool.map(analyze_segment, make_tasks(path, segment_bytes, chunk_bytes)):
+            total.merge(stats)
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Streaming analytics over the completion log")
+    parser.add_argument("path", nargs="?", default="game_log.csv")
+    parser.add_argument("--workers", type=int, default=1, help="processes (1: stream in this process)")
+    parser.add_argument("--chunk-mb", type=float, default=CHUNK_BYTES / 2 ** 20, help="bytes parsed at a time")
+    parser.add_argument("--segment-mb", type=float, default=SEGMENT_BYTES / 2 ** 20, help="bytes per worker task")
+    parser.add_argument("--json", action="store_true", help="print the full result as JSON")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats = analyze(args.path, args.workers, int(args.chunk_mb * 2 ** 20), int(args.segment_mb * 2 ** 20))
+    elapsed = time.perf_counter() - start
+    size = os.path.getsize(args.path)
+
+    result = stats.to_dict()
+    result.update({"workers": args.workers, "seconds": elapsed, "mb_per_sec": size / 2 ** 20 / elapsed})
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    print(f"{args.path}: {stats.rows:,} records, {stats.skipped} skipped lines, "
+          f"{size / 2 ** 20:,.0f} MiB in {elapsed:.2f}s ({result['mb_per_sec']:,.0f} MiB/s)")
+    for level, s in result["levels"].items():
+        print(f"  level {level}: {s['records']:,} records, mean points {s['mean_points']:.2f}, "
+              f"diagonal moves {s['diagonal_move_rate']:.1%} of {s['king_path_boards']:,} king-path boards")
+        for row in s["start_cells"]:
+            print("    start " + " ".join(f"{c:>9,}" for c in row))
+    busiest = int(np.argmax(stats.hours))
+    print(f"  busiest hour: {busiest:02d}:00 ({stats.hours[busiest]:,}), "
+          f"days: {len(stats.days)}, records without time: {stats.untimed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,434 @@
+# completion_codec.py
+"""
+Compact binary format for completion logs.
+
+A CSV row of the completion log is about 110 bytes, 65 of them the board. A
+completed Level 1 board is a king-move path through the 25 cells, so it is
+stored as the cell of the 1 plus 24 direction codes of 3 bits (77 bits, 10
+bytes). Timestamps are stored as integer microseconds since the Unix epoch and
+player names are interned in a string table, which gives fixed 22-byte records,
+about 5x smaller than the CSV.
+
+File layout (little-endian):
+
+  header   24 bytes   magic b"MGCL", version u16, record size u16,
+                      record count u64, string table offset u64 (0 while a writer has it open)
+  records  22 bytes each, from offset 24
+    0..6    time: microseconds since 1970-01-01 UTC (u56)
+    7       level (bits 0..6); bit 7 set: time holds a string index instead
+    8..10   player: string index (u24)
+    11      points (u8)
+    12..21  board: path code (u80); bit 79 set: low bits hold a string index instead
+  strings  count u32, then per string: length u16 + UTF-8 bytes
+
+Anything that does not round-trip through the compact fields (a board that is
+not a king path, a timestamp that is not a UTC isoformat() string) is kept
+verbatim in the string table, so decoding always gives back the original record.
+The records are a flat array at a fixed offset, so a reader can mmap the file
+and scan fields without decoding boards.
+
+The string table and record count are written when the writer closes. Until
+then, every new string also goes to a journal next to the log
+(game_log.bin.strings), flushed before the first record that uses it. A log
+left open by a crash is rebuilt from its size and the journal by
+recover_binary_log (or the recover command), and a writer reopening it does
+that by itself.
+
+    python src/completion_codec.py encode game_log.csv game_log.bin
+    python src/completion_codec.py decode game_log.bin game_log.csv
+    python src/completion_codec.py recover game_log.bin
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import mmap
+import os
+import struct
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from completion_logger import FIELDNAMES, CompletionRecord  # noqa: E402
+
+MAGIC = b"MGCL"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQQ")
+RECORD = struct.Struct("<QI10s")   # time | level << 56, player | points << 24, board
+RECORD_SIZE = RECORD.size          # 22
+OPEN_TABLE_OFFSET = 0              # header table offset of a log a writer has not closed
+JOURNAL_SUFFIX = ".strings"
+
+BOARD_SIZE = 5
+CELLS = BOARD_SIZE * BOARD_SIZE
+# king moves, indexed by their 3-bit direction code
+DIRECTIONS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+STEPS = [d_row * BOARD_SIZE + d_col for d_row, d_col in DIRECTIONS]   # flat index change per code
+# MOVE_CODE[a * CELLS + b]: direction code of the king move from cell a to cell b, or -1
+MOVE_CODE = [-1] * (CELLS * CELLS)
+for _a in range(CELLS):
+    for _code, (_d_row, _d_col) in enumerate(DIRECTIONS):
+        _row, _col = _a // BOARD_SIZE + _d_row, _a % BOARD_SIZE + _d_col
+        if 0 <= _row < BOARD_SIZE and 0 <= _col < BOARD_SIZE:
+            MOVE_CODE[_a * CELLS + _row * BOARD_SIZE + _col] = _code
+NUMBER_TEXT = [str(n) for n in range(CELLS + 1)]
+NUMBER_OF = {text: n for n, text in enumerate(NUMBER_TEXT) if n}   # exact text only: no "01" or " 1"
+
+TIME_BITS = 56
+TIME_MASK = (1 << TIME_BITS) - 1
+RAW_TIME = 0x80                    # level byte flag
+PLAYER_MASK = (1 << 24) - 1
+RAW_BOARD = 1 << 79                # board flag
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def encode_board(board_flat: str) -> Optional[int]:
+    """Path code of a ';'-joined 5x5 board numbered along a king path, or None for any other board."""
+    parts = board_flat.split(";")
+    if len(parts) != CELLS:
+        return None
+    pos = [-1] * (CELLS + 1)
+    for idx, text in enumerate(parts):
+        number = NUMBER_OF.get(text, 0)
+        if number == 0 or pos[number] >= 0:
+            return None
+        pos[number] = idx
+    code = pos[1]
+    shift = 5
+    prev = pos[1] * CELLS
+    for number in range(2, CELLS + 1):
+        cell = pos[number]
+        direction = MOVE_CODE[prev + cell]
+        if direction < 0:
+            return None
+        code |= direction << shift
+        shift += 3
+        prev = cell * CELLS
+    return code
+
+
+def decode_board(code: int) -> str:
+    """Inverse of encode_board."""
+    board = [""] * CELLS
+    idx = code & 0x1F
+    board[idx] = "1"
+    code >>= 5
+    for number in range(2, CELLS + 1):
+        idx += STEPS[code & 7]
+        code >>= 3
+        board[idx] = NUMBER_TEXT[number]
+    return ";".join(board)
+
+
+def encode_time(timestamp_iso: str) -> Optional[int]:
+    """Microseconds since the epoch for a UTC isoformat() timestamp that formats back identically, else None."""
+    try:
+        when = datetime.fromisoformat(timestamp_iso)
+    except ValueError:
+        return None
+    if when.tzinfo is None or when.utcoffset():
+        return None
+    micros = (when - EPOCH) // MICROSECOND
+    if not 0 <= micros <= TIME_MASK or decode_time(micros) != timestamp_iso:
+        return None
+    return micros
+
+
+def decode_time(micros: int) -> str:
+    return (EPOCH + timedelta(microseconds=micros)).isoformat()
+
+
+class StringTable:
+    """Interned strings (player names, verbatim fields) by index."""
+    def __init__(self, strings: Optional[List[str]] = None) -> None:
+        self.strings: List[str] = []
+        self._index: Dict[str, int] = {}
+        for s in strings or ():
+            self.intern(s)
+
+    def intern(self, s: str) -> int:
+        idx = self._index.get(s)
+        if idx is None:
+            idx = self._index[s] = len(self.strings)
+            self.strings.append(s)
+        return idx
+
+    def __getitem__(self, idx: int) -> str:
+        return self.strings[idx]
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+    def to_bytes(self) -> bytes:
+        return struct.pack("<I", len(self.strings)) + self.entries_bytes()
+
+    def entries_bytes(self, start: int = 0) -> bytes:
+        """Strings from index start on, each as length u16 + UTF-8 (the table without its count)."""
+        parts = []
+        for s in self.strings[start:]:
+            data = s.encode("utf-8")
+            parts.append(struct.pack("<H", len(data)))
+            parts.append(data)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data) -> "StringTable":
+        (count,) = struct.unpack_from("<I", data, 0)
+        offset = 4
+        strings = []
+        for _ in range(count):
+            (length,) = struct.unpack_from("<H", data, offset)
+            offset += 2
+            strings.append(bytes(data[offset:offset + length]).decode("utf-8"))
+            offset += length
+        return cls(strings)
+
+
+def encode_record(record: CompletionRecord, strings: StringTable) -> bytes:
+    """One 22-byte record; new names and verbatim fields are added to strings."""
+    if not 0 <= record.level < RAW_TIME:
+        raise ValueError(f"level {record.level} does not fit the binary format")
+    if not 0 <= record.points <= 0xFF:
+        raise ValueError(f"points {record.points} do not fit the binary format")
+    player = strings.intern(record.player_name)
+    if player > PLAYER_MASK:
+        raise ValueError("too many distinct strings for one binary log")
+
+    level_byte = record.level
+    micros = encode_time(record.timestamp_iso)
+    if micros is None:
+        micros = strings.intern(record.timestamp_iso)
+        level_byte |= RAW_TIME
+    board = encode_board(record.board_flat)
+    if board is None:
+        board = RAW_BOARD | strings.intern(record.board_flat)
+    return RECORD.pack(micros | level_byte << TIME_BITS, player | record.points << 24,
+                       board.to_bytes(10, "little"))
+
+
+def decode_record(data, strings: StringTable, offset: int = 0) -> CompletionRecord:
+    stamp, word, board_bytes = RECORD.unpack_from(data, offset)
+    level_byte = stamp >> TIME_BITS
+    micros = stamp & TIME_MASK
+    board = int.from_bytes(board_bytes, "little")
+    return CompletionRecord(
+        player_name=strings[word & PLAYER_MASK],
+        timestamp_iso=strings[micros] if level_byte & RAW_TIME else decode_time(micros),
+        level=level_byte & ~RAW_TIME,
+        points=word >> 24,
+        board_flat=strings[board & ~RAW_BOARD] if board & RAW_BOARD else decode_board(board),
+    )
+
+
+def journal_path(filepath: str) -> Path:
+    path = Path(filepath)
+    return path.with_name(path.name + JOURNAL_SUFFIX)
+
+
+class BinaryLogWriter:
+    """
+    Writes completion records to a binary log; append_record matches CompletionLogger's.
+
+    An existing log is appended to, after recovering it if an earlier writer
+    did not close it. The string table and the record count are written by
+    close() (also called when leaving a with block); until then readers refuse
+    the file, and new strings are journaled so a crash loses no record that
+    reached the file.
+    """
+    def __init__(self, filepath: str) -> None:
+        self.path = Path(filepath)
+        self.count = 0
+        existing = self.path.exists() and self.path.stat().st_size > 0
+        if existing and journal_path(filepath).exists():
+            recover_binary_log(filepath)
+        if existing:
+            with BinaryLogReader(str(self.path)) as reader:
+                self.count = len(reader)
+                self.strings = StringTable(reader.strings.strings)
+        else:
+            self.strings = StringTable()
+        # the journal holds every string before the table is dropped from the log
+        self._journal = journal_path(filepath).open("wb")
+        self._journaled = 0
+        self._write_journal()
+        self._file = self.path.open("r+b" if existing else "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, RECORD_SIZE, self.count, OPEN_TABLE_OFFSET))
+        self._file.seek(HEADER.size + self.count * RECORD_SIZE)
+        self._file.truncate()
+
+    def append_record(self, record: CompletionRecord) -> None:
+        data = encode_record(record, self.strings)
+        if len(self.strings) > self._journaled:
+            self._write_journal()
+        self._file.write(data)
+        self.count += 1
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        table_offset = self._file.tell()
+        self._file.write(self.strings.to_bytes())
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, VERSION, RECORD_SIZE, self.count, table_offset))
+        self._file.close()
+        self._journal.close()
+        journal_path(str(self.path)).unlink()
+
+    def _write_journal(self) -> None:
+        self._journal.write(self.strings.entries_bytes(self._journaled))
+        self._journal.flush()
+        self._journaled = len(self.strings)
+
+    def __enter__(self) -> "BinaryLogWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class BinaryLogReader:
+    """
+    Memory-mapped binary log. Records are decoded on access; fields() scans
+    time, player, level and points without decoding boards or names.
+    """
+    def __init__(self, filepath: str) -> None:
+        self.path = Path(filepath)
+        with self.path.open("rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._read_header(filepath)
+        except BaseException:
+            self._map.close()
+            raise
+
+    def _read_header(self, filepath: str) -> None:
+        if len(self._map) < HEADER.size:
+            raise ValueError(f"{filepath} is not a version {VERSION} completion log")
+        magic, version, record_size, self.count, table_offset = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD_SIZE:
+            raise ValueError(f"{filepath} is not a version {VERSION} completion log")
+        if table_offset == OPEN_TABLE_OFFSET:
+            raise ValueError(f"{filepath} was not closed by its writer; if that writer is gone, "
+                             f"rebuild it with recover_binary_log() or 'completion_codec.py recover'")
+        if table_offset != HEADER.size + self.count * RECORD_SIZE or table_offset + 4 > len(self._map):
+            raise ValueError(f"{filepath} is damaged: its header does not match the file")
+        with memoryview(self._map) as view:
+            try:
+                self.strings = StringTable.from_bytes(view[table_offset:])
+            except (struct.error, UnicodeDecodeError) as exc:
+                raise ValueError(f"{filepath} is damaged: unreadable string table") from exc
+        self.records = memoryview(self._map)[HEADER.size:table_offset]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i: int) -> CompletionRecord:
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        return decode_record(self.records, self.strings, i * RECORD_SIZE)
+
+    def __iter__(self) -> Iterator[CompletionRecord]:
+        for i in range(self.count):
+            yield decode_record(self.records, self.strings, i * RECORD_SIZE)
+
+    def fields(self) -> Iterator[Tuple[int, int, int, int]]:
+        """(time in microseconds or -1 if stored verbatim, player index, level, points) per record."""
+        for stamp, word, _ in RECORD.iter_unpack(self.records):
+            level_byte = stamp >> TIME_BITS
+            micros = -1 if level_byte & RAW_TIME else stamp & TIME_MASK
+            yield micros, word & PLAYER_MASK, level_byte & ~RAW_TIME, word >> 24
+
+    def close(self) -> None:
+        self.records.release()
+        self._map.close()
+
+    def __enter__(self) -> "BinaryLogReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _read_journal(data: bytes) -> List[str]:
+    strings = []
+    offset = 0
+    while offset + 2 <= len(data):
+        (length,) = struct.unpack_from("<H", data, offset)
+        if offset + 2 + length > len(data):
+            break   # cut short by the crash; no record refers to it yet
+        strings.append(data[offset + 2:offset + 2 + length].decode("utf-8"))
+        offset += 2 + length
+    return strings
+
+
+def recover_binary_log(filepath: str) -> int:
+    """
+    Close a log whose writer stopped without close(): keep every whole record in
+    the file, rebuild the string table from the journal and write the header.
+    Returns the record count. Only run it when no writer has the log open.
+    """
+    path = Path(filepath)
+    journal = journal_path(filepath)
+    if not journal.exists():
+        raise ValueError(f"{filepath} cannot be recovered: its string journal {journal.name} is missing")
+    strings = StringTable(_read_journal(journal.read_bytes()))
+    count = max(path.stat().st_size - HEADER.size, 0) // RECORD_SIZE
+    table_offset = HEADER.size + count * RECORD_SIZE
+    with path.open("r+b") as f:
+        f.seek(table_offset)
+        f.truncate()   # drops a record cut short by the crash
+        f.write(strings.to_bytes())
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, RECORD_SIZE, count, table_offset))
+    journal.unlink()
+    return count
+
+
+def csv_to_binary(csv_path: str, bin_path: str) -> int:
+    """Append every row of a CompletionLogger CSV to a binary log; returns the number converted."""
+    count = 0
+    with open(csv_path, newline="", encoding="utf-8") as f, BinaryLogWriter(bin_path) as writer:
+        for row in csv.DictReader(f):
+            writer.append_record(CompletionRecord(row["player_name"], row["timestamp_iso"],
+                                                  int(row["level"]), int(row["points"]), row["board_flat"]))
+            count += 1
+    return count
+
+
+def binary_to_csv(bin_path: str, csv_path: str) -> int:
+    """Write a binary log as a CompletionLogger CSV (same bytes as the log it came from); returns the row count."""
+    with BinaryLogReader(bin_path) as reader, open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
+        writer.writerows((r.player_name, r.timestamp_iso, r.level, r.points, r.board_flat) for r in reader)
+        return len(reader)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Convert completion logs between CSV and the binary format")
+    parser.add_argument("command", choices=("encode", "decode", "recover"))
+    parser.add_argument("source")
+    parser.add_argument("target", nargs="?")
+    args = parser.parse_args()
+
+    if args.command == "recover":
+        print(f"{args.source}: recovered {recover_binary_log(args.source)} records")
+        return
+    if args.target is None:
+        parser.error(f"{args.command} needs a target file")
+    start = time.perf_counter()
+    convert = csv_to_binary if args.command == "encode" else binary_to_csv
+    count = convert(args.source, args.target)
+    source, target = os.path.getsize(args.source), os.path.getsize(args.target)
+    print(f"{count} records in {time.perf_counter() - start:.1f}s: "
+          f"{source:,} -> {target:,} bytes ({source / target:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
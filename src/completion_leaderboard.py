@@ -0,0 +1,172 @@
+# completion_leaderboard.py
+"""
+In-memory top-K leaderboard per level, kept up to date from completion events.
+
+Leaderboard keeps the best k completions of each level in a bounded min-heap
+whose root is the weakest entry, so a completion that does not make the board
+costs one comparison and one that does costs O(log k). Entries rank by points,
+then earlier timestamp_iso, then earlier arrival (the same order as
+CompletionStore.leaderboard).
+
+Feed it with logger.subscribe(board.add), or board.attach(logger), which first
+warm-starts from the logger's existing log (plain or rotated) in one streaming
+pass. top() never blocks writers: each level carries a version counter that the
+writer makes odd while it changes the heap, and a reader copies the heap and
+retries if the version moved (a seqlock). The sorted snapshot is cached per
+version, so repeated reads between completions are cheap.
+
+    python src/completion_leaderboard.py game_log.csv --k 10 --level 2
+"""
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import os
+import sys
+import threading
+import time
+from dataclasses import asdict
+from itertools import count
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from completion_logger import CompletionLogger, CompletionRecord, iter_log_records  # noqa: E402
+
+
+class _Entry:
+    """Heap item; a < b means a ranks below b."""
+    __slots__ = ("points", "timestamp", "seq", "record")
+
+    def __init__(self, record: CompletionRecord, seq: int) -> None:
+        self.points = record.points
+        self.timestamp = record.timestamp_iso
+        self.seq = seq
+        self.record = record
+
+    def __lt__(self, other: "_Entry") -> bool:
+        if self.points != other.points:
+            return self.points < other.points
+        if self.timestamp != other.timestamp:
+            return self.timestamp > other.timestamp
+        return self.seq > other.seq
+
+
+def _rank_key(entry: _Entry) -> Tuple[int, str, int]:
+    return -entry.points, entry.timestamp, entry.seq   # tuple comparison: faster than _Entry.__lt__
+
+
+class _LevelBoard:
+    __slots__ = ("heap", "version", "snapshot")
+
+    def __init__(self) -> None:
+        self.heap: List[_Entry] = []
+        self.version = 0   # odd while the heap is being changed
+        self.snapshot: Tuple[int, Tuple[CompletionRecord, ...]] = (0, ())
+
+
+class Leaderboard:
+    """Best k completions of each level, best first."""
+    def __init__(self, k: int = 10) -> None:
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        self.k = k
+        self._levels: Dict[int, _LevelBoard] = {}
+        self._seq = count()
+        self._lock = threading.Lock()   # serializes writers only
+
+    def add(self, record: CompletionRecord) -> bool:
+        """Offer a completion; True if it made the board. Usable as a CompletionLogger subscriber."""
+        with self._lock:
+            board = self._levels.get(record.level)
+            if board is None:
+                board = self._levels[record.level] = _LevelBoard()
+            heap = board.heap
+            if len(heap) >= self.k:
+                weakest = heap[0]
+                if record.points < weakest.points or (
+                        record.points == weakest.points and record.timestamp_iso >= weakest.timestamp):
+                    return False   # equal points and timestamp: the earlier arrival keeps its place
+            entry = _Entry(record, next(self._seq))
+            board.version += 1
+            if len(heap) < self.k:
+                heapq.heappush(heap, entry)
+            else:
+                heapq.heapreplace(heap, entry)
+            board.version += 1
+            return True
+
+    def load(self, filepath: str = "game_log.csv") -> int:
+        """Warm start: offer every record of a (possibly rotated) log, oldest first; returns the count."""
+        loaded = 0
+        for record in iter_log_records(filepath):
+            self.add(record)
+            loaded += 1
+        return loaded
+
+    def attach(self, logger: CompletionLogger, warm_start: bool = True) -> int:
+        """
+        Load the logger's existing log, then subscribe to its new records; returns
+        the number loaded. Attach before the logger is in use, so no record is
+        appended between the two steps.
+        """
+        if warm_start and hasattr(logger, "flush"):
+            logger.flush()   # a BufferedCompletionLogger's queued records belong in the warm start
+        loaded = self.load(str(logger.path)) if warm_start else 0
+        logger.subscribe(self.add)
+        return loaded
+
+    def top(self, level: int, limit: Optional[int] = None) -> Tuple[CompletionRecord, ...]:
+        """Snapshot of a level's board, best first, without blocking writers."""
+        board = self._levels.get(level)
+        if board is None:
+            return ()
+        while True:
+            version, records = board.snapshot
+            current = board.version
+            if version == current:
+                return records[:limit]
+            if current & 1:
+                time.sleep(0)   # a writer is mid-update: let it finish
+                continue
+            entries = list(board.heap)
+            if board.version == current:
+                break
+        records = tuple(e.record for e in sorted(entries, key=_rank_key))
+        board.snapshot = (current, records)
+        return records[:limit]
+
+    def levels(self) -> List[int]:
+        return sorted(self._levels)
+
+    def snapshot(self) -> Dict[int, Tuple[CompletionRecord, ...]]:
+        """top() of every level."""
+        return {level: self.top(level) for level in self.levels()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Top-K leaderboard of a completion log")
+    parser.add_argument("log_path", nargs="?", default="game_log.csv")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--level", type=int, help="only this level")
+    parser.add_argument("--json", action="store_true", help="print JSON instead of text")
+    args = parser.parse_args()
+
+    board = Leaderboard(args.k)
+    start = time.perf_counter()
+    loaded = board.load(args.log_path)
+    seconds = time.perf_counter() - start
+    levels = [args.level] if args.level is not None else board.levels()
+    if args.json:
+        print(json.dumps({str(level): [asdict(r) for r in board.top(level)] for level in levels}, indent=2))
+        return
+    print(f"{loaded} records in {seconds:.2f}s")
+    for level in levels:
+        print(f"\nlevel {level}")
+        for rank, r in enumerate(board.top(level), 1):
+            print(f"{rank:>3}. {r.points:>4}  {r.timestamp_iso}  {r.player_name}")
+
+
+if __name__ == "__main__":
+    main()
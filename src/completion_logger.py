@@ -1,10 +1,23 @@
 # completion_logger.py
 from __future__ import annotations
 
+import atexit
 import csv
+import gzip
+import io
+import os
+import queue
+import re
+import shutil
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+FIELDNAMES = ["player_name", "timestamp_iso", "level", "points", "board_flat"]
+DURABILITY_POLICIES = ("none", "flush", "fsync")
 
 
 def iso_now() -> str:
@@ -24,12 +37,14 @@ class CompletionLogger:
     """
     US7: Append a completion record when a level is completed successfully.
     Intended to be called by GUI/controller when engine.is_complete() becomes True.
+    Subscribers (see subscribe) are called with each record once it is appended.
     """
     def __init__(self, filepath: str = "game_log.csv") -> None:
         self.path = Path(filepath)
+        self._subscribers: Tuple[Callable[[CompletionRecord], None], ...] = ()
 
     def append_record(self, record: CompletionRecord) -> None:
-        fieldnames = ["player_name", "timestamp_iso", "level", "points", "board_flat"]
+        fieldnames = FIELDNAMES
 
         needs_header = not self.path.exists() or self.path.stat().st_size == 0
 
@@ -43,4 +58,333 @@ class CompletionLogger:
                 "level": record.level,
                 "points": record.points,
                 "board_flat": record.board_flat,
-            })
\ No newline at end of file
+            })
+        self._notify(record)
+
+    def subscribe(self, callback: Callable[[CompletionRecord], None]) -> None:
+        """Call callback(record) after every append_record, in the appending thread."""
+        self._subscribers += (callback,)
+
+    def unsubscribe(self, callback: Callable[[CompletionRecord], None]) -> None:
+        self._subscribers = tuple(s for s in self._subscribers if s != callback)
+
+    def _notify(self, record: CompletionRecord) -> None:
+        for callback in self._subscribers:   # a tuple, replaced on (un)subscribe: no lock needed
+            callback(record)
+
+
+class BufferedCompletionLogger(CompletionLogger):
+    """
+    CompletionLogger for hosts with many sessions: keeps the log open and writes
+    records in batches from a background thread.
+
+    append_record only queues the record. A batch is written when batch_size
+    records are pending or flush_interval seconds have passed, whichever comes
+    first. Each batch is formatted into one string and written under a lock, so
+    rows from concurrent callers are never split, interleaved or reordered.
+    durability sets what happens after each batch: "none" leaves it in the file
+    buffer, "flush" hands it to the OS, "fsync" also forces it to disk.
+
+    close() (also called at interpreter exit and when leaving a with block)
+    writes every queued record before closing the file. If a background write
+    fails, its batch goes back to the front of the queue and the thread retries
+    it after flush_interval. Until a write succeeds again, the next append_record
+    queues its record and then raises the error; flush and close retry the
+    queued records themselves and raise only if that attempt fails too. No
+    record is dropped by a failure the writes recover from. The output is the
+    same CSV CompletionLogger writes.
+    """
+    def __init__(self, filepath: str = "game_log.csv", batch_size: int = 256,
+                 flush_interval: float = 1.0, durability: str = "flush") -> None:
+        super().__init__(filepath)
+        if durability not in DURABILITY_POLICIES:
+            raise ValueError(f"durability must be one of {DURABILITY_POLICIES}, not {durability!r}")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.durability = durability
+        self.records_written = 0
+        self.batches_written = 0
+        self.write_seconds = 0.0   # time spent formatting and writing batches
+
+        self._pending: List[CompletionRecord] = []
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()   # taken before the queue, so batches leave in order
+        self._closed = False
+        self._error: Exception | None = None   # last background write failed with this; its rows are queued
+
+        needs_header = not self.path.exists() or self.path.stat().st_size == 0
+        self._file = self.path.open("a", newline="", encoding="utf-8")
+        if needs_header:
+            csv.writer(self._file).writerow(FIELDNAMES)
+            self._sync()
+
+        self._thread = threading.Thread(target=self._run, name="completion-logger", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def append_record(self, record: CompletionRecord) -> None:
+        with self._cond:
+            if self._closed:
+                raise ValueError("append_record on a closed BufferedCompletionLogger")
+            self._pending.append(record)
+            if len(self._pending) >= self.batch_size:
+                self._cond.notify()
+        self._notify(record)
+        self._raise_background_error()   # the record is queued either way
+
+    def flush(self) -> None:
+        """
+        Write all queued records now, in the calling thread; raises if that write
+        fails. An earlier background failure is settled by this attempt.
+        """
+        try:
+            self._write_pending()
+        finally:
+            self._error = None
+
+    def _write_pending(self) -> None:
+        with self._write_lock:
+            with self._cond:
+                batch, self._pending = self._pending, []
+            try:
+                self._write_batch(batch)
+            except BaseException:
+                with self._cond:
+                    self._pending[:0] = batch   # keep the records for the next attempt
+                raise
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        try:
+            self.flush()
+        finally:
+            with self._write_lock:
+                self._file.close()   # also flushes the file buffer under durability "none"
+            atexit.unregister(self.close)
+
+    def stats(self) -> Dict[str, float]:
+        """Counters for a throughput report."""
+        return {
+            "records_written": self.records_written,
+            "batches_written": self.batches_written,
+            "write_seconds": self.write_seconds,
+            "records_per_sec": self.records_written / self.write_seconds if self.write_seconds else 0.0,
+        }
+
+    def __enter__(self) -> "BufferedCompletionLogger":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        failed = False
+        while True:
+            with self._cond:
+                if failed:   # back off for an interval instead of retrying a full queue at once
+                    self._cond.wait_for(lambda: self._closed, timeout=self.flush_interval)
+                else:
+                    self._cond.wait_for(lambda: self._closed or len(self._pending) >= self.batch_size,
+                                        timeout=self.flush_interval)
+                if self._closed:
+                    return   # close() writes what is left
+            try:
+                self._write_pending()
+                self._error = None   # recovered: the failed batch has been written
+                failed = False
+            except Exception as exc:   # the batch is back in the queue; keep running and retry it
+                self._error = exc
+                failed = True
+
+    def _raise_background_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _write_batch(self, batch: List[CompletionRecord]) -> None:
+        # caller holds _write_lock
+        if not batch:
+            return
+        start = time.perf_counter()
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerows((r.player_name, r.timestamp_iso, r.level, r.points, r.board_flat) for r in batch)
+        self._file.write(buf.getvalue())
+        self._sync()
+        self.records_written += len(batch)
+        self.batches_written += 1
+        self.write_seconds += time.perf_counter() - start
+
+    def _sync(self) -> None:
+        if self.durability == "none":
+            return
+        self._file.flush()
+        if self.durability == "fsync":
+            os.fsync(self._file.fileno())
+
+
+class RotatingCompletionLogger(CompletionLogger):
+    """
+    CompletionLogger that keeps the active log small: once it holds max_bytes,
+    or its first record is max_age seconds old, it is renamed to the next
+    numbered segment (game_log.csv.1, game_log.csv.2, ...) and a new log is
+    started. A background thread gzips closed segments (game_log.csv.1.gz);
+    segments left uncompressed by an earlier run are queued at start.
+
+    The file stays open and its size is tracked in memory, so an append is one
+    buffered write and a flush. Every segment is a complete CSV with its own
+    header. close() (also called at interpreter exit and when leaving a with
+    block) closes the log and waits for pending compression. iter_log_records
+    reads the segments and the active log back in order.
+    """
+    def __init__(self, filepath: str = "game_log.csv", max_bytes: Optional[int] = 16 << 20,
+                 max_age: Optional[float] = None, compress: bool = True, compresslevel: int = 6) -> None:
+        super().__init__(filepath)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.compresslevel = compresslevel
+        self.compress_error: Exception | None = None   # last failed compression; the plain segment is kept
+        self._lock = threading.Lock()
+        self._next_segment = max((number for number, _ in _segment_files(self.path)), default=0) + 1
+
+        self._queue: "queue.Queue[Optional[Path]]" = queue.Queue()
+        self._compressor: Optional[threading.Thread] = None
+        if compress:
+            self._compressor = threading.Thread(target=self._compress_loop, name="completion-log-gzip",
+                                                daemon=True)
+            self._compressor.start()
+            for _, segment in _segment_files(self.path):
+                if segment.suffix != ".gz":
+                    self._queue.put(segment)
+        self._open()
+        atexit.register(self.close)
+
+    def append_record(self, record: CompletionRecord) -> None:
+        with self._lock:
+            if self._file is None:
+                raise ValueError("append_record on a closed RotatingCompletionLogger")
+            if self._size > self._header_size and self._rotation_due():
+                self._rotate()
+            if self._started is None:
+                self._started = time.monotonic()
+            self._writer.writerow((record.player_name, record.timestamp_iso, record.level, record.points,
+                                   record.board_flat))
+            self._file.flush()
+            self._size = self._file.tell()
+        self._notify(record)
+
+    def rotate(self) -> None:
+        """Close the active log as a segment now (if it holds any records)."""
+        with self._lock:
+            if self._file is not None and self._size > self._header_size:
+                self._rotate()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._file = None
+        if self._compressor is not None:
+            self._queue.put(None)
+            self._compressor.join()
+        atexit.unregister(self.close)
+
+    def __enter__(self) -> "RotatingCompletionLogger":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _open(self) -> None:
+        needs_header = not self.path.exists() or self.path.stat().st_size == 0
+        self._file = self.path.open("a", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        if needs_header:
+            self._writer.writerow(FIELDNAMES)
+            self._file.flush()
+        self._size = self._file.tell()
+        self._header_size = self._size if needs_header else 0
+        self._started: Optional[float] = None   # monotonic time of this run's first record in the file
+
+    def _rotation_due(self) -> bool:
+        if self.max_bytes is not None and self._size >= self.max_bytes:
+            return True
+        return (self.max_age is not None and self._started is not None
+                and time.monotonic() - self._started >= self.max_age)
+
+    def _rotate(self) -> None:
+        # caller holds _lock
+        self._file.close()
+        segment = self.path.with_name(f"{self.path.name}.{self._next_segment}")
+        self._next_segment += 1
+        os.replace(self.path, segment)
+        if self._compressor is not None:
+            self._queue.put(segment)
+        self._open()
+
+    def _compress_loop(self) -> None:
+        while True:
+            segment = self._queue.get()
+            if segment is None:
+                return
+            try:
+                _gzip_segment(segment, self.compresslevel)
+            except OSError as exc:
+                self.compress_error = exc
+
+
+def _segment_files(path: Path) -> List[tuple]:
+    """(number, path) of the closed segments of a log, oldest first; a plain file wins over its .gz."""
+    pattern = re.compile(re.escape(path.name) + r"\.(\d+)(\.gz)?$")
+    found: Dict[int, Path] = {}
+    if path.parent.is_dir():
+        for entry in path.parent.iterdir():
+            match = pattern.match(entry.name)
+            if match and (match.group(2) is None or int(match.group(1)) not in found):
+                found[int(match.group(1))] = entry
+    return sorted(found.items())
+
+
+def _gzip_segment(segment: Path, compresslevel: int) -> None:
+    target = segment.with_name(segment.name + ".gz")
+    partial = segment.with_name(segment.name + ".gz.tmp")
+    with segment.open("rb") as src, gzip.open(partial, "wb", compresslevel=compresslevel) as dst:
+        shutil.copyfileobj(src, dst, 1 << 20)
+    os.replace(partial, target)
+    os.remove(segment)
+
+
+def log_segments(filepath: str = "game_log.csv") -> List[Path]:
+    """Files of a rotated log in record order: numbered segments (plain or .gz), then the active log."""
+    path = Path(filepath)
+    files = [segment for _, segment in _segment_files(path)]
+    if path.exists():
+        files.append(path)
+    return files
+
+
+def iter_log_records(filepath: str = "game_log.csv") -> Iterator[CompletionRecord]:
+    """Every record of a (possibly rotated) log, oldest first, reading .gz segments transparently."""
+    for segment in log_segments(filepath):
+        try:
+            f = _open_segment(segment)
+        except FileNotFoundError:   # compressed since it was listed
+            f = _open_segment(segment.with_name(segment.name + ".gz"))
+        with f:
+            for row in csv.DictReader(f):
+                yield CompletionRecord(row["player_name"], row["timestamp_iso"], int(row["level"]),
+                                       int(row["points"]), row["board_flat"])
+
+
+def _open_segment(segment: Path):
+    if segment.suffix == ".gz":
+        return gzip.open(segment, "rt", newline="", encoding="utf-8")
+    return segment.open(newline="", encoding="utf-8")
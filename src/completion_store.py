@@ -0,0 +1,304 @@
+# completion_store.py
+"""
+SQLite storage for CompletionRecord, with indexed leaderboard and player queries.
+
+An alternative to the CSV log for hosts that need to answer questions such as
+"top scores for level 2 this week" or "all completions by player X" without
+reading the whole log. The database runs in WAL mode, so readers are not
+blocked while records are written, and records are written in batched
+transactions. Two indexes serve the queries:
+
+  (level, points DESC, timestamp_iso)   leaderboard: best scores of a level, optionally
+                                        within a time window; earlier completions win ties
+  (player_name, timestamp_iso)          one player's history, newest first
+
+Timestamps are compared as strings, which orders them correctly as long as they
+share a format and UTC offset (iso_now always writes UTC).
+
+    python src/completion_store.py import game_log.csv completions.db
+    python src/completion_store.py leaderboard completions.db --level 2 --since 2026-02-02
+    python src/completion_store.py history completions.db Alice
+"""
+from __future__ import annotations
+
+import argparse
+import atexit
+import csv
+import os
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from completion_logger import FIELDNAMES, CompletionRecord  # noqa: E402
+
+COLUMNS = ", ".join(FIELDNAMES)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS completions (
+    id INTEGER PRIMARY KEY,
+    player_name TEXT NOT NULL,
+    timestamp_iso TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    points INTEGER NOT NULL,
+    board_flat TEXT NOT NULL
+);
+"""
+INDEXES = {
+    "completions_level_points": "completions (level, points DESC, timestamp_iso)",
+    "completions_player_time": "completions (player_name, timestamp_iso)",
+}
+INSERT = f"INSERT INTO completions ({COLUMNS}) VALUES (?, ?, ?, ?, ?)"
+
+Row = Tuple[str, str, int, int, str]
+
+
+def _row(record: CompletionRecord) -> Row:
+    return (record.player_name, record.timestamp_iso, record.level, record.points, record.board_flat)
+
+
+def _time_filter(since: Optional[str], until: Optional[str]) -> Tuple[str, list]:
+    sql, params = "", []
+    if since is not None:
+        sql += " AND timestamp_iso >= ?"
+        params.append(since)
+    if until is not None:
+        sql += " AND timestamp_iso < ?"
+        params.append(until)
+    return sql, params
+
+
+def read_csv_rows(csv_path: str) -> Iterator[Row]:
+    """Rows of a CompletionLogger CSV, with level and points as ints."""
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            yield (row["player_name"], row["timestamp_iso"], int(row["level"]), int(row["points"]),
+                   row["board_flat"])
+
+
+class CompletionStore:
+    """
+    Completion records in a SQLite database.
+
+    append_record has the same signature as CompletionLogger.append_record.
+    Records are queued and inserted in one transaction when batch_size are
+    pending, or on the first append after flush_interval seconds; flush() commits
+    the queue now and close() (also called at interpreter exit and when leaving a
+    with block) commits it before closing the connection. Queries flush first, so
+    they always see every appended record. One store may be shared by threads.
+    """
+    def __init__(self, filepath: str = "completions.db", batch_size: int = 1000,
+                 flush_interval: float = 1.0) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.path = Path(filepath)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending: List[Row] = []
+        self._last_commit = time.monotonic()
+        self._lock = threading.RLock()
+        self._closed = False
+
+        # autocommit mode: transactions are opened explicitly around each batch
+        self._db = sqlite3.connect(str(self.path), isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")   # durable at each checkpoint; safe with WAL
+        self._db.executescript(SCHEMA)
+        self._create_indexes()
+        atexit.register(self.close)
+
+    # writing
+
+    def append_record(self, record: CompletionRecord) -> None:
+        with self._lock:
+            if self._closed:
+                raise ValueError("append_record on a closed CompletionStore")
+            self._pending.append(_row(record))
+            if (len(self._pending) >= self.batch_size
+                    or time.monotonic() - self._last_commit >= self.flush_interval):
+                self.flush()
+
+    def append_records(self, records: Iterable[CompletionRecord]) -> None:
+        for record in records:
+            self.append_record(record)
+
+    def flush(self) -> None:
+        """Insert all queued records in one transaction."""
+        with self._lock:
+            if self._pending:
+                self._insert(self._pending)
+                self._pending = []
+            self._last_commit = time.monotonic()
+
+    def import_csv(self, csv_path: str, batch_size: int = 50000) -> int:
+        """Insert every row of a CompletionLogger CSV; returns the number imported."""
+        return self.import_rows(read_csv_rows(csv_path), batch_size)
+
+    def import_rows(self, rows: Iterable[Row], batch_size: int = 50000) -> int:
+        """
+        Bulk insert (player_name, timestamp_iso, level, points, board_flat) rows,
+        batch_size per transaction; returns the number inserted.
+
+        Into an empty store the indexes are dropped for the load and rebuilt
+        afterwards, which is much faster than updating them row by row.
+        """
+        with self._lock:
+            self.flush()
+            rebuild = not self._db.execute("SELECT 1 FROM completions LIMIT 1").fetchone()
+            if rebuild:
+                self._drop_indexes()
+            inserted = 0
+            try:
+                batch: List[Row] = []
+                for row in rows:
+                    batch.append(row)
+                    if len(batch) >= batch_size:
+                        self._insert(batch)
+                        inserted += len(batch)
+                        batch = []
+                self._insert(batch)
+                inserted += len(batch)
+            finally:
+                if rebuild:
+                    self._create_indexes()
+                    self._db.execute("ANALYZE")
+            return inserted
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            try:
+                self.flush()
+            finally:
+                self._closed = True
+                self._db.close()
+                atexit.unregister(self.close)
+
+    def __enter__(self) -> "CompletionStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # queries
+
+    def count(self, level: Optional[int] = None) -> int:
+        sql, params = "SELECT COUNT(*) FROM completions", []
+        if level is not None:
+            sql, params = sql + " WHERE level = ?", [level]
+        return self._query(sql, params)[0][0]
+
+    def leaderboard(self, level: int, limit: int = 10, since: Optional[str] = None,
+                    until: Optional[str] = None) -> List[CompletionRecord]:
+        """Best scores of a level, optionally within [since, until); earlier completions win ties."""
+        if since is None and until is None:
+            return self._records(
+                f"SELECT {COLUMNS} FROM completions INDEXED BY completions_level_points"
+                " WHERE level = ? ORDER BY points DESC, timestamp_iso, id LIMIT ?", [level, limit])
+        # One index seek per score, best first. A single ORDER BY points query would have to
+        # walk every entry of the top scores outside the window before reaching the ones inside.
+        time_sql, params = _time_filter(since, until)
+        records: List[CompletionRecord] = []
+        with self._lock:
+            points = self._query("SELECT MAX(points) FROM completions WHERE level = ?", [level])[0][0]
+            while points is not None and len(records) < limit:
+                records += self._records(
+                    f"SELECT {COLUMNS} FROM completions INDEXED BY completions_level_points"
+                    f" WHERE level = ? AND points = ?{time_sql} ORDER BY timestamp_iso, id LIMIT ?",
+                    [level, points, *params, limit - len(records)])
+                points = self._query("SELECT MAX(points) FROM completions WHERE level = ? AND points < ?",
+                                     [level, points])[0][0]
+        return records
+
+    def player_history(self, player_name: str, limit: Optional[int] = None, level: Optional[int] = None,
+                       since: Optional[str] = None, until: Optional[str] = None) -> List[CompletionRecord]:
+        """A player's completions, newest first."""
+        time_sql, params = _time_filter(since, until)
+        if level is not None:
+            time_sql += " AND level = ?"
+            params.append(level)
+        return self._records(
+            f"SELECT {COLUMNS} FROM completions INDEXED BY completions_player_time"
+            f" WHERE player_name = ?{time_sql} ORDER BY timestamp_iso DESC, id DESC LIMIT ?",
+            [player_name, *params, -1 if limit is None else limit])
+
+    def player_best(self, player_name: str, level: int) -> Optional[int]:
+        """A player's best score on a level, or None if they have not completed it."""
+        return self._query("SELECT MAX(points) FROM completions WHERE player_name = ? AND level = ?",
+                           [player_name, level])[0][0]
+
+    def explain(self, sql: str, params: Iterable = ()) -> List[str]:
+        """SQLite's query plan for a statement, one line per step."""
+        return [row[-1] for row in self._query("EXPLAIN QUERY PLAN " + sql, list(params))]
+
+    # internals
+
+    def _insert(self, rows: List[Row]) -> None:
+        if not rows:
+            return
+        self._db.execute("BEGIN")
+        try:
+            self._db.executemany(INSERT, rows)
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+
+    def _query(self, sql: str, params: list) -> list:
+        with self._lock:
+            self.flush()
+            return self._db.execute(sql, params).fetchall()
+
+    def _records(self, sql: str, params: list) -> List[CompletionRecord]:
+        return [CompletionRecord(*row) for row in self._query(sql, params)]
+
+    def _create_indexes(self) -> None:
+        for name, target in INDEXES.items():
+            self._db.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+
+    def _drop_indexes(self) -> None:
+        for name in INDEXES:
+            self._db.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Completion records in SQLite")
+    commands = parser.add_subparsers(dest="command", required=True)
+    imp = commands.add_parser("import", help="import a CompletionLogger CSV")
+    imp.add_argument("csv_path")
+    imp.add_argument("db_path")
+    top = commands.add_parser("leaderboard", help="best scores of a level")
+    top.add_argument("db_path")
+    top.add_argument("--level", type=int, default=1)
+    top.add_argument("--limit", type=int, default=10)
+    top.add_argument("--since", help="ISO timestamp (inclusive)")
+    top.add_argument("--until", help="ISO timestamp (exclusive)")
+    history = commands.add_parser("history", help="a player's completions, newest first")
+    history.add_argument("db_path")
+    history.add_argument("player_name")
+    history.add_argument("--level", type=int)
+    history.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    with CompletionStore(args.db_path) as store:
+        if args.command == "import":
+            start = time.perf_counter()
+            imported = store.import_csv(args.csv_path)
+            print(f"imported {imported} records in {time.perf_counter() - start:.1f}s "
+                  f"({store.count()} in {args.db_path})")
+            return
+        if args.command == "leaderboard":
+            records = store.leaderboard(args.level, args.limit, args.since, args.until)
+        else:
+            records = store.player_history(args.player_name, args.limit, args.level)
+        for r in records:
+            print(f"{r.points:>4}  level {r.level}  {r.timestamp_iso}  {r.player_name}")
+
+
+if __name__ == "__main__":
+    main()
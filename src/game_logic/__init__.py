@@ -1,3 +1,5 @@
 from .game_state import GameState
 from .level1 import Level1Logic
 from .level2 import Level2Logic
+from .level1_solver import Level1Solver
+from .level1_optimizer import Level1Optimizer
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+#bitboard helpers for the 5x5 inner board
+#cell (row, col) maps to bit index row * 5 + col, so bit order matches row-major board order
+
+BOARD_SIZE = 5
+NUM_CELLS = BOARD_SIZE * BOARD_SIZE
+FULL_MASK = (1 << NUM_CELLS) - 1
+
+
+def cell_index(row, col):   #convert (row, col) to bit index
+    return row * BOARD_SIZE + col
+
+
+def cell_pos(index):   #convert bit index to (row, col)
+    return divmod(index, BOARD_SIZE)
+
+
+def _build_masks():   #precompute king-move masks (all neighbors and diagonal-only neighbors) per cell
+    neighbors = []
+    diagonals = []
+    for row in range(BOARD_SIZE):
+        for col in range(BOARD_SIZE):
+            near = 0
+            diag = 0
+            for d_row in (-1, 0, 1):
+                for d_col in (-1, 0, 1):
+                    if d_row == 0 and d_col == 0:
+                        continue
+                    n_row = row + d_row
+                    n_col = col + d_col
+                    if 0 <= n_row < BOARD_SIZE and 0 <= n_col < BOARD_SIZE:
+                        bit = 1 << cell_index(n_row, n_col)
+                        near |= bit
+                        if d_row != 0 and d_col != 0:
+                            diag |= bit
+            neighbors.append(near)
+            diagonals.append(diag)
+    return tuple(neighbors), tuple(diagonals)
+
+
+NEIGHBOR_MASKS, DIAGONAL_MASKS = _build_masks()
+
+#cell positions indexed by bit, so decoding a mask never calls divmod
+CELL_POSITIONS = tuple(cell_pos(i) for i in range(NUM_CELLS))
+
+
+def iter_bits(mask):   #yield the index of every set bit, lowest first
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def mask_to_cells(mask):   #convert a mask to a row-major list of (row, col) positions
+    return [CELL_POSITIONS[i] for i in iter_bits(mask)]
+
+
+def mask_from_board(board):   #build an occupancy mask from a 2D board (nonzero = occupied)
+    mask = 0
+    for row in range(BOARD_SIZE):
+        for col in range(BOARD_SIZE):
+            if board[row][col] != 0:
+                mask |= 1 << cell_index(row, col)
+    return mask
+
+
+#level 2 ring: the 24 cells around the inner board in 7x7 coordinates, indexed in _create_empty_ring order
+RING_SIZE = BOARD_SIZE + 2
+RING_CELLS = tuple(
+    [(0, col) for col in range(RING_SIZE)]
+    + [(RING_SIZE - 1, col) for col in range(RING_SIZE)]
+    + [(row, 0) for row in range(1, RING_SIZE - 1)]
+    + [(row, RING_SIZE - 1) for row in range(1, RING_SIZE - 1)]
+)
+RING_INDEX = {pos: i for i, pos in enumerate(RING_CELLS)}
+FULL_RING_MASK = (1 << len(RING_CELLS)) - 1
+
+
+def _build_ring_candidates():   #ring cells each inner cell's number may use: row ends, column ends, diagonal corners
+    last = RING_SIZE - 1
+    candidates = []
+    for row in range(BOARD_SIZE):
+        for col in range(BOARD_SIZE):
+            cells = [(row + 1, 0), (row + 1, last), (0, col + 1), (last, col + 1)]
+            if row == col:
+                cells.extend([(0, 0), (last, last)])
+            if row + col == BOARD_SIZE - 1:
+                cells.extend([(0, last), (last, 0)])
+            candidates.append(tuple(cells))
+    return tuple(candidates)
+
+
+RING_CANDIDATES = _build_ring_candidates()
+RING_CANDIDATE_MASKS = tuple(sum(1 << RING_INDEX[pos] for pos in cells) for cells in RING_CANDIDATES)
+
+
+def ring_mask_to_cells(mask):   #convert a ring mask to a list of (ring_row, ring_col) positions
+    return [RING_CELLS[i] for i in iter_bits(mask)]
+
+
+def ring_mask_from_ring(outer_ring):   #build a ring occupancy mask from the outer ring dict (nonzero = occupied)
+    mask = 0
+    for pos, value in outer_ring.items():
+        if value != 0 and pos in RING_INDEX:
+            mask |= 1 << RING_INDEX[pos]
+    return mask
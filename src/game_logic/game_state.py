@@ -2,12 +2,17 @@
 
 import random
 
+from .bitboard import RING_CELLS, RING_INDEX, cell_index, mask_from_board, ring_mask_from_ring
+
 
 class GameState:
     def __init__(self):
         self.level = 1                                      #current level (1 or 2)
         self.board = [[0 for _ in range(5)] for _ in range(5)]  #5x5 inner board
+        self.occupied = 0                                   #bitmask of filled inner cells (bit row * 5 + col)
+        self.num_pos = [None] * 26                          #number -> (row, col) on the inner board (board is cell -> number)
         self.outer_ring = {}                                #outer ring cells for level 2 (dict with (row, col) keys)
+        self.ring_occupied = 0                              #bitmask of filled ring cells (bit = RING_INDEX[pos])
         self.current_num = 1                                #next number to place
         self.score = 0                                      #player score
         self.last_pos = None                                #position of last placed number
@@ -15,11 +20,14 @@ class GameState:
         self.game_over = False                              #game over flag
         self.win = False
         self.move_history = History()
+        self.version = 0                                    #bumped on every board/ring write (lets the GUI skip unchanged frames)
+        self.board_generation = 0                           #bumped when a new inner board is loaded (the GUI rebuilds its layout)
     
     def reset_level1(self):   #reset for a new level 1 game (keeps "1" in original position per story 4)
         self.level = 1
-        self.board = [[0 for _ in range(5)] for _ in range(5)]
+        self._load_board([[0 for _ in range(5)] for _ in range(5)])
         self.outer_ring = {}
+        self.ring_occupied = 0
         self.score = 0
         self.game_over = False
         self.win = False
@@ -28,7 +36,7 @@ class GameState:
         #restore "1" to its original position (story 4 requirement)
         if self.original_one_pos:
             row, col = self.original_one_pos
-            self.board[row][col] = 1
+            self.set_inner_cell(row, col, 1)
             self.last_pos = self.original_one_pos
             self.move_history.record_action_lv1(row, col, False)
             self.current_num = 2
@@ -36,19 +44,22 @@ class GameState:
             self.current_num = 1
             self.last_pos = None
         
-    def start_level1_with_random_one(self):   #place number 1 randomly for level 1 start (story 1 requirement)
+    def start_level1_with_random_one(self, rng=None):   #place number 1 randomly for level 1 start (story 1 requirement)
+        #rng: optional random.Random for seeded simulations (defaults to the random module)
+        rng = rng or random
         self.level = 1
-        self.board = [[0 for _ in range(5)] for _ in range(5)]
+        self._load_board([[0 for _ in range(5)] for _ in range(5)])
         self.outer_ring = {}
+        self.ring_occupied = 0
         self.score = 0
         self.game_over = False
         self.win = False
         self.move_history.clear_history()
         
         #place "1" randomly and save original position
-        row = random.randint(0, 4)
-        col = random.randint(0, 4)
-        self.board[row][col] = 1
+        row = rng.randint(0, 4)
+        col = rng.randint(0, 4)
+        self.set_inner_cell(row, col, 1)
         self.last_pos = (row, col)
         self.original_one_pos = (row, col)   #save for clear functionality (story 4)
         self.move_history.record_action_lv1(row, col, False)
@@ -56,37 +67,62 @@ class GameState:
         
     def start_level2(self, completed_board):   #initialize level 2 with completed level 1 board
         self.level = 2
-        self.board = [row[:] for row in completed_board]    #copy the completed board
+        self._load_board([row[:] for row in completed_board])   #copy the completed board
         self.outer_ring = self._create_empty_ring()         #create empty outer ring
+        self.ring_occupied = 0
         self.current_num = 2                                #start placing from 2 in outer ring
         self.last_pos = self._find_number_position(1)       #find where 1 is on inner board
         self.game_over = False
         self.win = False
         
     def _create_empty_ring(self):   #create empty outer ring dictionary
-        ring = {}
-        #top row (7 cells: col 0-6, row 0)
-        for col in range(7):
-            ring[(0, col)] = 0
-        #bottom row (7 cells: col 0-6, row 6)
-        for col in range(7):
-            ring[(6, col)] = 0
-        #left column excluding corners (rows 1-5, col 0)
-        for row in range(1, 6):
-            ring[(row, 0)] = 0
-        #right column excluding corners (rows 1-5, col 6)
-        for row in range(1, 6):
-            ring[(row, 6)] = 0
-            
-        return ring
+        #top row, bottom row, then left and right columns excluding corners (see bitboard.RING_CELLS)
+        return {pos: 0 for pos in RING_CELLS}
     
-    def _find_number_position(self, num):   #find position of a number on the inner board
+    def _load_board(self, board):   #replace the inner board and rebuild the occupancy mask and position index
+        self.board = board
+        self.version += 1
+        self.board_generation += 1
+        self.occupied = mask_from_board(board)
+        self.num_pos = [None] * 26
         for row in range(5):
             for col in range(5):
-                if self.board[row][col] == num:
-                    return (row, col)
+                num = board[row][col]
+                if 0 < num < len(self.num_pos):
+                    self.num_pos[num] = (row, col)
+    
+    def set_inner_cell(self, row, col, num):   #write a number to the inner board and keep the mask and index in sync
+        self.board[row][col] = num
+        self.version += 1
+        self.occupied |= 1 << cell_index(row, col)
+        self.num_pos[num] = (row, col)
+        
+    def clear_inner_cell(self, row, col):   #empty an inner board cell and keep the mask and index in sync
+        num = self.board[row][col]
+        if 0 < num < len(self.num_pos) and self.num_pos[num] == (row, col):
+            self.num_pos[num] = None
+        self.board[row][col] = 0
+        self.version += 1
+        self.occupied &= ~(1 << cell_index(row, col))
+    
+    def set_ring_cell(self, pos, num):   #write a number to the outer ring and keep the ring mask in sync
+        self.outer_ring[pos] = num
+        self.version += 1
+        self.ring_occupied |= 1 << RING_INDEX[pos]
+    
+    def clear_ring_cell(self, pos):   #empty an outer ring cell and keep the ring mask in sync
+        self.outer_ring[pos] = 0
+        self.version += 1
+        self.ring_occupied &= ~(1 << RING_INDEX[pos])
+    
+    def get_number_position(self, num):   #find position of a number on the inner board (O(1) index lookup)
+        if 0 < num < len(self.num_pos):
+            return self.num_pos[num]
         return None
     
+    def _find_number_position(self, num):   #find position of a number on the inner board
+        return self.get_number_position(num)
+    
     def get_state_dict(self):   #get state as dictionary for saving
         return {
             'level': self.level,
@@ -100,8 +136,9 @@ class GameState:
     
     def set_state_dict(self, state):   #restore state from dictionary
         self.level = state.get('level', 1)
-        self.board = state['board']
+        self._load_board(state['board'])
         self.outer_ring = state.get('outer_ring', {})
+        self.ring_occupied = ring_mask_from_ring(self.outer_ring)
         self.current_num = state['current_num']
         self.score = state['score']
         self.last_pos = state['last_pos']
@@ -115,7 +152,7 @@ class GameState:
             last_action = self.move_history.undo_history()
             penult_action = self.move_history.get_action(-1)
             
-            self.board[last_action.inner_pos_x][last_action.inner_pos_y] = 0
+            self.clear_inner_cell(last_action.inner_pos_x, last_action.inner_pos_y)
             self.current_num -= 1
             self.last_pos = (penult_action.inner_pos_x, penult_action.inner_pos_y)
             
@@ -129,7 +166,7 @@ class GameState:
             last_action = self.move_history.get_action(self.current_num - 2)
             penult_action = self.move_history.get_action(self.current_num - 3)
             
-            self.outer_ring[last_action.outer_pos] = 0
+            self.clear_ring_cell(last_action.outer_pos)
             last_action.edit_outer_pos((-1, -1))
             self.current_num -= 1
             self.last_pos = (penult_action.inner_pos_x, penult_action.inner_pos_y)
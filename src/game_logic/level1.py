@@ -1,5 +1,8 @@
 #!/usr/bin/env python
 
+from .bitboard import (FULL_MASK, NEIGHBOR_MASKS, DIAGONAL_MASKS,
+                       cell_index, mask_to_cells)
+from .level1_solver import can_complete
 
 class Level1Logic:
     def __init__(self, game_state):
@@ -9,36 +12,36 @@ class Level1Logic:
         #check bounds
         if row < 0 or row > 4 or col < 0 or col > 4:
             return (False, "out_of_bounds")
+        bit = 1 << cell_index(row, col)
         #check if cell is empty
-        if self.state.board[row][col] != 0:
+        if self.state.occupied & bit:
             return (False, "cell_occupied")
         #first move can be anywhere (but in GUI, 1 is pre-placed)
         if self.state.current_num == 1:
             return (True, None)
         #check if one step away from last position
         last_row, last_col = self.state.last_pos
-        row_diff = abs(row - last_row)
-        col_diff = abs(col - last_col)
-        if row_diff <= 1 and col_diff <= 1 and (row_diff + col_diff) > 0:
+        if NEIGHBOR_MASKS[cell_index(last_row, last_col)] & bit:
             return (True, None)
         return (False, "not_adjacent")
     
     def is_diagonal_move(self, row, col):   #check if move is diagonal from last position
         if self.state.last_pos is None:
             return False
+        if row < 0 or row > 4 or col < 0 or col > 4:
+            return False
         last_row, last_col = self.state.last_pos
-        row_diff = abs(row - last_row)
-        col_diff = abs(col - last_col)
-        return row_diff == 1 and col_diff == 1
+        return bool(DIAGONAL_MASKS[cell_index(last_row, last_col)] & (1 << cell_index(row, col)))
+    
+    def get_valid_mask(self):   #get bitmask of all valid cells for current move
+        empty = FULL_MASK & ~self.state.occupied
+        if self.state.current_num == 1:
+            return empty
+        last_row, last_col = self.state.last_pos
+        return NEIGHBOR_MASKS[cell_index(last_row, last_col)] & empty
     
     def get_valid_cells(self):   #get list of all valid cells for current move
-        valid = []
-        for row in range(5):
-            for col in range(5):
-                is_valid, _ = self.is_valid_move(row, col)
-                if is_valid:
-                    valid.append((row, col))
-        return valid
+        return mask_to_cells(self.get_valid_mask())
     
     def place_number(self, row, col):   #place the current number at the given position
         valid, error = self.is_valid_move(row, col)
@@ -51,7 +54,7 @@ class Level1Logic:
             self.state.score += 1
         
         #place the number
-        self.state.board[row][col] = self.state.current_num
+        self.state.set_inner_cell(row, col, self.state.current_num)
         
         #update state
         self.state.last_pos = (row, col)
@@ -65,4 +68,10 @@ class Level1Logic:
         return (True, None)
     
     def has_valid_moves(self):   #check if there are any valid moves left
-        return len(self.get_valid_cells()) > 0
+        return self.get_valid_mask() != 0
+    
+    def is_completable(self):   #check if the current partial board can still be finished (unlike has_valid_moves)
+        if self.state.current_num > 25 or self.state.last_pos is None:
+            return True
+        last_row, last_col = self.state.last_pos
+        return can_complete(FULL_MASK & ~self.state.occupied, cell_index(last_row, last_col))
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+
+from .bitboard import (BOARD_SIZE, FULL_MASK, NEIGHBOR_MASKS, DIAGONAL_MASKS,
+                       CELL_POSITIONS, cell_index)
+from .level1_solver import is_alive
+
+NO_PATH = -1   #search result when the board cannot be completed
+
+#a diagonal step keeps the color of the square (row + col parity), an orthogonal step always flips it,
+#and a diagonal step always flips row parity, so these masks drive the upper bound
+EVEN_SQUARES = sum(1 << cell_index(row, col)
+                   for row in range(BOARD_SIZE) for col in range(BOARD_SIZE) if (row + col) % 2 == 0)
+ODD_SQUARES = FULL_MASK & ~EVEN_SQUARES
+EVEN_ROWS = sum(1 << cell_index(row, col)
+                for row in range(0, BOARD_SIZE, 2) for col in range(BOARD_SIZE))
+
+
+def _popcount(mask):
+    return bin(mask).count("1")
+
+
+def _min_runs(cells, end_bit=0):   #lower bound on diagonal-only paths needed to cover cells of one color
+    #end_bit marks a cell that must be an endpoint (the last placed number)
+    if not cells:
+        return 0
+
+    #each run alternates even/odd rows, so it can absorb at most one surplus cell
+    surplus = abs(_popcount(cells & EVEN_ROWS) - _popcount(cells & ~EVEN_ROWS))
+
+    #each diagonal component needs a run per pair of forced endpoints (leaves and end_bit)
+    runs = 0
+    remaining = cells
+    while remaining:
+        component = remaining & -remaining
+        frontier = component
+        while frontier:
+            grown = 0
+            while frontier:
+                low = frontier & -frontier
+                frontier ^= low
+                grown |= DIAGONAL_MASKS[low.bit_length() - 1]
+            frontier = grown & cells & ~component
+            component |= frontier
+        remaining &= ~component
+
+        if component & (component - 1) == 0:
+            runs += 1
+            continue
+        ends = 0
+        mask = component
+        while mask:
+            low = mask & -mask
+            mask ^= low
+            near = DIAGONAL_MASKS[low.bit_length() - 1] & component
+            if near & (near - 1) == 0 or low == end_bit:
+                ends += 1
+        runs += max(1, (ends + 1) // 2)
+
+    return max(surplus, runs)
+
+
+def score_upper_bound(free, last):   #admissible bound on diagonal points still available
+    moves = _popcount(free)
+    if not moves:
+        return 0
+    last_bit = 1 << last
+    same = EVEN_SQUARES if last_bit & EVEN_SQUARES else ODD_SQUARES
+
+    #runs alternate colors starting with the color of last, and every run after the first costs one orthogonal step
+    own_runs = _min_runs((free & same) | last_bit, last_bit)
+    other = free & ~same
+    if other:
+        runs = max(2 * own_runs - 1, 2 * _min_runs(other))
+    else:
+        runs = 2 * own_runs - 1
+    return moves - (runs - 1)
+
+
+class Level1Optimizer:
+    def __init__(self):
+        #(free mask, last index) -> (value, exact); inexact values are upper bounds
+        self._table = {}
+
+    def _search(self, free, last, alpha):   #fail-soft branch and bound on remaining diagonal points
+        #returns the exact best score if it is above alpha, otherwise an upper bound no greater than alpha
+        if not free:
+            return 0
+        key = (free, last)
+        entry = self._table.get(key)
+        if entry is not None:
+            value, exact = entry
+            if exact or value <= alpha:
+                return value
+
+        #order children by optimistic score so good completions are found first
+        children = []
+        moves = NEIGHBOR_MASKS[last] & free
+        diagonal = DIAGONAL_MASKS[last]
+        while moves:
+            low = moves & -moves
+            moves ^= low
+            rest = free ^ low
+            nxt = low.bit_length() - 1
+            if not is_alive(rest, nxt):
+                continue
+            gain = 1 if low & diagonal else 0
+            children.append((gain + score_upper_bound(rest, nxt), gain, rest, nxt))
+        children.sort(reverse=True)
+
+        best = NO_PATH
+        for bound, gain, rest, nxt in children:
+            floor = alpha if alpha > best else best
+            if bound <= floor:
+                if bound > best:
+                    best = bound   #keep the bound so an inexact result stays an upper bound
+                continue
+            value = self._search(rest, nxt, floor - gain)
+            if value != NO_PATH and value + gain > best:
+                best = value + gain
+
+        self._table[key] = (best, best > alpha)
+        return best
+
+    def _best_path(self, free, last):   #return (best remaining score, path of bit indexes) or (NO_PATH, [])
+        best = self._search(free, last, NO_PATH)
+        if best == NO_PATH:
+            return (NO_PATH, [])
+
+        path = []
+        target = best
+        while free:
+            diagonal = DIAGONAL_MASKS[last]
+            moves = NEIGHBOR_MASKS[last] & free
+            while moves:
+                low = moves & -moves
+                moves ^= low
+                rest = free ^ low
+                nxt = low.bit_length() - 1
+                gain = 1 if low & diagonal else 0
+                if not is_alive(rest, nxt):
+                    continue
+                if self._search(rest, nxt, target - gain - 1) == target - gain:
+                    break
+            path.append(nxt)
+            target -= gain
+            free = rest
+            last = nxt
+        return (best, path)
+
+    def best_completion(self, state):   #return (max final score, path) for a partial level 1 board
+        #path lists the cells for current_num, current_num + 1, ..., 25; returns (None, []) if no completion exists
+        free = FULL_MASK & ~state.occupied
+        if state.last_pos is None:
+            #nothing placed yet: "1" may go anywhere, and its placement never scores
+            best_score, best_path = None, []
+            for start in range(len(CELL_POSITIONS)):
+                score, path = self._best_path(free & ~(1 << start), start)
+                if score != NO_PATH and (best_score is None or score > best_score):
+                    best_score, best_path = score, [start] + path
+            if best_score is None:
+                return (None, [])
+            return (state.score + best_score, [CELL_POSITIONS[i] for i in best_path])
+
+        last = cell_index(*state.last_pos)
+        if not is_alive(free, last):
+            return (None, [])
+        score, path = self._best_path(free, last)
+        if score == NO_PATH:
+            return (None, [])
+        return (state.score + score, [CELL_POSITIONS[i] for i in path])
+
+    def max_score(self, state):   #best achievable final score, or None if the board cannot be completed
+        return self.best_completion(state)[0]
+
+    def clear_cache(self):   #drop the transposition table
+        self._table.clear()
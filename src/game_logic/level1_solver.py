@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+
+from contextlib import contextmanager
+from functools import lru_cache
+
+from .bitboard import (BOARD_SIZE, FULL_MASK, NEIGHBOR_MASKS, CELL_POSITIONS,
+                       cell_index, cell_pos)
+
+
+def is_alive(free, last):   #check if the free cells can still form one path starting next to last
+    #free is the mask of empty cells, last is the bit index of the last placed number
+    if not free:
+        return True
+    graph = free | (1 << last)
+
+    #connectivity: every free cell must be reachable from last through free cells
+    seen = 1 << last
+    frontier = seen
+    while frontier:
+        grown = 0
+        while frontier:
+            low = frontier & -frontier
+            frontier ^= low
+            grown |= NEIGHBOR_MASKS[low.bit_length() - 1]
+        frontier = grown & graph & ~seen
+        seen |= frontier
+    if seen != graph:
+        return False
+
+    #degree: a free cell with a single neighbor can only be the end of the path, so at most one is allowed
+    endpoints = 0
+    mask = free
+    while mask:
+        low = mask & -mask
+        mask ^= low
+        near = NEIGHBOR_MASKS[low.bit_length() - 1] & graph
+        if near & (near - 1) == 0:
+            endpoints += 1
+            if endpoints > 1:
+                return False
+    return True
+
+
+@lru_cache(maxsize=1 << 16)
+def can_complete(free, last):   #check if a path from last can still visit every free cell (cached per position)
+    if not free:
+        return True
+    if not is_alive(free, last):
+        return False
+    #try cells with the fewest onward moves first, which finds a witness path quickly
+    candidates = []
+    moves = NEIGHBOR_MASKS[last] & free
+    while moves:
+        low = moves & -moves
+        moves ^= low
+        nxt = low.bit_length() - 1
+        candidates.append((bin(NEIGHBOR_MASKS[nxt] & free).count("1"), nxt))
+    candidates.sort()
+    for _, nxt in candidates:
+        if can_complete(free & ~(1 << nxt), nxt):
+            return True
+    return False
+
+
+def _symmetric_cells(row, col):   #all images of a cell under the 8 symmetries of the square
+    last = BOARD_SIZE - 1
+    images = set()
+    for r, c in ((row, col), (col, row)):
+        images.add((r, c))
+        images.add((last - r, c))
+        images.add((r, last - c))
+        images.add((last - r, last - c))
+    return images
+
+
+class Level1Solver:
+    def __init__(self):
+        self._memo = {}   #(free mask, last index) -> number of completions, kept only while a query runs
+        self._depth = 0   #nesting of running queries (rate_start_cells calls count_completions)
+
+    @contextmanager
+    def _query(self):   #share the memo inside one query and free it when the outermost query ends
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                self._memo.clear()   #a full-board count leaves hundreds of MB of entries
+
+    def _count(self, free, last):   #count paths that visit every free cell starting next to last
+        if not free:
+            return 1
+        key = (free, last)
+        total = self._memo.get(key)
+        if total is not None:
+            return total
+
+        total = 0
+        moves = NEIGHBOR_MASKS[last] & free
+        while moves:
+            low = moves & -moves
+            moves ^= low
+            rest = free ^ low
+            nxt = low.bit_length() - 1
+            if is_alive(rest, nxt):
+                total += self._count(rest, nxt)
+
+        self._memo[key] = total
+        return total
+
+    def count_completions(self, start):   #count every legal 1..25 path with "1" at start (row, col)
+        index = cell_index(*start)
+        free = FULL_MASK & ~(1 << index)
+        if not is_alive(free, index):
+            return 0
+        with self._query():
+            return self._count(free, index)
+
+    def count_from_state(self, state):   #count completions of a partial level 1 board
+        free = FULL_MASK & ~state.occupied
+        with self._query():
+            if state.last_pos is None:
+                return sum(self.count_completions(CELL_POSITIONS[i]) for i in range(len(CELL_POSITIONS)))
+            last = cell_index(*state.last_pos)
+            if not is_alive(free, last):
+                return 0
+            return self._count(free, last)
+
+    def iter_completions(self, state, limit=None):   #yield completions of a partial board as lists of (row, col)
+        #each yielded list holds the cells for current_num, current_num + 1, ..., 25 in order
+        if state.last_pos is None:
+            return
+        free = FULL_MASK & ~state.occupied
+        last = cell_index(*state.last_pos)
+        if not is_alive(free, last):
+            return
+
+        path = []
+        found = 0
+        #iterative DFS: each stack entry is (free mask, last index, remaining candidate moves)
+        stack = [(free, last, NEIGHBOR_MASKS[last] & free)]
+        while stack:
+            free, last, moves = stack[-1]
+            if not free:
+                yield [CELL_POSITIONS[i] for i in path]
+                found += 1
+                if limit is not None and found >= limit:
+                    return
+                stack.pop()
+                if stack:
+                    path.pop()
+                continue
+            if not moves:
+                stack.pop()
+                if stack:
+                    path.pop()
+                continue
+            low = moves & -moves
+            stack[-1] = (free, last, moves ^ low)
+            rest = free ^ low
+            nxt = low.bit_length() - 1
+            if is_alive(rest, nxt):
+                path.append(nxt)
+                stack.append((rest, nxt, NEIGHBOR_MASKS[nxt] & rest))
+
+    def rate_start_cells(self):   #count completions for all 25 starts (symmetric starts are solved once)
+        counts = {}
+        with self._query():
+            for index in range(BOARD_SIZE * BOARD_SIZE):
+                start = cell_pos(index)
+                if start in counts:
+                    continue
+                count = self.count_completions(start)
+                for image in _symmetric_cells(*start):
+                    counts[image] = count
+        return {cell_pos(i): counts[cell_pos(i)] for i in range(BOARD_SIZE * BOARD_SIZE)}
+
+    def clear_cache(self):   #drop memoized counts (queries already free them when they return)
+        self._memo.clear()
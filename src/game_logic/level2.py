@@ -1,16 +1,16 @@
 #!/usr/bin/env python
 
+from .bitboard import (RING_INDEX, RING_CANDIDATES, RING_CANDIDATE_MASKS, FULL_RING_MASK,
+                       cell_index, ring_mask_to_cells)
+from .level2_matching import Level2Feasibility
 
 class Level2Logic:
     def __init__(self, game_state):
         self.state = game_state   #reference to shared game state
+        self.feasibility = Level2Feasibility(self)   #incremental matching of remaining numbers to ring cells
         
     def _get_inner_board_position(self, num):   #find position of number on inner 5x5 board
-        for row in range(5):
-            for col in range(5):
-                if self.state.board[row][col] == num:
-                    return (row, col)
-        return None
+        return self.state.get_number_position(num)
     
     def _inner_to_outer_coords(self, inner_row, inner_col):   #convert inner board coords to outer 7x7 coords
         #inner board is offset by 1 in the 7x7 grid
@@ -22,51 +22,19 @@ class Level2Logic:
     def _is_on_anti_diagonal(self, row, col):   #check if position is on anti-diagonal (top-right to bottom-left)
         return row + col == 4
     
-    def get_valid_ring_cells(self, num):   #get valid outer ring cells for placing a number
-        #find where this number is on the inner board
+    def get_candidate_ring_cells(self, inner_row, inner_col):   #all ring cells an inner cell's number may use, ignoring occupancy
+        #row ends, column ends, and diagonal corners if on a diagonal (precomputed in bitboard.RING_CANDIDATES)
+        return RING_CANDIDATES[cell_index(inner_row, inner_col)]
+    
+    def get_valid_ring_mask(self, num):   #get valid outer ring cells for a number as a ring bitmask
         inner_pos = self._get_inner_board_position(num)
         if inner_pos is None:
-            return []
-        
+            return 0
         inner_row, inner_col = inner_pos
-        valid_cells = []
-        
-        #row ends - can place at left or right edge of this row
-        #in 7x7 coords: row is inner_row + 1, cols are 0 and 6
-        left_cell = (inner_row + 1, 0)
-        right_cell = (inner_row + 1, 6)
-        
-        if self._is_ring_cell_empty(left_cell):
-            valid_cells.append(left_cell)
-        if self._is_ring_cell_empty(right_cell):
-            valid_cells.append(right_cell)
-            
-        #column ends - can place at top or bottom edge of this column
-        #in 7x7 coords: col is inner_col + 1, rows are 0 and 6
-        top_cell = (0, inner_col + 1)
-        bottom_cell = (6, inner_col + 1)
-        
-        if self._is_ring_cell_empty(top_cell):
-            valid_cells.append(top_cell)
-        if self._is_ring_cell_empty(bottom_cell):
-            valid_cells.append(bottom_cell)
-            
-        #diagonal corners (if on main or anti diagonal)
-        if self._is_on_main_diagonal(inner_row, inner_col):
-            #main diagonal corners: (0,0) and (6,6)
-            if self._is_ring_cell_empty((0, 0)):
-                valid_cells.append((0, 0))
-            if self._is_ring_cell_empty((6, 6)):
-                valid_cells.append((6, 6))
-                
-        if self._is_on_anti_diagonal(inner_row, inner_col):
-            #anti-diagonal corners: (0,6) and (6,0)
-            if self._is_ring_cell_empty((0, 6)):
-                valid_cells.append((0, 6))
-            if self._is_ring_cell_empty((6, 0)):
-                valid_cells.append((6, 0))
-                
-        return valid_cells
+        return RING_CANDIDATE_MASKS[cell_index(inner_row, inner_col)] & FULL_RING_MASK & ~self.state.ring_occupied
+    
+    def get_valid_ring_cells(self, num):   #get valid outer ring cells for placing a number
+        return ring_mask_to_cells(self.get_valid_ring_mask(num))
     
     def _is_ring_cell_empty(self, pos):   #check if a ring cell is empty
         return pos in self.state.outer_ring and self.state.outer_ring[pos] == 0
@@ -77,14 +45,14 @@ class Level2Logic:
         #check if it's a ring cell
         if pos not in self.state.outer_ring:
             return (False, "not_ring_cell")
+        bit = 1 << RING_INDEX[pos]
         
         #check if cell is empty
-        if self.state.outer_ring[pos] != 0:
+        if self.state.ring_occupied & bit:
             return (False, "cell_occupied")
         
         #check if this is a valid cell for the current number
-        valid_cells = self.get_valid_ring_cells(self.state.current_num)
-        if pos in valid_cells:
+        if self.get_valid_ring_mask(self.state.current_num) & bit:
             return (True, None)
         
         return (False, "invalid_position")
@@ -97,7 +65,7 @@ class Level2Logic:
         pos = (ring_row, ring_col)
         
         #place the number in the ring
-        self.state.outer_ring[pos] = self.state.current_num
+        self.state.set_ring_cell(pos, self.state.current_num)
         
         #update state
         self.state.last_pos = pos
@@ -107,11 +75,19 @@ class Level2Logic:
         #check win condition (all 24 cells filled = numbers 2-25 placed)
         if self.state.current_num > 25:
             self.state.win = True
+        
+        self.feasibility.update()
             
         return (True, None)
     
     def has_valid_moves(self):   #check if there are any valid moves for current number
-        return len(self.get_valid_ring_cells(self.state.current_num)) > 0
+        return self.get_valid_ring_mask(self.state.current_num) != 0
+    
+    def is_solvable(self):   #check if numbers current_num..25 can all still be placed in the ring
+        return self.feasibility.is_solvable()
+    
+    def get_solution(self):   #get [(num, ring_cell), ...] that completes the ring, or None if unsolvable
+        return self.feasibility.get_solution()
     
     def get_ring_cell_positions(self):   #get all ring cell positions for rendering
         return list(self.state.outer_ring.keys())
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+
+from collections import deque
+
+LAST_NUMBER = 25   #level 2 places 2..25 into the 24 ring cells
+
+
+class Level2Feasibility:
+    #maximum matching between numbers still to place and empty ring cells
+    #level 2 is solvable exactly when every remaining number is matched
+    def __init__(self, level2_logic):
+        self.logic = level2_logic
+        self.state = level2_logic.state
+        self._generation = None    #state.board_generation the graph was built for
+        self._version = None       #state.version the matching was last brought up to date with
+        self._cands = {}           #number -> candidate ring cells on this inner board (fixed per board)
+        self._placed = {}          #ring cell -> number, as last seen in state.outer_ring
+        self._edges = {}           #remaining number -> candidate ring cells
+        self._cell_of = {}         #remaining number -> matched ring cell
+        self._num_of = {}          #ring cell -> matched remaining number
+
+    def update(self):   #bring the matching in line with the board (call after place_number or undo)
+        if self.state.level != 2:
+            self._generation = None
+            self._version = None
+            self._cands = {}
+            self._placed = {}
+            self._edges = {}
+            self._cell_of = {}
+            self._num_of = {}
+            return
+
+        #a new inner board (level start, restore) means a new graph; otherwise only ring writes can differ
+        if self.state.board_generation != self._generation:
+            self._rebuild()
+            return
+        if self.state.version == self._version:
+            return
+        self._version = self.state.version
+
+        #apply only the ring cells that changed since the last update (removals first, so undo + replay works)
+        changed = [(cell, value, self._placed.get(cell, 0)) for cell, value in self.state.outer_ring.items()
+                   if value != self._placed.get(cell, 0)]
+        for cell, value, old in changed:
+            if old:
+                self._unplace(old, cell)
+        for cell, value, old in changed:
+            if value:
+                self._place(value, cell)
+        self._repair()
+
+    def _candidates(self, num):   #candidate ring cells for a number, from its inner board position
+        pos = self.logic._get_inner_board_position(num)
+        if pos is None:
+            return []
+        return self.logic.get_candidate_ring_cells(pos[0], pos[1])
+
+    def _rebuild(self):   #build the graph from scratch and run Hopcroft-Karp
+        self._generation = self.state.board_generation
+        self._version = self.state.version
+        self._cands = {num: self._candidates(num) for num in range(2, LAST_NUMBER + 1)}
+        self._placed = {cell: value for cell, value in self.state.outer_ring.items() if value}
+        used = set(self._placed)
+        placed_nums = set(self._placed.values())
+        self._edges = {}
+        for num in range(2, LAST_NUMBER + 1):
+            if num not in placed_nums:
+                self._edges[num] = [cell for cell in self._cands[num] if cell not in used]
+        self._cell_of = {}
+        self._num_of = {}
+        self._hopcroft_karp()
+
+    def _place(self, num, cell):   #number was placed on cell: drop both from the graph
+        self._placed[cell] = num
+        self._edges.pop(num, None)
+        matched = self._cell_of.pop(num, None)
+        if matched is not None:
+            del self._num_of[matched]
+        other = self._num_of.pop(cell, None)
+        if other is not None:
+            del self._cell_of[other]
+        for cells in self._edges.values():
+            if cell in cells:
+                cells.remove(cell)
+
+    def _unplace(self, num, cell):   #number was taken off cell (undo): add both back to the graph
+        del self._placed[cell]
+        for other, cells in self._edges.items():
+            if cell in self._cands[other]:
+                cells.append(cell)
+        used = set(self._placed)
+        self._edges[num] = [c for c in self._cands[num] if c not in used]
+
+    def _repair(self):   #re-augment any remaining number left unmatched by the last changes
+        for num in self._edges:
+            if num not in self._cell_of:
+                self._augment(num, set())
+
+    def _augment(self, num, visited):   #look for an augmenting path from an unmatched number (Kuhn step)
+        for cell in self._edges[num]:
+            if cell in visited:
+                continue
+            visited.add(cell)
+            owner = self._num_of.get(cell)
+            if owner is None or self._augment(owner, visited):
+                self._cell_of[num] = cell
+                self._num_of[cell] = num
+                return True
+        return False
+
+    def _hopcroft_karp(self):   #maximum matching in O(E * sqrt(V)) phases of shortest augmenting paths
+        while True:
+            #BFS layers from every free number
+            dist = {}
+            queue = deque()
+            for num in self._edges:
+                if num not in self._cell_of:
+                    dist[num] = 0
+                    queue.append(num)
+            found = False
+            while queue:
+                num = queue.popleft()
+                for cell in self._edges[num]:
+                    owner = self._num_of.get(cell)
+                    if owner is None:
+                        found = True
+                    elif owner not in dist:
+                        dist[owner] = dist[num] + 1
+                        queue.append(owner)
+            if not found:
+                return
+
+            #DFS along the layers, vertex-disjoint augmenting paths only
+            def layered_augment(num):
+                for cell in self._edges[num]:
+                    owner = self._num_of.get(cell)
+                    if owner is None or (dist.get(owner) == dist[num] + 1 and layered_augment(owner)):
+                        self._cell_of[num] = cell
+                        self._num_of[cell] = num
+                        return True
+                dist[num] = None
+                return False
+
+            for num in list(self._edges):
+                if num not in self._cell_of:
+                    layered_augment(num)
+
+    def is_solvable(self):   #check if the remaining numbers can all still be placed
+        self.update()
+        if self.state.level != 2:
+            return False
+        return len(self._cell_of) == len(self._edges)
+
+    def get_solution(self):   #return [(num, ring_cell), ...] in placement order, or None if unsolvable
+        if not self.is_solvable():
+            return None
+        return sorted(self._cell_of.items())
@@ -1,3 +1,24 @@
-from .window import GameWindow
-from .board_renderer import BoardRenderer
+import importlib
+
 from .colors import *
+
+#window, renderer and audio import pygame, so they are loaded on first access (PEP 562 module __getattr__);
+#"from gui.colors import ..." or "gui.text_cache" stay pygame-free
+_LAZY_ATTRS = {
+    "GameWindow": ".window",
+    "BoardRenderer": ".board_renderer",
+    "AudioManager": ".audio",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value   #later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+import threading
+from pathlib import Path
+
+import pygame
+
+#sound files live at the repository root, resolved from this file so the game can start from any directory
+ASSET_DIR = Path(__file__).resolve().parents[2]
+
+SOUND_FILES = {
+    "valid": "Sprint1Story2.wav",     #valid placement (user story 2)
+    "invalid": "Sprint1Story6.wav",   #invalid placement (user story 6)
+}
+
+
+class AudioManager:
+    #mixer init and sound decoding happen off the main thread, after the window is up
+    #play() never blocks: until loading finishes, or if there is no audio device, it does nothing
+    def __init__(self, sound_files=None, asset_dir=ASSET_DIR, channels=8, background=True):
+        self.sound_files = dict(SOUND_FILES if sound_files is None else sound_files)
+        self.asset_dir = Path(asset_dir)
+        self.channels = channels          #channel pool size, so rapid clicks overlap instead of cutting each other off
+        self.background = background      #load on a daemon thread (False: load synchronously in start)
+        self.sounds = {}                  #name -> pygame.mixer.Sound, filled once loading finishes
+        self.enabled = True               #False when the mixer could not be initialized
+        self._ready = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):   #begin mixer init and sound loading (only the first call does anything)
+        with self._lock:
+            if self._thread is not None or self._ready.is_set():
+                return
+            if self.background:
+                self._thread = threading.Thread(target=self._load, name="audio-loader", daemon=True)
+                self._thread.start()
+                return
+        self._load()
+
+    def _load(self):
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init(44100, -16, 2, 2048)
+            pygame.mixer.set_num_channels(self.channels)
+        except pygame.error:
+            self.enabled = False   #no audio device: stay silent
+            self._ready.set()
+            return
+
+        sounds = {}
+        for name, filename in self.sound_files.items():
+            try:
+                sounds[name] = pygame.mixer.Sound(str(self.asset_dir / filename))
+            except (pygame.error, OSError):
+                pass   #missing or unreadable file: that sound stays silent
+        self.sounds = sounds
+        self._ready.set()
+
+    def is_ready(self):
+        return self._ready.is_set()
+
+    def wait_ready(self, timeout=None):   #block until loading finished (for tests and shutdown)
+        return self._ready.wait(timeout)
+
+    def play(self, name):   #play a sound on a free channel; returns False if nothing was played
+        if not self._ready.is_set():
+            self.start()
+            return False
+        sound = self.sounds.get(name)
+        if sound is None:
+            return False
+        channel = pygame.mixer.find_channel(True)   #all busy: reuse the longest-playing channel rather than queueing
+        if channel is None:
+            return False
+        channel.play(sound)
+        return True
+
+    def close(self, timeout=1.0):   #wait briefly for the loader, then release the mixer
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self.sounds = {}
+        if pygame.mixer.get_init():
+            pygame.mixer.quit()
@@ -2,6 +2,7 @@
 
 import pygame
 from .colors import *
+from .text_cache import TextCache
 
 
 class BoardRenderer:
@@ -13,11 +14,30 @@ class BoardRenderer:
         self.font = None
         self.small_font = None
         self.title_font = None
+        self.text_cache = TextCache()   #rendered text surfaces reused across frames
+        self._cell_rects = None         #7x7 grid of cell rects for the current offsets (see _update_cell_rects)
+        self._rects_offset_x = None
+        self._rects_offset_y = None
+        self._update_cell_rects()
         
     def init_fonts(self):   #initialize fonts (must be called after pygame.init)
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         self.title_font = pygame.font.Font(None, 32)
+        self._prewarm_text()
+        
+    def _prewarm_text(self):   #render every board number and header label once so steady frames never call font.render
+        self.text_cache.clear()
+        numbers = [str(num) for num in range(0, 27)]
+        self.text_cache.prewarm(self.font, numbers[1:26], TEXT_BLUE)          #inner board numbers
+        self.text_cache.prewarm(self.font, numbers[1:26], TEXT_DARK)          #ring numbers
+        self.text_cache.prewarm(self.small_font, ["SCORE", "NEXT NUMBER", "LEVEL"], HEADER_LABEL)
+        self.text_cache.prewarm(self.title_font, numbers[0:25], SCORE_COLOR)  #score values
+        self.text_cache.prewarm(self.title_font, numbers[1:27], TEXT_DARK)    #next number values
+        self.text_cache.prewarm(self.title_font, ["1", "2"], LEVEL_COLOR)     #level values
+        
+    def _text(self, font, text, color):   #get a (cached) rendered text surface
+        return self.text_cache.render(font, text, color)
         
     def center_board(self, level):
         #calculate board offsets to center the board
@@ -44,9 +64,29 @@ class BoardRenderer:
             #level 2: position the full 7x7 grid centered
             self.board_offset_x = base_offset_x
             self.board_offset_y = base_offset_y
+        self._update_cell_rects()
+        
+    def _update_cell_rects(self):   #rebuild the cached cell rects, only when the board offsets actually moved
+        if self.board_offset_x == self._rects_offset_x and self.board_offset_y == self._rects_offset_y:
+            return
+        self._rects_offset_x = self.board_offset_x
+        self._rects_offset_y = self.board_offset_y
+        self._cell_rects = [[pygame.Rect(self.board_offset_x + grid_col * self.cell_size,
+                                         self.board_offset_y + grid_row * self.cell_size,
+                                         self.cell_size, self.cell_size)
+                             for grid_col in range(7)]
+                            for grid_row in range(7)]
         
     def draw_header_bar(self, score, current_num, level, width):
         #draw header bar with score, next number, and level
+        self.draw_header_background(width)
+        self.draw_header_values(score, current_num, level, width)
+        
+    def header_rect(self, width):   #area covered by the header bar, including its bottom border
+        return pygame.Rect(0, 0, width, 62)
+        
+    def draw_header_background(self, width):
+        #draw the static part of the header: background, bottom border and labels
         header_height = 60
         
         #draw header background
@@ -56,24 +96,38 @@ class BoardRenderer:
         #draw bottom border
         pygame.draw.line(self.screen, GRID_LINE, (0, header_height), (width, header_height), 2)
         
-        #score section (left)
-        score_label = self.small_font.render("SCORE", True, HEADER_LABEL)
-        score_value = self.title_font.render(str(score), True, SCORE_COLOR)
-        self.screen.blit(score_label, (30, 12))
-        self.screen.blit(score_value, (30, 32))
+        #labels: score (left), next number (center), level (right)
+        self.screen.blit(self._text(self.small_font, "SCORE", HEADER_LABEL), (30, 12))
+        self.screen.blit(self._text(self.small_font, "NEXT NUMBER", HEADER_LABEL), (width // 2 - 65, 12))
+        self.screen.blit(self._text(self.small_font, "LEVEL", HEADER_LABEL), (width - 80, 12))
         
-        #next number section (center)
-        next_label = self.small_font.render("NEXT NUMBER", True, HEADER_LABEL)
-        next_value = self.title_font.render(str(current_num), True, TEXT_DARK)
-        self.screen.blit(next_label, (width // 2 - 65, 12))
+    def draw_header_values(self, score, current_num, level, width):
+        #draw the changing header values over the header background
+        score_value = self._text(self.title_font, str(score), SCORE_COLOR)
+        next_value = self._text(self.title_font, str(current_num), TEXT_DARK)
+        level_value = self._text(self.title_font, str(level), LEVEL_COLOR)
+        self.screen.blit(score_value, (30, 32))
         self.screen.blit(next_value, (width // 2 - 15, 32))
-        
-        #level section (right)
-        level_label = self.small_font.render("LEVEL", True, HEADER_LABEL)
-        level_value = self.title_font.render(str(level), True, LEVEL_COLOR)
-        self.screen.blit(level_label, (width - 80, 12))
         self.screen.blit(level_value, (width - 62, 32))
         
+    def draw_static_layer(self, target, level, inner_board, width):
+        #draw everything that does not change within a level onto target (background cache)
+        screen = self.screen
+        self.screen = target
+        try:
+            target.fill(WHITE)
+            self.draw_header_background(width)
+            if level == 2:
+                #inner board is locked in level 2
+                for row in range(5):
+                    for col in range(5):
+                        self._draw_inner_cell_level2(row, col, inner_board[row][col])
+        finally:
+            self.screen = screen
+            
+    def cell_rect(self, grid_row, grid_col):   #screen rect of a cell in the current level's grid (shared, do not modify)
+        return self._cell_rects[grid_row][grid_col]
+        
     def draw_level1_board(self, board, last_pos=None, hover_cell=None):
         #draw 5x5 board for level 1
         for row in range(5):
@@ -98,10 +152,8 @@ class BoardRenderer:
                 self._draw_inner_cell_level2(row, col, inner_board[row][col])
                 
     def _draw_cell(self, row, col, value, is_last=False, is_hover=False):
-        #calculate cell position
-        x = self.board_offset_x + col * self.cell_size
-        y = self.board_offset_y + row * self.cell_size
-        rect = pygame.Rect(x, y, self.cell_size, self.cell_size)
+        #cell position (precomputed for the current offsets)
+        rect = self._cell_rects[row][col]
         
         #determine cell color
         if is_hover and value == 0:
@@ -119,20 +171,17 @@ class BoardRenderer:
         
         #draw number if cell is filled (blue text for inner board)
         if value != 0:
-            text = self.font.render(str(value), True, TEXT_BLUE)
+            text = self._text(self.font, str(value), TEXT_BLUE)
             text_rect = text.get_rect(center=rect.center)
             self.screen.blit(text, text_rect)
             
     def _is_corner_cell(self, ring_row, ring_col):
         #check if cell is a corner of the 7x7 grid
-        corners = [(0, 0), (0, 6), (6, 0), (6, 6)]
-        return (ring_row, ring_col) in corners
+        return (ring_row == 0 or ring_row == 6) and (ring_col == 0 or ring_col == 6)
         
     def _draw_ring_cell(self, ring_row, ring_col, value, is_hover=False, is_corner=False):
-        #calculate position in 7x7 grid
-        x = self.board_offset_x + ring_col * self.cell_size
-        y = self.board_offset_y + ring_row * self.cell_size
-        rect = pygame.Rect(x, y, self.cell_size, self.cell_size)
+        #position in 7x7 grid
+        rect = self._cell_rects[ring_row][ring_col]
         
         #determine cell color
         if is_hover and value == 0:
@@ -150,18 +199,13 @@ class BoardRenderer:
         
         #draw number if cell is filled
         if value != 0:
-            text = self.font.render(str(value), True, TEXT_DARK)
+            text = self._text(self.font, str(value), TEXT_DARK)
             text_rect = text.get_rect(center=rect.center)
             self.screen.blit(text, text_rect)
             
     def _draw_inner_cell_level2(self, inner_row, inner_col, value):
         #inner board is offset by 1 in 7x7 grid
-        grid_row = inner_row + 1
-        grid_col = inner_col + 1
-        
-        x = self.board_offset_x + grid_col * self.cell_size
-        y = self.board_offset_y + grid_row * self.cell_size
-        rect = pygame.Rect(x, y, self.cell_size, self.cell_size)
+        rect = self._cell_rects[inner_row + 1][inner_col + 1]
         
         #inner board cells are locked in level 2
         pygame.draw.rect(self.screen, INNER_BOARD_LOCKED, rect)
@@ -169,7 +213,7 @@ class BoardRenderer:
         
         #draw number (blue text for inner board)
         if value != 0:
-            text = self.font.render(str(value), True, TEXT_BLUE)
+            text = self._text(self.font, str(value), TEXT_BLUE)
             text_rect = text.get_rect(center=rect.center)
             self.screen.blit(text, text_rect)
             
@@ -189,23 +233,29 @@ class BoardRenderer:
         
     def draw_score(self, score, x=50, y=50):
         #draw score display
-        text = self.font.render("Score: %d" % score, True, TEXT_DARK)
+        text = self._text(self.font, "Score: %d" % score, TEXT_DARK)
         self.screen.blit(text, (x, y))
         
     def draw_next_number(self, num, x=250, y=50):
         #draw next number indicator
-        text = self.font.render("Next: %d" % num, True, TEXT_DARK)
+        text = self._text(self.font, "Next: %d" % num, TEXT_DARK)
         self.screen.blit(text, (x, y))
         
     def draw_level_indicator(self, level, x=400, y=50):
         #draw current level
-        text = self.font.render("Level %d" % level, True, TEXT_DARK)
+        text = self._text(self.font, "Level %d" % level, TEXT_DARK)
         self.screen.blit(text, (x, y))
         
+    def message_rect(self, y=None):   #area used by draw_message, for partial redraws
+        if y is None:
+            y = self.screen.get_height() - 115
+        height = self.font.get_height() + 4
+        return pygame.Rect(0, y - height // 2, self.screen.get_width(), height)
+        
     def draw_message(self, msg, y=None):
         #draw message between board and buttons
         if y is None:
             y = self.screen.get_height() - 115   #position above buttons
-        text = self.font.render(msg, True, TEXT_DARK)
+        text = self._text(self.font, msg, TEXT_DARK)
         text_rect = text.get_rect(center=(self.screen.get_width() // 2, y))
         self.screen.blit(text, text_rect)
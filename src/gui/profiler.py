@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+
+import json
+import os
+import time
+from array import array
+
+PROFILE_ENV = "MATRIX_GAME_PROFILE"           #set to 1 (default file) or to a dump file path to profile GameWindow
+DEFAULT_DUMP_PATH = "frame_profile.json"
+
+#BoardRenderer methods timed when a profiler is attached to a window
+RENDERER_PHASES = (
+    "draw_static_layer", "draw_header_bar", "draw_header_background", "draw_header_values",
+    "draw_level1_board", "draw_level2_board", "_draw_cell", "_draw_ring_cell",
+    "_draw_inner_cell_level2", "draw_message",
+)
+
+
+class RingBuffer:
+    #fixed-size buffer of float samples; once full, each new sample overwrites the oldest
+    def __init__(self, size):
+        self.size = size
+        self.samples = array("d", bytes(8 * size))
+        self.count = 0   #samples ever added (may exceed size)
+
+    def add(self, value):
+        self.samples[self.count % self.size] = value
+        self.count += 1
+
+    def values(self):   #samples currently held, oldest first
+        if self.count <= self.size:
+            return self.samples[:self.count].tolist()
+        start = self.count % self.size
+        return (self.samples[start:] + self.samples[:start]).tolist()
+
+    def clear(self):
+        self.count = 0
+
+    def __len__(self):
+        return min(self.count, self.size)
+
+
+def percentile(sorted_values, pct):   #nearest-rank percentile of an ascending list
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))   #ceil(n * pct / 100)
+    return sorted_values[int(rank) - 1]
+
+
+class FrameProfiler:
+    #per-phase timings in ring buffers; methods are timed by replacing them on the instance,
+    #so a window without a profiler runs the plain methods and pays nothing
+    def __init__(self, size=2048, path=DEFAULT_DUMP_PATH):
+        self.size = size                #samples kept per phase
+        self.path = path                #where dump() writes by default
+        self.phases = {}                #phase name -> RingBuffer of durations in seconds
+        self._wrapped = []              #(object, method name) pairs to restore in detach
+
+    def buffer(self, phase):
+        buf = self.phases.get(phase)
+        if buf is None:
+            buf = self.phases[phase] = RingBuffer(self.size)
+        return buf
+
+    def record(self, phase, seconds):
+        self.buffer(phase).add(seconds)
+
+    def reset(self):   #drop all samples (buffers stay in place, the wrappers keep writing to them)
+        for buf in self.phases.values():
+            buf.clear()
+
+    def wrap(self, obj, method_name, phase=None):   #time every call of obj.method_name under phase
+        original = getattr(obj, method_name)
+        add = self.buffer(phase or method_name).add
+        perf_counter = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                add(perf_counter() - start)
+
+        timed.__wrapped__ = original
+        setattr(obj, method_name, timed)
+        self._wrapped.append((obj, method_name))
+
+    def attach(self, window):   #time a GameWindow's frame phases and its renderer's draw calls
+        self.wrap(window, "_frame", "frame")
+        self.wrap(window, "_handle_events", "handle_events")
+        self.wrap(window, "_update", "update")
+        self.wrap(window, "_draw", "draw")
+        for name in RENDERER_PHASES:
+            self.wrap(window.renderer, name, "renderer." + name.lstrip("_"))
+
+    def detach(self):   #restore the original (class) methods
+        for obj, method_name in reversed(self._wrapped):
+            delattr(obj, method_name)
+        self._wrapped = []
+
+    def summary(self):   #phase -> count, mean, p50/p95/p99 and max in milliseconds (over the buffered window)
+        result = {}
+        for phase, buf in self.phases.items():
+            values = sorted(buf.values())
+            if not values:
+                continue
+            result[phase] = {
+                "count": buf.count,
+                "mean_ms": sum(values) / len(values) * 1000,
+                "p50_ms": percentile(values, 50) * 1000,
+                "p95_ms": percentile(values, 95) * 1000,
+                "p99_ms": percentile(values, 99) * 1000,
+                "max_ms": values[-1] * 1000,
+            }
+        return result
+
+    def dump(self, path=None):   #write the summary as JSON and return the path
+        path = path or self.path
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=2, sort_keys=True)
+        return path
+
+    def format_summary(self):   #summary as an aligned text table
+        lines = ["%-32s %8s %9s %9s %9s %9s" % ("phase", "count", "p50 ms", "p95 ms", "p99 ms", "max ms")]
+        for phase, stats in sorted(self.summary().items()):
+            lines.append("%-32s %8d %9.3f %9.3f %9.3f %9.3f" % (
+                phase, stats["count"], stats["p50_ms"], stats["p95_ms"], stats["p99_ms"], stats["max_ms"]))
+        return "\n".join(lines)
+
+
+def profiler_from_env(environ=None):   #FrameProfiler if MATRIX_GAME_PROFILE is set (1 = default dump path), else None
+    value = (os.environ if environ is None else environ).get(PROFILE_ENV, "")
+    if value in ("", "0"):
+        return None
+    return FrameProfiler(path=DEFAULT_DUMP_PATH if value == "1" else value)
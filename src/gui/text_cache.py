@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+
+from collections import OrderedDict
+
+
+class TextCache:
+    #bounded LRU cache of rendered text surfaces keyed by (font, text, color)
+    #font.render is the costliest call in a frame, and board text rarely changes
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color):   #return a cached antialiased surface, rendering it on first use
+        key = (font, text, color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)   #evict least recently used
+        return surface
+
+    def prewarm(self, font, texts, color):   #render a batch of texts ahead of the first frame
+        for text in texts:
+            self.render(font, text, color)
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def __len__(self):
+        return len(self._surfaces)
@@ -2,15 +2,11 @@
 
 import pygame
 import sys
+from .audio import AudioManager
 from .board_renderer import BoardRenderer
+from .profiler import profiler_from_env
 from .colors import *
 
-#sound effects for User Story 2 and 6
-pygame.mixer.init(44100, -16, 2, 2048)
-
-valid_sound = pygame.mixer.Sound("Sprint1Story2.wav")
-invalid_sound = pygame.mixer.Sound("Sprint1Story6.wav")
-
 
 class Button:
     def __init__(self, x, y, width, height, text, font, danger=False):
@@ -19,22 +15,31 @@ class Button:
         self.font = font
         self.is_hovered = False
         self.danger = danger    #use red color for danger buttons like Quit
+        self._faces = self._render_faces()   #[normal, hovered] pre-rendered once, blitted every frame
         
-    def draw(self, screen):
-        #determine button color
+    def _render_faces(self):
+        #determine button colors (normal, hovered)
         if self.danger:
-            color = BUTTON_DANGER_HOVER if self.is_hovered else BUTTON_DANGER
+            colors = (BUTTON_DANGER, BUTTON_DANGER_HOVER)
         else:
-            color = BUTTON_HOVER if self.is_hovered else BUTTON_NORMAL
+            colors = (BUTTON_NORMAL, BUTTON_HOVER)
             
-        #draw button
-        pygame.draw.rect(screen, color, self.rect, border_radius=5)
-        pygame.draw.rect(screen, DARK_GRAY, self.rect, 2, border_radius=5)
-        
-        #draw text
+        faces = []
         text_surface = self.font.render(self.text, True, BUTTON_TEXT)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        for color in colors:
+            #draw button onto a transparent surface so the rounded corners show the background
+            face = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            local_rect = face.get_rect()
+            pygame.draw.rect(face, color, local_rect, border_radius=5)
+            pygame.draw.rect(face, DARK_GRAY, local_rect, 2, border_radius=5)
+            
+            #draw text
+            face.blit(text_surface, text_surface.get_rect(center=local_rect.center))
+            faces.append(face)
+        return faces
+        
+    def draw(self, screen):
+        screen.blit(self._faces[self.is_hovered], self.rect)
         
     def check_hover(self, mouse_pos):
         self.is_hovered = self.rect.collidepoint(mouse_pos)
@@ -45,13 +50,15 @@ class Button:
 
 
 class GameWindow:
-    def __init__(self, width=600, height=720):
-        pygame.init()
+    def __init__(self, width=600, height=720, dirty_rendering=True, event_driven=True, profiler=None):
+        #only video and fonts up front; the mixer is started by AudioManager in the background
+        pygame.display.init()
+        pygame.font.init()
         self.width = width
         self.height = height
         self.screen = pygame.display.set_mode((width, height))
         pygame.display.set_caption("Matrix Game - Level 1")
-        self.clock = pygame.time.Clock()
+        self.clock = pygame.time.Clock()   #also starts the SDL timer that pygame.time.get_ticks reads
         self.running = True
         
         #initialize renderer
@@ -72,9 +79,32 @@ class GameWindow:
         self.message = ""
         self.message_timer = 0
         
+        #dirty rendering: redraw only changed regions over a cached static layer
+        self.dirty_rendering = dirty_rendering
+        self._background = pygame.Surface((width, height))
+        self._layout_key = None   #(level, board generation) the background was drawn for
+        self._drawn = {}          #region -> signature of what is currently on screen
+        self._seen = None         #(state, version, ...) of the last drawn frame, see _frame_unchanged
+        
+        #win screen overlay, allocated once and reused every frame
+        self._overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        self._overlay.fill((0, 0, 0, 128))
+        
+        #event-driven loop: sleep in pygame.event.wait until input or a message timer is due
+        self.event_driven = event_driven
+        
         #create buttons
         self._create_buttons()
         
+        #sound effects for User Story 2 and 6 (loaded in the background once the first frame is up,
+        #silent if there is no audio device)
+        self.audio = AudioManager()
+        
+        #opt-in frame profiling (a FrameProfiler, or MATRIX_GAME_PROFILE=1|path); when off nothing is wrapped
+        self.profiler = profiler if profiler is not None else profiler_from_env()
+        if self.profiler is not None:
+            self.profiler.attach(self)
+        
     def _create_buttons(self):
         #buttons at bottom of screen - centered layout
         btn_width = 90
@@ -96,6 +126,7 @@ class GameWindow:
         self.btn_quit = Button(quit_x, row2_y, btn_width, btn_height, "Quit", self.small_font, danger=True)
         
         self.buttons = [self.btn_undo, self.btn_clear, self.btn_quit]
+        self.hovered_button = None   #button under the mouse (buttons never overlap)
         
     def set_game_components(self, game_state, level1_logic, level2_logic):
         #set game components from main
@@ -110,21 +141,48 @@ class GameWindow:
         
     def run(self):
         #main game loop
+        self._update()
+        self._draw()          #first frame goes up before any audio work
+        self.audio.start()
         while self.running:
-            self._handle_events()
-            self._update()
-            self._draw()
-            self.clock.tick(60)
+            events = self._wait_for_events() if self.event_driven else None
+            self._frame(events)
+            self.clock.tick(60)   #caps the frame rate while input keeps arriving
             
+        if self.profiler is not None:
+            print("Frame profile written to %s" % self.profiler.dump())
+            print(self.profiler.format_summary())
+        self.audio.close()
         pygame.quit()
         sys.exit()
         
-    def _handle_events(self):
+    def _frame(self, events=None):   #one loop iteration's work: input, state update, drawing
+        self._handle_events(events)
+        self._update()
+        self._draw()
+        
+    def _event_timeout(self):   #ms until the next timed change (message expiry), or 0 to wait for input only
+        if not self.message:
+            return 0
+        return max(1, self.message_timer - pygame.time.get_ticks() + 1)
+        
+    def _wait_for_events(self):   #block until input arrives or a timer is due, then return all pending events
+        event = pygame.event.wait(self._event_timeout())
+        events = pygame.event.get()
+        if event.type != pygame.NOEVENT:
+            events.insert(0, event)
+        return events
+        
+    def _handle_events(self, events=None):
+        if events is None:
+            events = pygame.event.get()
         mouse_pos = pygame.mouse.get_pos()
         
         #update hover state for buttons
+        self.hovered_button = None
         for btn in self.buttons:
-            btn.check_hover(mouse_pos)
+            if btn.check_hover(mouse_pos):
+                self.hovered_button = btn
             
         #update hover cell
         if self.game_state.level == 1:
@@ -132,10 +190,13 @@ class GameWindow:
         else:
             self.hover_cell = self.renderer.get_cell_at_pos(mouse_pos[0], mouse_pos[1], level=2)
             
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
                 
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self._layout_key = None   #window contents were lost, redraw everything
+                
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:   #left click
                     self._handle_click(mouse_pos)
@@ -143,6 +204,9 @@ class GameWindow:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
+                elif event.key == pygame.K_F12 and self.profiler is not None:
+                    self.profiler.dump()
+                    self.show_message("Frame profile saved!")
                     
     def _handle_click(self, mouse_pos):
         #check button clicks
@@ -179,19 +243,22 @@ class GameWindow:
         success, error = self.level1_logic.place_number(row, col)
         
         if success:
-            #placeholder for sound (story 2)
-            valid_sound.play()
+            #sound for valid placement (story 2)
+            self.audio.play("valid")
+            #warn as soon as the board can no longer be finished
+            if not self.level1_logic.is_completable():
+                self.show_message("Dead end! Undo or Clear to continue.")
         else:
-            #placeholder for error sound (story 6)
+            #error sound (story 6)
             if error == "out_of_bounds":
                 self.show_message("Cell is out of bounds!")
-                invalid_sound.play()
+                self.audio.play("invalid")
             elif error == "cell_occupied":
                 self.show_message("Cell is already occupied!")
-                invalid_sound.play()
+                self.audio.play("invalid")
             elif error == "not_adjacent":
                 self.show_message("Must be adjacent to previous number!")
-                invalid_sound.play()
+                self.audio.play("invalid")
                 
     def _handle_level2_click(self, cell):
         ring_row, ring_col = cell
@@ -204,19 +271,19 @@ class GameWindow:
         success, error = self.level2_logic.place_number(ring_row, ring_col)
         
         if success:
-            #placeholder for sound (story 2)
-            valid_sound.play()
+            #sound for valid placement (story 2)
+            self.audio.play("valid")
         else:
-            #placeholder for error sound (story 6)
+            #error sound (story 6)
             if error == "not_ring_cell":
                 self.show_message("Click on the outer ring!")
-                invalid_sound.play()
+                self.audio.play("invalid")
             elif error == "cell_occupied":
                 self.show_message("Cell is already occupied!")
-                invalid_sound.play()
+                self.audio.play("invalid")
             elif error == "invalid_position":
                 self.show_message("Invalid position for this number!")
-                invalid_sound.play()
+                self.audio.play("invalid")
                 
     def _update(self):
         #update game state
@@ -245,6 +312,13 @@ class GameWindow:
         pygame.display.set_caption("Matrix Game - Level %d" % self.game_state.level)
         
     def _draw(self):
+        if self.dirty_rendering:
+            self._draw_dirty()
+        else:
+            self._draw_full()
+            pygame.display.flip()
+            
+    def _draw_full(self):
         #clear screen
         self.screen.fill(WHITE)
         
@@ -285,17 +359,119 @@ class GameWindow:
         if self.game_state.win and self.game_state.level == 2:
             self._draw_win_screen()
             
-        pygame.display.flip()
+    def _draw_dirty(self):
+        #redraw only regions whose content changed, then push just those rects to the display
+        state = self.game_state
+        renderer = self.renderer
+        if self._frame_unchanged():
+            return
+        self._remember_frame()
+        
+        #rebuild the static layer when the level (and so the layout) changes
+        layout_key = (state.level, state.board_generation)
+        full = layout_key != self._layout_key
+        if full:
+            self._layout_key = layout_key
+            renderer.center_board(state.level)
+            renderer.draw_static_layer(self._background, state.level, state.board, self.width)
+            self._drawn = {}
+            
+        #the win overlay dims everything, so while it is up any change means a full redraw
+        if state.win and state.level == 2:
+            signature = (state.score, state.current_num, self.hover_cell, self.message, self.hovered_button)
+            if full or self._drawn.get("win") != signature:
+                self._draw_full()
+                self._drawn = {"win": signature}
+                pygame.display.flip()
+            return
+        if "win" in self._drawn:
+            self._drawn = {}
+            full = True
+            
+        if full:
+            self.screen.blit(self._background, (0, 0))
+        dirty = []
+        
+        #header values
+        signature = (state.score, state.current_num, state.level)
+        if self._drawn.get("header") != signature:
+            rect = renderer.header_rect(self.width)
+            self._restore(rect)
+            renderer.draw_header_values(state.score, state.current_num, state.level, self.width)
+            self._drawn["header"] = signature
+            dirty.append(rect)
+            
+        #board cells
+        hover = self.hover_cell
+        if state.level == 1:
+            last_pos = state.last_pos
+            for row in range(5):
+                for col in range(5):
+                    value = state.board[row][col]
+                    pos = (row, col)
+                    signature = (value, last_pos == pos, value == 0 and hover == pos)
+                    if self._drawn.get(pos) != signature:
+                        renderer._draw_cell(row, col, value, is_last=signature[1], is_hover=signature[2])
+                        self._drawn[pos] = signature
+                        dirty.append(renderer.cell_rect(row, col))
+        else:
+            for pos, value in state.outer_ring.items():
+                signature = (value, value == 0 and hover == pos)
+                if self._drawn.get(pos) != signature:
+                    ring_row, ring_col = pos
+                    renderer._draw_ring_cell(ring_row, ring_col, value, signature[1],
+                                             renderer._is_corner_cell(ring_row, ring_col))
+                    self._drawn[pos] = signature
+                    dirty.append(renderer.cell_rect(ring_row, ring_col))
+                    
+        #message strip
+        if self._drawn.get("message") != self.message:
+            rect = renderer.message_rect()
+            self._restore(rect)
+            if self.message:
+                renderer.draw_message(self.message)
+            self._drawn["message"] = self.message
+            dirty.append(rect)
+            
+        #buttons
+        for btn in self.buttons:
+            if self._drawn.get(btn) != btn.is_hovered:
+                self._restore(btn.rect)
+                btn.draw(self.screen)
+                self._drawn[btn] = btn.is_hovered
+                dirty.append(btn.rect)
+                
+        if full:
+            pygame.display.flip()
+        elif dirty:
+            pygame.display.update(dirty)
+            
+    def _frame_unchanged(self):   #True when nothing visible changed since the last frame
+        #compares plain attributes only, so an idle frame allocates nothing
+        seen = self._seen
+        if seen is None or self._layout_key is None:
+            return False
+        state = self.game_state
+        return (seen[0] is state and seen[1] == state.version and seen[2] == state.score
+                and seen[3] == state.current_num and seen[4] == state.level and seen[5] == state.win
+                and seen[6] == state.last_pos and seen[7] == self.hover_cell
+                and seen[8] == self.message and seen[9] is self.hovered_button)
+                
+    def _remember_frame(self):
+        state = self.game_state
+        self._seen = (state, state.version, state.score, state.current_num, state.level, state.win,
+                      state.last_pos, self.hover_cell, self.message, self.hovered_button)
+        
+    def _restore(self, rect):   #copy a region of the cached static layer back onto the screen
+        self.screen.blit(self._background, rect, rect)
         
     def _draw_win_screen(self):
         #draw semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._overlay, (0, 0))
         
         #draw win message
-        win_text = self.font.render("CONGRATULATIONS!", True, WHITE)
-        score_text = self.font.render("Final Score: %d" % self.game_state.score, True, WHITE)
+        win_text = self.renderer.text_cache.render(self.font, "CONGRATULATIONS!", WHITE)
+        score_text = self.renderer.text_cache.render(self.font, "Final Score: %d" % self.game_state.score, WHITE)
         
         self.screen.blit(win_text, win_text.get_rect(center=(self.width // 2, self.height // 2 - 30)))
         self.screen.blit(score_text, score_text.get_rect(center=(self.width // 2, self.height // 2 + 20)))
@@ -10,10 +10,12 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from game_logic.game_state import GameState
 from game_logic.level1 import Level1Logic
 from game_logic.level2 import Level2Logic
-from gui.window import GameWindow
 
 
 def main():
+    #imported here so that importing main (or game_logic) never loads pygame
+    from gui.window import GameWindow
+    
     #create game state
     game_state = GameState()
     
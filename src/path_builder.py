@@ -0,0 +1,101 @@
+# path_builder.py
+from __future__ import annotations
+
+import random
+from array import array
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sequential_placement_engine import SequentialPlacementEngine
+
+
+@dataclass
+class PathBuildResult:
+    success: bool
+    attempts: int
+    placed: int
+    engine: SequentialPlacementEngine
+
+
+@dataclass
+class WarnsdorffPathBuilder:
+    """
+    Builds a complete 1..N^2 Level 1 placement in linear time.
+
+    Each step moves to the free neighbor with the fewest free neighbors of its
+    own (Warnsdorff's rule), breaking ties toward the nearest wall so the path
+    does not strand edge cells. If an attempt gets stuck, it is retried from
+    the same start with random tie-breaking, up to max_attempts in total.
+    Moves go through SequentialPlacementEngine, so every placement is checked
+    by the real rules.
+    """
+    size: int = 5
+    max_attempts: int = 4
+    seed: Optional[int] = None
+    rng: random.Random = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.rng = random.Random(self.seed)
+
+    def build(self, one_pos: Optional[int] = None) -> PathBuildResult:
+        n = self.size * self.size
+        start = self.rng.randrange(n) if one_pos is None else one_pos
+        engine = None
+        placed = 0
+        for attempt in range(1, self.max_attempts + 1):
+            engine = SequentialPlacementEngine(size=self.size, enforce_adjacency=True)
+            engine.start_new_level1(one_pos=start)
+            placed = self._walk(engine, randomize=attempt > 1)
+            if placed == n:
+                return PathBuildResult(True, attempt, placed, engine)
+        return PathBuildResult(False, self.max_attempts, placed, engine)
+
+    def _walk(self, engine: SequentialPlacementEngine, randomize: bool) -> int:
+        """Extend the path from the engine's "1" as far as possible; return numbers placed."""
+        size = self.size
+        n = size * size
+        last = size - 1
+        rand = self.rng.random
+
+        # free-neighbor count per cell, updated as cells are taken
+        degree = array("b", [0]) * n
+        for idx in range(n):
+            row, col = divmod(idx, size)
+            rows = min(row + 1, last) - max(row - 1, 0) + 1
+            cols = min(col + 1, last) - max(col - 1, 0) + 1
+            degree[idx] = rows * cols - 1
+
+        board = engine.board
+        place = engine.try_place_on_cell
+
+        def take(idx: int) -> None:
+            row, col = divmod(idx, size)
+            for n_row in range(max(row - 1, 0), min(row + 1, last) + 1):
+                base = n_row * size
+                for n_col in range(max(col - 1, 0), min(col + 1, last) + 1):
+                    degree[base + n_col] -= 1
+
+        current = engine.one_pos
+        take(current)
+        placed = 1
+        while placed < n:
+            row, col = divmod(current, size)
+            best = -1
+            best_key = None
+            for n_row in range(max(row - 1, 0), min(row + 1, last) + 1):
+                base = n_row * size
+                wall_row = min(n_row, last - n_row)
+                for n_col in range(max(col - 1, 0), min(col + 1, last) + 1):
+                    idx = base + n_col
+                    if board[idx] != 0:
+                        continue
+                    key = (degree[idx], min(wall_row, n_col, last - n_col), rand() if randomize else 0.0)
+                    if best_key is None or key < best_key:
+                        best_key = key
+                        best = idx
+            if best < 0 or not place(best):
+                break
+            take(best)
+            current = best
+            placed += 1
+        return placed
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import random
+from array import array
 from dataclasses import dataclass, field
 from typing import Optional, Tuple, List
 
@@ -14,6 +15,16 @@ class PlacementResult:
     next_number: Optional[int] = None
 
 
+# Error messages are module constants so the validation path never builds strings
+MSG_INVALID_INDEX = "Invalid cell index."
+MSG_COMPLETE = "Game already complete."
+MSG_FILLED = "Cell already filled."
+MSG_NOT_ADJACENT = "Cell is not adjacent to the previous number."
+MSG_WRONG_LEVEL = "Not available on this level."
+MSG_NOT_RING = "Not an outer ring cell."
+MSG_INVALID_RING = "Ring cell is not allowed for this number."
+
+
 @dataclass
 class SequentialPlacementEngine:
     """
@@ -24,39 +35,172 @@ class SequentialPlacementEngine:
       - place_on_cell(cell_index)
       - is_complete()
       - get_board_snapshot()
+
+    Works for any size x size board. With enforce_adjacency=True each number
+    must be a king move away from the previous one (the Level 1 rule), and
+    start_level2() opens the (size + 2) x (size + 2) outer ring. Every move is
+    validated in O(1) on flat int arrays; try_place_on_cell/try_place_on_ring
+    are the allocation-free variants for simulations.
     """
     size: int = 5
-    board: List[int] = field(default_factory=list)
+    board: array = field(default_factory=lambda: array("i"))
     next_number: int = 2
     one_pos: int = 0
     level: int = 1
+    enforce_adjacency: bool = False
+    last_pos: int = -1
+    # number -> flat inner index, filled as numbers are placed
+    number_pos: array = field(default_factory=lambda: array("i"))
+    # Level 2 outer ring, indexed by ring_index()
+    ring: array = field(default_factory=lambda: array("i"))
 
-    def start_new_level1(self) -> None:
+    def start_new_level1(self, one_pos: Optional[int] = None) -> None:
         n = self.size * self.size
         self.level = 1
-        self.board = [0] * n
-        self.one_pos = random.randint(0, n - 1)
+        self.board = array("i", [0]) * n
+        self.number_pos = array("i", [-1]) * (n + 1)
+        self.ring = array("i")
+        self.one_pos = random.randint(0, n - 1) if one_pos is None else one_pos
         self.board[self.one_pos] = 1
+        self.number_pos[1] = self.one_pos
+        self.last_pos = self.one_pos
         self.next_number = 2
 
     def get_next_number(self) -> int:
         return self.next_number
 
-    def place_on_cell(self, idx: int) -> PlacementResult:
+    def check_cell(self, idx: int) -> Optional[str]:
+        """Return None if the next number may go on idx, else the error message."""
         n = self.size * self.size
         if idx < 0 or idx >= n:
-            return PlacementResult(False, "Invalid cell index.")
-
+            return MSG_INVALID_INDEX
+        if self.level != 1:
+            return MSG_WRONG_LEVEL
         if self.is_complete():
-            return PlacementResult(False, "Game already complete.")
-
+            return MSG_COMPLETE
         if self.board[idx] != 0:
-            return PlacementResult(False, "Cell already filled.")
+            return MSG_FILLED
+        if self.enforce_adjacency and self.last_pos >= 0:
+            size = self.size
+            last = self.last_pos
+            d_row = idx // size - last // size
+            d_col = idx % size - last % size
+            if d_row < -1 or d_row > 1 or d_col < -1 or d_col > 1:
+                return MSG_NOT_ADJACENT
+        return None
 
+    def try_place_on_cell(self, idx: int) -> bool:
+        """Place the next number on idx if valid; no result object is built."""
+        if self.check_cell(idx) is not None:
+            return False
         placed = self.next_number
         self.board[idx] = placed
+        self.number_pos[placed] = idx
+        self.last_pos = idx
+        self.next_number = placed + 1
+        return True
+
+    def place_on_cell(self, idx: int) -> PlacementResult:
+        error = self.check_cell(idx)
+        if error is not None:
+            return PlacementResult(False, error)
+
+        placed = self.next_number
+        self.try_place_on_cell(idx)
+
+        return PlacementResult(
+            True,
+            f"Placed {placed}.",
+            placed_number=placed,
+            next_number=self.next_number
+        )
+
+    # --- Level 2: outer ring -------------------------------------------------
+
+    def ring_size(self) -> int:
+        # top and bottom rows of size + 2, plus left and right columns of size
+        return 4 * (self.size + 1)
+
+    def last_ring_number(self) -> int:
+        # Numbers 2.. are placed until the ring is full (25 for the 5x5 game)
+        return min(self.size * self.size, self.ring_size() + 1)
+
+    def ring_index(self, ring_row: int, ring_col: int) -> int:
+        """Flat ring index for (ring_row, ring_col) in (size + 2)^2 coords, or -1."""
+        edge = self.size + 1
+        if ring_row == 0 and 0 <= ring_col <= edge:
+            return ring_col
+        if ring_row == edge and 0 <= ring_col <= edge:
+            return edge + 1 + ring_col
+        if 1 <= ring_row < edge:
+            if ring_col == 0:
+                return 2 * (edge + 1) + ring_row - 1
+            if ring_col == edge:
+                return 2 * (edge + 1) + self.size + ring_row - 1
+        return -1
+
+    def ring_position(self, ring_idx: int) -> Tuple[int, int]:
+        """Inverse of ring_index()."""
+        edge = self.size + 1
+        if ring_idx <= edge:
+            return (0, ring_idx)
+        ring_idx -= edge + 1
+        if ring_idx <= edge:
+            return (edge, ring_idx)
+        ring_idx -= edge + 1
+        if ring_idx < self.size:
+            return (ring_idx + 1, 0)
+        return (ring_idx - self.size + 1, edge)
+
+    def start_level2(self) -> None:
+        self.level = 2
+        self.ring = array("i", [0]) * self.ring_size()
+        self.last_pos = self.one_pos
+        self.next_number = 2
+
+    def check_ring_cell(self, ring_row: int, ring_col: int) -> Optional[str]:
+        """Return None if the next number may go on the ring cell, else the error message."""
+        if self.level != 2:
+            return MSG_WRONG_LEVEL
+        if self.is_complete():
+            return MSG_COMPLETE
+        ring_idx = self.ring_index(ring_row, ring_col)
+        if ring_idx < 0:
+            return MSG_NOT_RING
+        if self.ring[ring_idx] != 0:
+            return MSG_FILLED
+
+        # Row ends, column ends, and the corners of a diagonal the number sits on
+        size = self.size
+        edge = size + 1
+        pos = self.number_pos[self.next_number]
+        row = pos // size
+        col = pos % size
+        if ring_row == row + 1 and (ring_col == 0 or ring_col == edge):
+            return None
+        if ring_col == col + 1 and (ring_row == 0 or ring_row == edge):
+            return None
+        if row == col and ring_row == ring_col:
+            return None
+        if row + col == size - 1 and ring_row + ring_col == edge:
+            return None
+        return MSG_INVALID_RING
+
+    def try_place_on_ring(self, ring_row: int, ring_col: int) -> bool:
+        """Place the next number on a ring cell if valid; no result object is built."""
+        if self.check_ring_cell(ring_row, ring_col) is not None:
+            return False
+        self.ring[self.ring_index(ring_row, ring_col)] = self.next_number
         self.next_number += 1
+        return True
+
+    def place_on_ring(self, ring_row: int, ring_col: int) -> PlacementResult:
+        error = self.check_ring_cell(ring_row, ring_col)
+        if error is not None:
+            return PlacementResult(False, error)
 
+        placed = self.next_number
+        self.try_place_on_ring(ring_row, ring_col)
         return PlacementResult(
             True,
             f"Placed {placed}.",
@@ -65,12 +209,14 @@ class SequentialPlacementEngine:
         )
 
     def is_complete(self) -> bool:
-        # Level 1 complete when we have placed 1..25 => next_number becomes 26
-        return self.level == 1 and self.next_number == (self.size * self.size + 1)
+        # Level 1 complete when we have placed 1..size^2 => next_number becomes size^2 + 1
+        if self.level == 1:
+            return self.next_number == (self.size * self.size + 1)
+        return self.next_number > self.last_ring_number()
 
     def get_board_snapshot(self) -> List[int]:
         # Return a copy so GUI can’t mutate internal state accidentally
         return list(self.board)
 
     def flatten_board(self, sep: str = ";") -> str:
-        return sep.join(str(x) for x in self.board)
\ No newline at end of file
+        return sep.join(str(x) for x in self.board)
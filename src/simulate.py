@@ -0,0 +1,197 @@
+# simulate.py
+"""
+Headless Monte Carlo simulation of the Matrix Game.
+
+Plays full games (Level 1, then Level 2 on the completed board) through
+GameState/Level1Logic/Level2Logic without importing pygame, spread over a
+process pool. Each chunk of games gets its own seeded RNG, so a run is
+reproducible for a given --seed, --chunk and player no matter how many workers
+are used. Workers return aggregated stats per chunk, not per-game rows.
+
+    python src/simulate.py --games 100000 --player heuristic --workers 4
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from game_logic.bitboard import FULL_MASK, NEIGHBOR_MASKS, DIAGONAL_MASKS, cell_index  # noqa: E402
+from game_logic.game_state import GameState  # noqa: E402
+from game_logic.level1 import Level1Logic  # noqa: E402
+from game_logic.level1_solver import can_complete  # noqa: E402
+from game_logic.level2 import Level2Logic  # noqa: E402
+
+PLAYERS = ("random", "heuristic")
+
+
+@dataclass
+class SimulationStats:
+    games: int = 0
+    level1_wins: int = 0
+    level2_wins: int = 0
+    # final Level 1 score of games that completed Level 1
+    level1_scores: Counter = field(default_factory=Counter)
+    # number that could not be placed when a level got stuck
+    level1_dead_ends: Counter = field(default_factory=Counter)
+    level2_dead_ends: Counter = field(default_factory=Counter)
+
+    def merge(self, other: "SimulationStats") -> None:
+        self.games += other.games
+        self.level1_wins += other.level1_wins
+        self.level2_wins += other.level2_wins
+        self.level1_scores.update(other.level1_scores)
+        self.level1_dead_ends.update(other.level1_dead_ends)
+        self.level2_dead_ends.update(other.level2_dead_ends)
+
+    def to_dict(self) -> Dict[str, object]:
+        scored = sum(self.level1_scores.values())
+        return {
+            "games": self.games,
+            "level1_win_rate": self.level1_wins / self.games if self.games else 0.0,
+            "level2_win_rate": self.level2_wins / self.games if self.games else 0.0,
+            "level1_mean_score": (sum(s * c for s, c in self.level1_scores.items()) / scored
+                                  if scored else 0.0),
+            "level1_scores": dict(sorted(self.level1_scores.items())),
+            "level1_dead_ends": dict(sorted(self.level1_dead_ends.items())),
+            "level2_dead_ends": dict(sorted(self.level2_dead_ends.items())),
+        }
+
+
+def _choose_level1(player: str, state: GameState, logic: Level1Logic,
+                   rng: random.Random) -> Optional[Tuple[int, int]]:
+    valid = logic.get_valid_cells()
+    if not valid:
+        return None
+    if player == "random":
+        return rng.choice(valid)
+
+    # heuristic: never walk into a dead end, prefer diagonal (scoring) steps,
+    # then the cell with the fewest onward moves
+    last = cell_index(*state.last_pos)
+    best = None
+    best_key = None
+    for row, col in valid:
+        idx = cell_index(row, col)
+        free = FULL_MASK & ~(state.occupied | (1 << idx))
+        key = (
+            0 if can_complete(free, idx) else 1,
+            0 if DIAGONAL_MASKS[last] >> idx & 1 else 1,
+            bin(NEIGHBOR_MASKS[idx] & free).count("1"),
+            rng.random(),
+        )
+        if best_key is None or key < best_key:
+            best_key = key
+            best = (row, col)
+    return best
+
+
+def _choose_level2(player: str, state: GameState, logic: Level2Logic,
+                   rng: random.Random) -> Optional[Tuple[int, int]]:
+    valid = logic.get_valid_ring_cells(state.current_num)
+    if not valid:
+        return None
+    if player == "heuristic":
+        solution = logic.get_solution()
+        if solution:
+            return solution[0][1]
+    return rng.choice(valid)
+
+
+def play_game(player: str, rng: random.Random, stats: SimulationStats) -> None:
+    """Play one full game and add its outcome to stats."""
+    state = GameState()
+    level1 = Level1Logic(state)
+    level2 = Level2Logic(state)
+    stats.games += 1
+
+    state.start_level1_with_random_one(rng)
+    while not state.win:
+        cell = _choose_level1(player, state, level1, rng)
+        if cell is None:
+            stats.level1_dead_ends[state.current_num] += 1
+            return
+        level1.place_number(*cell)
+    stats.level1_wins += 1
+    stats.level1_scores[state.score] += 1
+
+    state.start_level2([row[:] for row in state.board])
+    while not state.win:
+        cell = _choose_level2(player, state, level2, rng)
+        if cell is None:
+            stats.level2_dead_ends[state.current_num] += 1
+            return
+        level2.place_number(*cell)
+    stats.level2_wins += 1
+
+
+def run_chunk(task: Tuple[str, int, int]) -> SimulationStats:
+    """Worker entry point: play a chunk of games with the chunk's own seeded RNG."""
+    player, games, chunk_seed = task
+    rng = random.Random(chunk_seed)
+    stats = SimulationStats()
+    for _ in range(games):
+        play_game(player, rng, stats)
+    return stats
+
+
+def make_tasks(player: str, games: int, chunk: int, seed: int) -> List[Tuple[str, int, int]]:
+    tasks = []
+    for index, begin in enumerate(range(0, games, chunk)):
+        tasks.append((player, min(chunk, games - begin), seed * 1_000_003 + index))
+    return tasks
+
+
+def simulate(games: int, player: str = "random", workers: int = 1,
+             chunk: int = 1000, seed: int = 0) -> SimulationStats:
+    if player not in PLAYERS:
+        raise ValueError(f"Unknown player {player!r}; expected one of {PLAYERS}")
+    tasks = make_tasks(player, games, chunk, seed)
+    total = SimulationStats()
+    if workers <= 1:
+        for task in tasks:
+            total.merge(run_chunk(task))
+        return total
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for stats in pool.map(run_chunk, tasks):
+            total.merge(stats)
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Headless Matrix Game simulations")
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--player", choices=PLAYERS, default="random")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk", type=int, default=1000, help="games per task")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print the full result as JSON")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats = simulate(args.games, args.player, args.workers, args.chunk, args.seed)
+    elapsed = time.perf_counter() - start
+
+    result = stats.to_dict()
+    result.update({"player": args.player, "workers": args.workers, "seconds": elapsed,
+                   "games_per_sec": stats.games / elapsed if elapsed else 0.0})
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    print(f"player={args.player} games={stats.games} workers={args.workers} "
+          f"time={elapsed:.2f}s ({result['games_per_sec']:,.0f} games/s)")
+    print(f"  level 1 win rate: {result['level1_win_rate']:.2%}  mean score: {result['level1_mean_score']:.2f}")
+    print(f"  level 2 win rate: {result['level2_win_rate']:.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import os
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from gui.audio import AudioManager
+
+
+def test_sounds_load_in_background_and_play_on_pool():
+    audio = AudioManager(channels=4)
+    assert audio.play("valid") is False   #not loaded yet: starts loading, plays nothing
+    assert audio.wait_ready(5)
+    try:
+        assert set(audio.sounds) == {"valid", "invalid"}
+        assert pygame.mixer.get_num_channels() == 4
+        assert all(audio.play("valid") for _ in range(10))   #more clicks than channels
+        assert audio.play("unknown") is False
+    finally:
+        audio.close()
+
+def test_missing_files_are_silent(tmp_path):
+    audio = AudioManager(asset_dir=tmp_path, background=False)
+    audio.start()
+    try:
+        assert audio.is_ready() and audio.enabled
+        assert audio.play("valid") is False
+    finally:
+        audio.close()
+
+def test_no_audio_device_is_a_no_op(monkeypatch):
+    def no_device(*args, **kwargs):
+        raise pygame.error("No available audio device")
+    monkeypatch.setattr(pygame.mixer, "get_init", lambda: None)
+    monkeypatch.setattr(pygame.mixer, "init", no_device)
+    audio = AudioManager(background=False)
+    audio.start()
+    assert audio.enabled is False
+    assert audio.play("invalid") is False
@@ -0,0 +1,75 @@
+import random
+from collections import Counter
+from datetime import date
+
+from completion_analytics import LogStats, analyze, analyze_segment, iter_chunks, make_tasks
+from completion_logger import CompletionLogger, CompletionRecord
+from path_builder import WarnsdorffPathBuilder
+
+
+def _write_log(path, count=600):
+    builder = WarnsdorffPathBuilder(size=5, seed=0)
+    paths = [builder.build(one_pos=start).engine.flatten_board() for start in range(25)]
+    boards = paths + ["1;2;3", ";".join(str(n) for n in range(1, 26))]   # not king paths
+    rng = random.Random(0)
+    logger = CompletionLogger(str(path))
+    records = []
+    for i in range(count):
+        record = CompletionRecord(
+            rng.choice(["Alice", "Bob, Jr.", 'Eve "the" Great']),   # written quoted by the csv module
+            f"2026-0{rng.randrange(1, 10)}-{rng.randrange(1, 29):02d}T{rng.randrange(24):02d}:00:00.5+00:00",
+            1 + i % 2, rng.randrange(25), rng.choice(boards))
+        logger.append_record(record)
+        records.append(record)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("not a record\n")
+    return records, paths
+
+
+def _positions(board_flat):
+    numbers = [int(n) for n in board_flat.split(";")]
+    return [numbers.index(n) for n in range(1, 26)]
+
+
+def test_aggregates_match_record_by_record_counts(tmp_path):
+    records, paths = _write_log(tmp_path / "game_log.csv")
+    stats = analyze(str(tmp_path / "game_log.csv"), chunk_bytes=4096)
+
+    assert (stats.rows, stats.skipped, stats.untimed) == (600, 1, 0)
+    points = Counter((r.level, r.points) for r in records)
+    for level, counts in stats.points.items():
+        assert {p: c for p, c in enumerate(counts) if c} == {p: c for (lvl, p), c in points.items() if lvl == level}
+    assert stats.hours.tolist() == [sum(int(r.timestamp_iso[11:13]) == h for r in records) for h in range(24)]
+    epoch = date(1970, 1, 1).toordinal()
+    assert stats.days == Counter(date.fromisoformat(r.timestamp_iso[:10]).toordinal() - epoch for r in records)
+
+    for level in (1, 2):
+        on_path = [_positions(r.board_flat) for r in records if r.level == level and r.board_flat in paths]
+        assert stats.paths[level] == len(on_path)
+        assert stats.start_cells[level].tolist() == [sum(p[0] == cell for p in on_path) for cell in range(25)]
+        diagonal = [sum(abs(p[k] // 5 - p[k + 1] // 5) == 1 and abs(p[k] % 5 - p[k + 1] % 5) == 1 for p in on_path)
+                    for k in range(24)]
+        assert stats.diagonal_moves[level].tolist() == diagonal
+    summary = stats.to_dict()["levels"]["1"]
+    assert summary["records"] == 300 and 0 < summary["diagonal_move_rate"] < 1
+
+
+def test_segments_cover_every_line_once(tmp_path):
+    path = str(tmp_path / "game_log.csv")
+    _write_log(path, count=200)
+    whole = analyze(path).to_dict()
+    with open(path, "rb") as f:
+        content = f.read()
+    for segment_bytes, chunk_bytes in ((97, 50), (1000, 333), (5000, 1 << 20)):
+        tasks = make_tasks(path, segment_bytes, chunk_bytes)
+        assert b"".join(chunk for task in tasks for chunk in iter_chunks(*task[:3], task[3])) == content
+        merged = LogStats()
+        for task in tasks:
+            merged.merge(analyze_segment(task))
+        assert merged.to_dict() == whole
+
+
+def test_process_pool_gives_the_same_result(tmp_path):
+    path = str(tmp_path / "game_log.csv")
+    _write_log(path, count=300)
+    assert analyze(path, workers=2, segment_bytes=4096).to_dict() == analyze(path).to_dict()
@@ -0,0 +1,125 @@
+import pytest
+
+from completion_codec import (
+    RECORD_SIZE, BinaryLogReader, BinaryLogWriter, StringTable, binary_to_csv, csv_to_binary,
+    decode_board, decode_record, encode_board, encode_record, recover_binary_log,
+)
+from completion_logger import CompletionLogger, CompletionRecord, iso_now
+from path_builder import WarnsdorffPathBuilder
+
+
+def _path_boards():
+    builder = WarnsdorffPathBuilder(size=5, seed=0)
+    return [builder.build(one_pos=start).engine.flatten_board() for start in range(25)]
+
+
+def test_king_path_boards_fit_in_77_bits():
+    for board in _path_boards():
+        code = encode_board(board)
+        assert code is not None and code < 1 << 77
+        assert decode_board(code) == board
+
+
+def test_other_boards_are_not_path_coded():
+    row_major = ";".join(str(n) for n in range(1, 26))   # 5 -> 6 is not a king move
+    board = _path_boards()[0]
+    assert encode_board(row_major) is None
+    assert encode_board(board.replace(";2;", ";02;")) is None
+    assert encode_board("1;2;3") is None
+    assert encode_board(";".join(["0"] * 25)) is None
+
+
+def test_records_round_trip_including_verbatim_fields():
+    strings = StringTable()
+    board = _path_boards()[3]
+    records = [
+        CompletionRecord("Alice", iso_now(), 1, 12, board),
+        CompletionRecord("Alice", "2026-02-07T00:00:00+00:00", 2, 0, board),
+        CompletionRecord("Bob", "2026-02-07T00:00:00Z", 1, 3, "1;2;3"),
+        CompletionRecord("Bob", "2026-02-07T01:00:00+01:00", 2, 24, board),
+    ]
+    for record in records:
+        data = encode_record(record, strings)
+        assert len(data) == RECORD_SIZE
+        assert decode_record(data, strings) == record
+    assert strings.strings[:2] == ["Alice", "Bob"]
+    with pytest.raises(ValueError):
+        encode_record(CompletionRecord("Alice", iso_now(), 1, 256, board), strings)
+
+
+def test_csv_converts_to_binary_and_back_unchanged(tmp_path):
+    csv_path = tmp_path / "game_log.csv"
+    logger = CompletionLogger(str(csv_path))
+    boards = _path_boards()
+    for i in range(400):
+        logger.append_record(CompletionRecord(f"player{i % 9}", iso_now(), 1 + i % 2, i % 25, boards[i % 25]))
+
+    bin_path = tmp_path / "game_log.bin"
+    assert csv_to_binary(str(csv_path), str(bin_path)) == 400
+    assert csv_path.stat().st_size >= 5 * bin_path.stat().st_size
+
+    assert binary_to_csv(str(bin_path), str(tmp_path / "back.csv")) == 400
+    assert (tmp_path / "back.csv").read_bytes() == csv_path.read_bytes()
+
+
+def test_writer_appends_and_reader_scans_fields(tmp_path):
+    path = str(tmp_path / "game_log.bin")
+    board = _path_boards()[0]
+    with BinaryLogWriter(path) as writer:
+        writer.append_record(CompletionRecord("Alice", "2026-02-07T00:00:00+00:00", 1, 5, board))
+    with BinaryLogWriter(path) as writer:
+        writer.append_record(CompletionRecord("Bob", "yesterday", 2, 7, board))
+        writer.append_record(CompletionRecord("Alice", "2026-02-07T00:00:01+00:00", 2, 9, board))
+
+    with BinaryLogReader(path) as reader:
+        assert len(reader) == 3
+        assert reader[1] == CompletionRecord("Bob", "yesterday", 2, 7, board)
+        assert [r.player_name for r in reader] == ["Alice", "Bob", "Alice"]
+        assert list(reader.fields()) == [
+            (1770422400000000, 0, 1, 5),
+            (-1, 1, 2, 7),
+            (1770422401000000, 0, 2, 9),
+        ]
+        with pytest.raises(IndexError):
+            reader[3]
+
+
+def test_log_left_open_by_a_crash_is_refused_then_recovered(tmp_path):
+    path = str(tmp_path / "game_log.bin")
+    board = _path_boards()[0]
+    with BinaryLogWriter(path) as writer:
+        writer.append_record(CompletionRecord("Alice", "2026-02-07T00:00:00+00:00", 1, 5, board))
+    crashed = BinaryLogWriter(path)
+    records = [CompletionRecord(f"player{i}", f"2026-02-07T00:00:0{i}+00:00", 2, i, board) for i in range(5)]
+    for record in records:
+        crashed.append_record(record)
+    crashed._file.flush()   # what a killed process leaves: records on disk, no table or count
+    with open(path, "ab") as f:
+        f.write(b"\x01" * 7)   # and a record cut short
+
+    with pytest.raises(ValueError, match="not closed"):
+        BinaryLogReader(path)
+    with BinaryLogWriter(path) as writer:   # recovers before appending
+        writer.append_record(CompletionRecord("Bob", "yesterday", 1, 9, "1;2;3"))
+    with BinaryLogReader(path) as reader:
+        assert [r.player_name for r in reader] == ["Alice"] + [r.player_name for r in records] + ["Bob"]
+        assert list(reader)[1:6] == records
+    assert not (tmp_path / "game_log.bin.strings").exists()
+
+
+def test_recover_and_damaged_header(tmp_path):
+    path = str(tmp_path / "game_log.bin")
+    writer = BinaryLogWriter(path)
+    writer.append_record(CompletionRecord("Alice", "2026-02-07T00:00:00+00:00", 1, 5, "1;2;3"))
+    writer._file.flush()
+    assert recover_binary_log(path) == 1
+    with BinaryLogReader(path) as reader:
+        assert reader[0].board_flat == "1;2;3"
+    with pytest.raises(ValueError, match="journal"):
+        recover_binary_log(path)
+
+    data = bytearray(open(path, "rb").read())
+    data[8] = 3   # record count no longer matches the table offset
+    open(path, "wb").write(bytes(data))
+    with pytest.raises(ValueError, match="damaged"):
+        BinaryLogReader(path)
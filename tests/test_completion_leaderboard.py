@@ -0,0 +1,74 @@
+import random
+import threading
+
+import pytest
+
+from completion_leaderboard import Leaderboard
+from completion_logger import BufferedCompletionLogger, CompletionLogger, CompletionRecord, RotatingCompletionLogger
+
+
+def _records(count, seed=0):
+    rng = random.Random(seed)
+    return [CompletionRecord(f"player{i}", f"2026-02-{rng.randrange(1, 4):02d}T00:00:00+00:00",
+                             rng.randrange(1, 3), rng.randrange(6), "1;2;3")
+            for i in range(count)]
+
+
+def _expected(records, level, k):
+    ranked = [(-r.points, r.timestamp_iso, i, r) for i, r in enumerate(records) if r.level == level]
+    return tuple(r for *_, r in sorted(ranked)[:k])
+
+
+def test_top_k_matches_a_full_sort_with_ties():
+    records = _records(500)
+    board = Leaderboard(k=7)
+    for n, record in enumerate(records, 1):
+        board.add(record)
+        if n % 50 == 0:
+            for level in (1, 2):
+                assert board.top(level) == _expected(records[:n], level, 7)
+    assert board.levels() == [1, 2]
+    assert board.top(1, limit=3) == _expected(records, 1, 3)
+    assert board.top(3) == ()
+    with pytest.raises(ValueError):
+        Leaderboard(k=0)
+
+
+def test_attach_warm_starts_from_a_rotated_log_then_follows_appends(tmp_path):
+    records = _records(300, seed=1)
+    path = str(tmp_path / "game_log.csv")
+    with RotatingCompletionLogger(path, max_bytes=2000) as logger:
+        for record in records[:200]:
+            logger.append_record(record)
+
+    logger = CompletionLogger(path)
+    board = Leaderboard(k=5)
+    assert board.attach(logger) == 200
+    for record in records[200:]:
+        logger.append_record(record)
+    assert board.snapshot() == {level: _expected(records, level, 5) for level in (1, 2)}
+
+    logger.unsubscribe(board.add)
+    logger.append_record(CompletionRecord("late", "2026-01-01T00:00:00+00:00", 1, 99, "1;2;3"))
+    assert board.top(1)[0].player_name != "late"
+
+
+def test_snapshots_stay_consistent_while_writers_add(tmp_path):
+    records = _records(4000, seed=2)
+    board = Leaderboard(k=10)
+    with BufferedCompletionLogger(str(tmp_path / "game_log.csv")) as logger:
+        board.attach(logger)
+        writers = [threading.Thread(target=lambda part: [logger.append_record(r) for r in part],
+                                    args=(records[n::2],)) for n in range(2)]
+        for t in writers:
+            t.start()
+        while any(t.is_alive() for t in writers):
+            for level in (1, 2):
+                top = board.top(level)
+                assert len(top) <= 10 and len(set(top)) == len(top)
+                assert [r.points for r in top] == sorted((r.points for r in top), reverse=True)
+        for t in writers:
+            t.join()
+    for level in (1, 2):
+        assert [(r.points, r.timestamp_iso) for r in board.top(level)] == [
+            (r.points, r.timestamp_iso) for r in _expected(records, level, 10)]
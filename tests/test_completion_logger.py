@@ -1,4 +1,13 @@
-from completion_logger import CompletionLogger, CompletionRecord
+import csv
+import threading
+import time
+
+import pytest
+
+from completion_logger import (
+    BufferedCompletionLogger, CompletionLogger, CompletionRecord, RotatingCompletionLogger, iter_log_records,
+    log_segments,
+)
 from pathlib import Path
 
 def test_logger_writes_csv_row(tmp_path):
@@ -19,4 +28,179 @@ def test_logger_writes_csv_row(tmp_path):
     assert len(text) == 2  # header + 1 row
     assert text[0].startswith("player_name,timestamp_iso,level,points,board_flat")
     assert "Alice" in text[1]
-    assert "2026-02-07T00:00:00+00:00" in text[1]
\ No newline at end of file
+    assert "2026-02-07T00:00:00+00:00" in text[1]
+
+def _record(i, level=1):
+    return CompletionRecord(
+        player_name=f"player{i % 7}",
+        timestamp_iso=f"2026-02-07T00:00:{i % 60:02d}+00:00",
+        level=level,
+        points=i % 13,
+        board_flat=";".join(str((i + k) % 25 + 1) for k in range(25)),
+    )
+
+
+def test_buffered_logger_matches_unbuffered_output(tmp_path):
+    plain = CompletionLogger(str(tmp_path / "plain.csv"))
+    for i in range(100):
+        plain.append_record(_record(i))
+
+    with BufferedCompletionLogger(str(tmp_path / "buffered.csv"), batch_size=16, durability="none") as logger:
+        for i in range(100):
+            logger.append_record(_record(i))
+
+    assert (tmp_path / "buffered.csv").read_bytes() == (tmp_path / "plain.csv").read_bytes()
+    assert logger.stats()["records_written"] == 100
+
+
+def test_buffered_logger_keeps_rows_whole_across_threads(tmp_path):
+    log_path = tmp_path / "game_log.csv"
+    logger = BufferedCompletionLogger(str(log_path), batch_size=8, flush_interval=0.01)
+
+    def worker(n):
+        for i in range(500):
+            logger.append_record(CompletionRecord(f"thread{n}", "2026-02-07T00:00:00+00:00", 1, i, _record(i).board_flat))
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    logger.close()
+
+    with log_path.open(newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 2000
+    for n in range(4):
+        # every row intact, and each thread's records in the order it appended them
+        own = [row for row in rows if row["player_name"] == f"thread{n}"]
+        assert [int(row["points"]) for row in own] == list(range(500))
+        assert all(row["board_flat"] == _record(int(row["points"])).board_flat for row in own)
+
+
+def test_buffered_logger_flushes_on_interval_and_rejects_after_close(tmp_path):
+    log_path = tmp_path / "game_log.csv"
+    logger = BufferedCompletionLogger(str(log_path), batch_size=1000, flush_interval=0.02)
+    logger.append_record(_record(1))
+    deadline = time.monotonic() + 5
+    while len(log_path.read_text(encoding="utf-8").splitlines()) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(log_path.read_text(encoding="utf-8").splitlines()) == 2
+    logger.close()
+    logger.close()
+    with pytest.raises(ValueError):
+        logger.append_record(_record(2))
+
+
+def _fail_writes(logger, failures=None):
+    """Make _write_batch raise OSError while the returned event is set (cleared after `failures` failures)."""
+    write_batch = logger._write_batch
+    failed = []
+    failing = threading.Event()
+    failing.set()
+
+    def flaky(batch):
+        if batch and failing.is_set():
+            failed.append(len(batch))
+            if failures is not None and len(failed) >= failures:
+                failing.clear()
+            raise OSError("disk full")
+        write_batch(batch)
+
+    logger._write_batch = flaky
+    return failed, failing
+
+
+def _wait_for(condition):
+    deadline = time.monotonic() + 5
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert condition()
+
+
+def _points(log_path):
+    with log_path.open(newline="", encoding="utf-8") as f:
+        return [int(r["points"]) for r in csv.DictReader(f)]
+
+
+def test_buffered_logger_close_writes_rows_after_a_failed_background_write(tmp_path):
+    log_path = tmp_path / "game_log.csv"
+    logger = BufferedCompletionLogger(str(log_path), batch_size=1000, flush_interval=60)
+    failed, _ = _fail_writes(logger, 1)
+    for i in range(5):
+        logger.append_record(_record(i))
+    logger._cond.acquire()
+    logger.batch_size = 5   # wake the thread for one (failing) batch
+    logger._cond.notify()
+    logger._cond.release()
+    _wait_for(lambda: logger._error is not None)
+    logger.close()   # the retry succeeds, so there is nothing to report
+    assert failed == [5]
+    assert _points(log_path) == [_record(i).points for i in range(5)]
+
+
+def test_buffered_logger_keeps_a_record_appended_after_a_recovered_failure(tmp_path):
+    log_path = tmp_path / "game_log.csv"
+    logger = BufferedCompletionLogger(str(log_path), batch_size=1, flush_interval=0.02)
+    failed, _ = _fail_writes(logger, 1)
+    logger.append_record(_record(1))
+    _wait_for(lambda: failed and logger._error is None and len(_points(log_path)) == 1)
+    logger.append_record(_record(2))   # the failure was recovered: nothing to raise
+    logger.close()
+    assert _points(log_path) == [_record(1).points, _record(2).points]
+
+
+def test_buffered_logger_reports_a_failure_after_queuing_and_keeps_flushing(tmp_path):
+    log_path = tmp_path / "game_log.csv"
+    logger = BufferedCompletionLogger(str(log_path), batch_size=1000, flush_interval=0.02)
+    failed, failing = _fail_writes(logger)
+    logger.append_record(_record(0))
+    _wait_for(lambda: logger._error is not None)
+    with pytest.raises(OSError):
+        logger.append_record(_record(1))   # queued, then the failure is reported
+    failing.clear()
+    for i in range(2, 12):
+        logger.append_record(_record(i))
+    _wait_for(lambda: len(_points(log_path)) == 12)
+    logger.close()
+    assert failed and _points(log_path) == [_record(i).points for i in range(12)]
+
+
+def test_buffered_logger_rejects_unknown_durability(tmp_path):
+    with pytest.raises(ValueError):
+        BufferedCompletionLogger(str(tmp_path / "log.csv"), durability="sometimes")
+
+
+def test_rotating_logger_rotates_by_size_and_compresses(tmp_path):
+    log_path = tmp_path / "game_log.csv"
+    records = [_record(i) for i in range(200)]
+    with RotatingCompletionLogger(str(log_path), max_bytes=2000) as logger:
+        for record in records:
+            logger.append_record(record)
+    segments = log_segments(str(log_path))
+    assert len(segments) > 5 and segments[-1] == log_path
+    assert all(s.name == f"game_log.csv.{n}.gz" for n, s in enumerate(segments[:-1], 1))
+    assert list(iter_log_records(str(log_path))) == records
+
+    with RotatingCompletionLogger(str(log_path), max_bytes=2000, compress=False) as logger:
+        for record in records:
+            logger.append_record(record)
+    assert list(iter_log_records(str(log_path))) == records * 2
+    assert log_segments(str(log_path))[-2].suffix != ".gz"   # closed by the uncompressed run
+
+
+def test_rotating_logger_compresses_leftover_segments_and_rotates_by_age(tmp_path):
+    log_path = tmp_path / "game_log.csv"
+    with RotatingCompletionLogger(str(log_path), max_age=0, compress=False) as logger:
+        for i in range(3):
+            logger.append_record(_record(i))
+    assert [s.name for s in log_segments(str(log_path))] == ["game_log.csv.1", "game_log.csv.2", "game_log.csv"]
+
+    with RotatingCompletionLogger(str(log_path), max_bytes=None) as logger:
+        logger.rotate()
+        logger.append_record(_record(3))
+    assert [s.name for s in log_segments(str(log_path))] == [
+        "game_log.csv.1.gz", "game_log.csv.2.gz", "game_log.csv.3.gz", "game_log.csv"]
+    assert list(iter_log_records(str(log_path))) == [_record(i) for i in range(4)]
+    for segment in log_segments(str(log_path))[:-1]:
+        assert segment.read_bytes()[:2] == b"\x1f\x8b"
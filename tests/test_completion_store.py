@@ -0,0 +1,77 @@
+import sqlite3
+
+import pytest
+
+from completion_logger import CompletionLogger, CompletionRecord
+from completion_store import COLUMNS, CompletionStore
+
+
+def _record(player, day, level, points):
+    return CompletionRecord(player, f"2026-02-{day:02d}T12:00:00+00:00", level, points, "1;2;3")
+
+
+def test_leaderboard_orders_by_points_then_time(tmp_path):
+    with CompletionStore(str(tmp_path / "c.db")) as store:
+        store.append_records([
+            _record("Cara", 3, 1, 5), _record("Alice", 2, 1, 7), _record("Bob", 1, 1, 7),
+            _record("Dan", 4, 2, 9), _record("Eve", 5, 1, 2),
+        ])
+        top = store.leaderboard(1, limit=3)
+        assert [(r.player_name, r.points) for r in top] == [("Bob", 7), ("Alice", 7), ("Cara", 5)]
+        assert isinstance(top[0].level, int)
+        assert [r.player_name for r in store.leaderboard(2)] == ["Dan"]
+
+
+def test_leaderboard_time_window(tmp_path):
+    with CompletionStore(str(tmp_path / "c.db")) as store:
+        for day in range(1, 29):
+            store.append_record(_record(f"p{day}", day, 2, day % 10))
+        week = store.leaderboard(2, limit=4, since="2026-02-22", until="2026-02-28")
+        # days 22..27 score 2..7
+        assert [(r.player_name, r.points) for r in week] == [("p27", 7), ("p26", 6), ("p25", 5), ("p24", 4)]
+        assert store.leaderboard(2, since="2026-03-01") == []
+
+
+def test_player_history_newest_first(tmp_path):
+    with CompletionStore(str(tmp_path / "c.db"), batch_size=2) as store:
+        for day in (5, 1, 9, 3):
+            store.append_record(_record("Alice", day, 1 + (day > 4), day))
+        store.append_record(_record("Bob", 7, 1, 1))
+        assert [r.points for r in store.player_history("Alice")] == [9, 5, 3, 1]
+        assert [r.points for r in store.player_history("Alice", limit=2)] == [9, 5]
+        assert [r.points for r in store.player_history("Alice", level=2)] == [9, 5]
+        assert store.player_best("Alice", 1) == 3
+        assert store.player_best("Bob", 2) is None
+
+
+def test_records_are_committed_in_batches_and_on_close(tmp_path):
+    path = str(tmp_path / "c.db")
+    store = CompletionStore(path, batch_size=3, flush_interval=3600)
+    other = sqlite3.connect(path)
+    for i in range(4):
+        store.append_record(_record("Alice", 1, 1, i))
+    assert other.execute("SELECT COUNT(*) FROM completions").fetchone()[0] == 3
+    store.close()
+    store.close()
+    assert other.execute("SELECT COUNT(*) FROM completions").fetchone()[0] == 4
+    assert other.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    with pytest.raises(ValueError):
+        store.append_record(_record("Alice", 1, 1, 0))
+
+
+def test_import_csv_from_completion_logger(tmp_path):
+    csv_path = str(tmp_path / "game_log.csv")
+    logger = CompletionLogger(csv_path)
+    records = [_record(f"p{i % 3}", 1 + i % 28, 1 + i % 2, i % 11) for i in range(50)]
+    for record in records:
+        logger.append_record(record)
+
+    with CompletionStore(str(tmp_path / "c.db")) as store:
+        assert store.import_csv(csv_path) == 50
+        assert store.count() == 50 and store.count(level=2) == 25
+        assert sorted(store.player_history("p1"), key=records.index) == [r for r in records if r.player_name == "p1"]
+        # the indexes dropped for the bulk load are back
+        plan = store.explain(f"SELECT {COLUMNS} FROM completions WHERE level = ? ORDER BY points DESC LIMIT 10", [1])
+        assert "completions_level_points" in plan[0]
+        assert store.import_csv(csv_path) == 50
+        assert store.count() == 100
@@ -0,0 +1,97 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import random
+
+import pygame
+
+from game_logic import GameState, Level1Logic, Level1Optimizer, Level2Logic
+from gui.window import GameWindow
+
+NEVER = 2 ** 40   #message timer that does not expire during the test
+
+
+def _level1_path(seed):
+    state = GameState()
+    state.start_level1_with_random_one(random.Random(seed))
+    return state.last_pos, Level1Optimizer().best_completion(state)[1]
+
+def _completed_board(one, path):
+    state = GameState()
+    state.original_one_pos = one
+    state.reset_level1()
+    logic = Level1Logic(state)
+    for cell in path:
+        logic.place_number(*cell)
+    return [row[:] for row in state.board]
+
+def _assert_dirty_matches_full(window):
+    #dirty frame first (it builds on what is on screen), then a full redraw of the same state
+    window._update()
+    window._draw_dirty()
+    dirty_frame = window.screen.copy()
+    dirty = pygame.image.tostring(window.screen, "RGB")
+    window._draw_full()
+    full = pygame.image.tostring(window.screen, "RGB")
+    window.screen.blit(dirty_frame, (0, 0))   #leave the dirty path's screen as it drew it
+    assert dirty == full
+
+def test_dirty_frames_match_full_redraw_through_a_whole_game():
+    rng = random.Random(5)
+    one, path = _level1_path(1)
+    state = GameState()
+    window = GameWindow(dirty_rendering=True)
+    level1 = Level1Logic(state)
+    level2 = Level2Logic(state)
+    window.set_game_components(state, level1, level2)
+    state.original_one_pos = one
+    state.reset_level1()
+    _assert_dirty_matches_full(window)
+
+    for i, cell in enumerate(path):   #level 1, with hover, messages, a button hover and an undo
+        window.hover_cell = (rng.randrange(5), rng.randrange(5))
+        level1.place_number(*cell)
+        if i == 4:
+            _assert_dirty_matches_full(window)
+            state.undo()
+            _assert_dirty_matches_full(window)
+            level1.place_number(*cell)
+        if i == 6:
+            window.message, window.message_timer = "Cell is already occupied!", NEVER
+        if i == 9:
+            window.message = ""
+            window.hovered_button = window.btn_undo
+        if i == 10:
+            window.hovered_button = None
+        _assert_dirty_matches_full(window)
+    assert state.level == 2   #_update moved to level 2 after the last placement
+    window.message_timer = NEVER
+
+    ring = [cell for _, cell in level2.get_solution()]
+    for i, cell in enumerate(ring):   #level 2 up to the win screen, with an undo
+        window.hover_cell = (rng.randrange(7), rng.randrange(7))
+        level2.place_number(*cell)
+        if i == 3:
+            _assert_dirty_matches_full(window)
+            state.undo()
+            _assert_dirty_matches_full(window)
+            level2.place_number(*cell)
+        _assert_dirty_matches_full(window)
+    assert state.win and state.level == 2
+
+    state.reset_lv2()   #Clear on level 2: the ring empties, the locked board stays
+    state.win = False
+    _assert_dirty_matches_full(window)
+
+    #a different completed board at the same level: only board_generation tells the layout changed
+    other_one, other_path = _level1_path(2)
+    state.start_level2(_completed_board(other_one, other_path))
+    _assert_dirty_matches_full(window)
+    for cell in [cell for _, cell in level2.get_solution()][:3]:
+        level2.place_number(*cell)
+        _assert_dirty_matches_full(window)
+
+    state.reset_level1()   #back to level 1
+    _assert_dirty_matches_full(window)
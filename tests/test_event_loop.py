@@ -0,0 +1,51 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from game_logic import GameState, Level1Logic, Level2Logic
+from gui.window import GameWindow
+
+
+def _window():
+    window = GameWindow(event_driven=True)
+    state = GameState()
+    window.set_game_components(state, Level1Logic(state), Level2Logic(state))
+    state.start_level1_with_random_one()
+    pygame.event.clear()   #drop the window's own start-up events
+    return window
+
+def test_without_a_message_the_loop_waits_for_input_only():
+    window = _window()
+    assert window.message == ""
+    assert window._event_timeout() == 0
+
+def test_pending_message_wakes_the_loop_just_after_it_expires():
+    window = _window()
+    window.show_message("Cell is already occupied!", duration=500)
+    before = pygame.time.get_ticks()
+    timeout = window._event_timeout()
+    after = pygame.time.get_ticks()
+    assert timeout >= 1
+    assert before + timeout <= window.message_timer + 1   #no later than 1 ms after expiry
+    assert after + timeout > window.message_timer          #and not before it
+    window.message_timer = after - 100   #already expired: still wait at least 1 ms, never 0 (= forever)
+    assert window._event_timeout() == 1
+
+def test_wait_returns_the_waking_event_then_the_queued_ones_in_order():
+    window = _window()
+    for n in range(1, 4):
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT, n=n))
+    events = window._wait_for_events()
+    assert [(e.type, e.n) for e in events] == [(pygame.USEREVENT, n) for n in range(1, 4)]
+    assert pygame.event.get() == []
+
+def test_timeout_wakeup_returns_no_events_and_update_clears_the_message():
+    window = _window()
+    window.show_message("Level 1 Complete! Starting Level 2...", duration=20)
+    assert window._wait_for_events() == []
+    assert pygame.time.get_ticks() > window.message_timer
+    window._update()
+    assert window.message == ""
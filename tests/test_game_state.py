@@ -0,0 +1,77 @@
+import random
+
+from game_logic.game_state import GameState
+from game_logic.level1 import Level1Logic
+
+
+def _scan_positions(board):
+    found = {}
+    for row in range(5):
+        for col in range(5):
+            if board[row][col]:
+                found[board[row][col]] = (row, col)
+    return found
+
+def _assert_index_matches_board(state):
+    found = _scan_positions(state.board)
+    for num in range(1, 27):
+        assert state.get_number_position(num) == found.get(num)
+
+def test_position_index_tracks_place_undo_and_reset():
+    rng = random.Random(11)
+    for seed in range(20):
+        random.seed(seed)
+        state = GameState()
+        state.start_level1_with_random_one()
+        logic = Level1Logic(state)
+        _assert_index_matches_board(state)
+        for _ in range(30):
+            valid = logic.get_valid_cells()
+            if valid and rng.random() < 0.7:
+                logic.place_number(*rng.choice(valid))
+            elif state.current_num > 2:
+                state.undo()
+            _assert_index_matches_board(state)
+        state.reset_level1()
+        _assert_index_matches_board(state)
+
+def test_position_index_rebuilt_for_level2():
+    state = GameState()
+    board = [[row * 5 + col + 1 for col in range(5)] for row in range(5)]
+    state.start_level2(board)
+    _assert_index_matches_board(state)
+    assert state.last_pos == (0, 0)
+    assert state.get_number_position(25) == (4, 4)
+    assert state.get_number_position(0) is None
+
+def test_version_changes_on_every_board_write():
+    random.seed(2)
+    state = GameState()
+    state.start_level1_with_random_one()
+    logic = Level1Logic(state)
+    seen = {state.version}
+    logic.place_number(*logic.get_valid_cells()[0])
+    assert state.version not in seen
+    seen.add(state.version)
+    state.undo()
+    assert state.version not in seen
+    seen.add(state.version)
+    version = state.version
+    logic.get_valid_cells()
+    assert state.version == version
+    state.reset_level1()
+    assert state.version not in seen
+
+def test_board_generation_changes_only_when_a_board_is_loaded():
+    random.seed(3)
+    state = GameState()
+    state.start_level1_with_random_one()
+    logic = Level1Logic(state)
+    generation = state.board_generation
+    logic.place_number(*logic.get_valid_cells()[0])
+    state.undo()
+    assert state.board_generation == generation
+    for load in (state.reset_level1, lambda: state.start_level2([row[:] for row in state.board])):
+        load()
+        assert state.board_generation > generation
+        generation = state.board_generation
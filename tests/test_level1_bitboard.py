@@ -0,0 +1,59 @@
+import random
+
+from game_logic.bitboard import NEIGHBOR_MASKS, DIAGONAL_MASKS, cell_index, mask_from_board
+from game_logic.game_state import GameState
+from game_logic.level1 import Level1Logic
+
+
+def _scan_valid_cells(state):
+    # Reference list-scan implementation of the Level 1 rules
+    valid = []
+    last_row, last_col = state.last_pos
+    for row in range(5):
+        for col in range(5):
+            if state.board[row][col] != 0:
+                continue
+            if max(abs(row - last_row), abs(col - last_col)) == 1:
+                valid.append((row, col))
+    return valid
+
+def test_neighbor_masks_match_king_moves():
+    assert bin(NEIGHBOR_MASKS[cell_index(0, 0)]).count("1") == 3
+    assert bin(NEIGHBOR_MASKS[cell_index(2, 2)]).count("1") == 8
+    assert bin(NEIGHBOR_MASKS[cell_index(0, 2)]).count("1") == 5
+    assert DIAGONAL_MASKS[cell_index(0, 0)] == 1 << cell_index(1, 1)
+
+def test_valid_cells_match_list_scan_through_random_games():
+    rng = random.Random(1234)
+    for _ in range(50):
+        state = GameState()
+        state.start_level1_with_random_one()
+        logic = Level1Logic(state)
+        while True:
+            valid = logic.get_valid_cells()
+            assert valid == _scan_valid_cells(state)
+            assert logic.has_valid_moves() == bool(valid)
+            assert state.occupied == mask_from_board(state.board)
+            if not valid:
+                break
+            row, col = rng.choice(valid)
+            last_row, last_col = state.last_pos
+            expected_diag = abs(row - last_row) == 1 and abs(col - last_col) == 1
+            assert logic.is_diagonal_move(row, col) == expected_diag
+            assert logic.place_number(row, col) == (True, None)
+
+def test_occupancy_tracks_undo_and_reset():
+    state = GameState()
+    state.start_level1_with_random_one()
+    logic = Level1Logic(state)
+    row, col = logic.get_valid_cells()[0]
+    logic.place_number(row, col)
+
+    assert logic.is_valid_move(row, col) == (False, "cell_occupied")
+    state.undo()
+    assert state.occupied == mask_from_board(state.board)
+    assert logic.is_valid_move(row, col) == (True, None)
+
+    logic.place_number(row, col)
+    state.reset_level1()
+    assert state.occupied == 1 << cell_index(*state.original_one_pos)
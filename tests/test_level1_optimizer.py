@@ -0,0 +1,67 @@
+import random
+
+from game_logic.game_state import GameState
+from game_logic.level1 import Level1Logic
+from game_logic.level1_optimizer import Level1Optimizer
+from game_logic.level1_solver import Level1Solver
+
+
+def _solvable_prefix(seed, moves):
+    random.seed(seed)
+    state = GameState()
+    state.start_level1_with_random_one()
+    logic = Level1Logic(state)
+    paths = list(Level1Solver().iter_completions(state, limit=200))
+    for row, col in random.Random(seed).choice(paths)[:moves]:
+        logic.place_number(row, col)
+    return state, logic
+
+def _exhaustive_max(state, logic):
+    # Score every completion by replaying it on the real logic
+    best = None
+    for path in Level1Solver().iter_completions(state):
+        before = state.score
+        for row, col in path:
+            logic.place_number(row, col)
+        if best is None or state.score > best:
+            best = state.score
+        for _ in path:
+            state.undo()
+        state.win = False
+        assert state.score == before
+    return best
+
+def test_max_score_matches_exhaustive_search():
+    for seed in range(6):
+        state, logic = _solvable_prefix(seed, 11)
+        assert Level1Optimizer().max_score(state) == _exhaustive_max(state, logic)
+
+def test_best_path_replays_to_reported_score():
+    for seed in range(6):
+        state, logic = _solvable_prefix(seed, 0)
+        score, path = Level1Optimizer().best_completion(state)
+        assert len(path) == 24
+        for row, col in path:
+            assert logic.place_number(row, col) == (True, None)
+        assert state.win is True
+        assert state.score == score
+
+def test_corner_start_best_score():
+    # Corners force the even-colored cells into at least five diagonal runs
+    state = GameState()
+    state.set_inner_cell(0, 0, 1)
+    state.last_pos = (0, 0)
+    state.current_num = 2
+    assert Level1Optimizer().max_score(state) == 16
+
+def test_dead_board_has_no_completion():
+    state = GameState()
+    logic = Level1Logic(state)
+    state.set_inner_cell(0, 1, 1)
+    state.last_pos = (0, 1)
+    state.current_num = 2
+    for row, col in [(1, 1), (1, 0)]:
+        logic.place_number(row, col)
+    # (0, 0) is now isolated and is not next to the last cell
+    logic.place_number(2, 0)
+    assert Level1Optimizer().best_completion(state) == (None, [])
@@ -0,0 +1,88 @@
+import random
+
+from game_logic.game_state import GameState
+from game_logic.level1 import Level1Logic
+from game_logic.level1_solver import Level1Solver
+
+
+def _play_random_prefix(seed, moves):
+    # Play the first moves of a randomly chosen completion so the board stays solvable
+    random.seed(seed)
+    state = GameState()
+    state.start_level1_with_random_one()
+    logic = Level1Logic(state)
+    paths = list(Level1Solver().iter_completions(state, limit=200))
+    path = random.Random(seed).choice(paths)
+    for row, col in path[:moves]:
+        logic.place_number(row, col)
+    return state, logic
+
+def _naive_count(state, logic):
+    # Plain recursion over is_valid_move, used as the reference
+    if state.current_num > 25:
+        return 1
+    total = 0
+    for row, col in logic.get_valid_cells():
+        logic.place_number(row, col)
+        total += _naive_count(state, logic)
+        state.undo()
+    return total
+
+def test_count_matches_naive_recursion_mid_game():
+    for seed in range(5):
+        state, logic = _play_random_prefix(seed, 12)
+        expected = _naive_count(state, logic)
+        assert Level1Solver().count_from_state(state) == expected
+
+def test_enumerated_paths_are_legal_and_match_count():
+    state, logic = _play_random_prefix(7, 13)
+    solver = Level1Solver()
+    paths = list(solver.iter_completions(state))
+    assert len(paths) == solver.count_from_state(state)
+
+    for path in paths:
+        assert len(path) == 26 - state.current_num
+        for row, col in path:
+            assert logic.place_number(row, col) == (True, None)
+        assert state.win is True
+        for _ in path:
+            state.undo()
+        state.win = False
+
+def test_iter_completions_respects_limit():
+    state, _ = _play_random_prefix(3, 5)
+    assert len(list(Level1Solver().iter_completions(state, limit=3))) == 3
+
+def test_symmetric_starts_have_equal_counts():
+    # A nearly full corner region keeps this fast: compare mirrored partial boards
+    solver = Level1Solver()
+    left = GameState()
+    right = GameState()
+    for row in range(5):
+        for col in range(3):
+            left.set_inner_cell(row, col, 1)
+            right.set_inner_cell(row, 4 - col, 1)
+    left.last_pos = (0, 2)
+    right.last_pos = (0, 2)
+    assert solver.count_from_state(left) == solver.count_from_state(right) > 0
+
+def test_is_completable_agrees_with_completion_count():
+    rng = random.Random(99)
+    solver = Level1Solver()
+    for seed in range(40):
+        random.seed(seed)
+        state = GameState()
+        state.start_level1_with_random_one()
+        logic = Level1Logic(state)
+        while logic.has_valid_moves():
+            logic.place_number(*rng.choice(logic.get_valid_cells()))
+            if state.current_num > 12:
+                assert logic.is_completable() == (solver.count_from_state(state) > 0)
+        assert logic.is_completable() == state.win
+
+def test_memo_is_freed_after_each_query():
+    state, _ = _play_random_prefix(4, 10)
+    solver = Level1Solver()
+    first = solver.count_from_state(state)
+    assert first > 0 and solver._memo == {}
+    assert solver.count_from_state(state) == first and solver._memo == {}
@@ -0,0 +1,84 @@
+import random
+
+from game_logic.game_state import GameState
+from game_logic.level1 import Level1Logic
+from game_logic.level1_solver import Level1Solver
+from game_logic.level2 import Level2Logic
+from game_logic.level2_matching import Level2Feasibility
+
+
+def _level2_state(seed):
+    # Finish a random level 1 game, then start level 2 on it
+    random.seed(seed)
+    state = GameState()
+    state.start_level1_with_random_one()
+    level1 = Level1Logic(state)
+    paths = list(Level1Solver().iter_completions(state, limit=100))
+    for row, col in random.Random(seed).choice(paths):
+        level1.place_number(row, col)
+    state.start_level2([row[:] for row in state.board])
+    return state, Level2Logic(state)
+
+def _brute_force_solvable(state, logic):
+    # Backtrack over every valid cell for every remaining number
+    if state.current_num > 25:
+        return True
+    for ring_row, ring_col in logic.get_valid_ring_cells(state.current_num):
+        logic.place_number(ring_row, ring_col)
+        solved = _brute_force_solvable(state, logic)
+        state.undo()
+        state.win = False
+        if solved:
+            return True
+    return False
+
+def test_solution_replays_to_a_win():
+    for seed in range(10):
+        state, logic = _level2_state(seed)
+        solution = logic.get_solution()
+        assert solution is not None
+        assert [num for num, _ in solution] == list(range(2, 26))
+        for num, cell in solution:
+            assert state.current_num == num
+            assert logic.place_number(*cell) == (True, None)
+        assert state.win is True
+
+def test_incremental_matching_tracks_place_and_undo():
+    rng = random.Random(5)
+    solvable_seen = unsolvable_seen = 0
+    for seed in range(30):
+        state, logic = _level2_state(seed)
+        for _ in range(60):
+            valid = logic.get_valid_ring_cells(state.current_num)
+            if valid and rng.random() < 0.8:
+                logic.place_number(*rng.choice(valid))
+            elif state.current_num > 2:
+                state.undo()
+            else:
+                continue
+            expected = Level2Feasibility(logic).is_solvable()
+            assert logic.is_solvable() == expected
+            if 26 - state.current_num <= 8:
+                assert expected == _brute_force_solvable(state, logic)
+            if expected:
+                solvable_seen += 1
+            else:
+                unsolvable_seen += 1
+            if state.win:
+                break
+    assert solvable_seen and unsolvable_seen
+
+def test_not_solvable_outside_level2():
+    state = GameState()
+    state.start_level1_with_random_one()
+    assert Level2Logic(state).is_solvable() is False
+    assert Level2Logic(state).get_solution() is None
+
+def test_matching_rebuilds_for_a_new_board_at_level2():
+    state, logic = _level2_state(1)
+    for _, cell in logic.get_solution()[:4]:
+        logic.place_number(*cell)
+    other, _ = _level2_state(2)
+    state.start_level2([row[:] for row in other.board])   #same level, new inner board
+    assert logic.get_solution() == Level2Feasibility(logic).get_solution()
+    assert [num for num, _ in logic.get_solution()] == list(range(2, 26))
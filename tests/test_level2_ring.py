@@ -0,0 +1,54 @@
+from game_logic.bitboard import RING_CELLS, RING_CANDIDATE_MASKS, cell_index, ring_mask_from_ring
+from game_logic.game_state import GameState
+from game_logic.level1 import Level1Logic
+from game_logic.level2 import Level2Logic
+
+
+def _rule_candidates(row, col):
+    # Row ends, column ends, and the corners of any diagonal the cell is on
+    cells = {(row + 1, 0), (row + 1, 6), (0, col + 1), (6, col + 1)}
+    if row == col:
+        cells |= {(0, 0), (6, 6)}
+    if row + col == 4:
+        cells |= {(0, 6), (6, 0)}
+    return cells
+
+def _level2():
+    # Play a snake path from (0, 0) so level 2 has a real level 1 history
+    state = GameState()
+    state.original_one_pos = (0, 0)
+    state.reset_level1()
+    level1 = Level1Logic(state)
+    for row in range(5):
+        cols = range(5) if row % 2 == 0 else range(4, -1, -1)
+        for col in cols:
+            if (row, col) != (0, 0):
+                level1.place_number(row, col)
+    state.start_level2([row[:] for row in state.board])
+    return state, Level2Logic(state)
+
+def test_ring_table_matches_placement_rules():
+    assert len(RING_CELLS) == len(set(RING_CELLS)) == 24
+    for row in range(5):
+        for col in range(5):
+            expected = _rule_candidates(row, col)
+            mask = RING_CANDIDATE_MASKS[cell_index(row, col)]
+            assert {RING_CELLS[i] for i in range(24) if mask >> i & 1} == expected
+
+def test_ring_mask_tracks_place_undo_and_reset():
+    state, logic = _level2()
+    assert set(state.outer_ring) == set(RING_CELLS)
+
+    assert logic.place_number(1, 0) == (True, None)   # 2 is at (0, 1): left end of row 0
+    assert logic.is_valid_move(1, 0) == (False, "cell_occupied")
+    assert logic.place_number(0, 3) == (True, None)   # 3 is at (0, 2): top of column 2
+    assert state.ring_occupied == ring_mask_from_ring(state.outer_ring)
+
+    state.undo()
+    assert state.ring_occupied == ring_mask_from_ring(state.outer_ring)
+    assert (0, 3) in logic.get_valid_ring_cells(3)
+
+    state.reset_lv2()
+    assert state.ring_occupied == 0
+    assert logic.is_valid_move(3, 3) == (False, "not_ring_cell")
+    assert logic.is_valid_move(0, 0) == (False, "invalid_position")
@@ -0,0 +1,27 @@
+from path_builder import WarnsdorffPathBuilder
+
+
+def _is_king_path(engine):
+    size = engine.size
+    pos = {num: idx for idx, num in enumerate(engine.get_board_snapshot())}
+    for num in range(2, size * size + 1):
+        a_row, a_col = divmod(pos[num - 1], size)
+        b_row, b_col = divmod(pos[num], size)
+        if max(abs(a_row - b_row), abs(a_col - b_col)) != 1:
+            return False
+    return True
+
+def test_builds_complete_paths_from_every_5x5_start():
+    builder = WarnsdorffPathBuilder(size=5, seed=0)
+    for start in range(25):
+        result = builder.build(one_pos=start)
+        assert result.success is True
+        assert result.engine.is_complete() is True
+        assert sorted(result.engine.get_board_snapshot()) == list(range(1, 26))
+        assert _is_king_path(result.engine)
+
+def test_builds_larger_board_with_random_start():
+    result = WarnsdorffPathBuilder(size=60, seed=3).build()
+    assert result.success is True
+    assert result.placed == 3600
+    assert _is_king_path(result.engine)
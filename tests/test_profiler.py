@@ -0,0 +1,52 @@
+import json
+
+from gui.profiler import FrameProfiler, RingBuffer, percentile, profiler_from_env
+
+
+class Worker:
+    def step(self, n):
+        return n * 2
+
+def test_ring_buffer_keeps_newest_samples():
+    buf = RingBuffer(4)
+    for value in range(1, 7):
+        buf.add(float(value))
+    assert len(buf) == 4
+    assert buf.count == 6
+    assert buf.values() == [3.0, 4.0, 5.0, 6.0]
+
+def test_percentiles_use_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 50) == 0.0
+
+def test_wrap_times_calls_and_detach_restores(tmp_path):
+    profiler = FrameProfiler(size=8, path=str(tmp_path / "profile.json"))
+    worker = Worker()
+    profiler.wrap(worker, "step", "work")
+    assert [worker.step(n) for n in range(10)] == [n * 2 for n in range(10)]
+    profiler.detach()
+    assert "step" not in vars(worker)
+
+    stats = profiler.summary()["work"]
+    assert stats["count"] == 10
+    assert 0 <= stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"] <= stats["max_ms"]
+    with open(profiler.dump()) as f:
+        assert json.load(f)["work"]["count"] == 10
+
+def test_profiling_is_opt_in():
+    assert profiler_from_env({}) is None
+    assert profiler_from_env({"MATRIX_GAME_PROFILE": "0"}) is None
+    assert profiler_from_env({"MATRIX_GAME_PROFILE": "out.json"}).path == "out.json"
+
+def test_reset_keeps_wrappers_recording():
+    profiler = FrameProfiler(size=8)
+    worker = Worker()
+    profiler.wrap(worker, "step")
+    worker.step(1)
+    profiler.reset()
+    assert profiler.summary() == {}
+    worker.step(2)
+    assert profiler.summary()["step"]["count"] == 1
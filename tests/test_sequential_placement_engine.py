@@ -47,4 +47,64 @@ def test_completion_after_25_is_complete():
         engine.place_on_cell(empty_idx)
 
     assert engine.is_complete() is True
-    assert engine.get_next_number() == 26
\ No newline at end of file
+    assert engine.get_next_number() == 26
+
+def _snake(size):
+    # Boustrophedon order: a valid king path starting at cell 0
+    for row in range(size):
+        cols = range(size) if row % 2 == 0 else range(size - 1, -1, -1)
+        for col in cols:
+            yield row * size + col
+
+def test_adjacency_rule_rejects_far_cells():
+    engine = SequentialPlacementEngine(size=5, enforce_adjacency=True)
+    engine.start_new_level1(one_pos=0)
+
+    res = engine.place_on_cell(2)
+    assert res.success is False
+    assert "adjacent" in res.message.lower()
+    assert engine.place_on_cell(6).success is True
+
+def test_large_board_snake_completes():
+    size = 200
+    engine = SequentialPlacementEngine(size=size, enforce_adjacency=True)
+    engine.start_new_level1(one_pos=0)
+
+    cells = _snake(size)
+    next(cells)
+    for idx in cells:
+        assert engine.try_place_on_cell(idx) is True
+
+    assert engine.is_complete() is True
+    assert engine.get_next_number() == size * size + 1
+
+def test_ring_index_round_trips():
+    for size in (3, 5, 8):
+        engine = SequentialPlacementEngine(size=size)
+        positions = [engine.ring_position(i) for i in range(engine.ring_size())]
+        assert len(set(positions)) == engine.ring_size()
+        for i, (ring_row, ring_col) in enumerate(positions):
+            assert engine.ring_index(ring_row, ring_col) == i
+        assert engine.ring_index(1, 1) == -1
+
+def test_level2_ring_rules_match_5x5_game():
+    from game_logic.bitboard import RING_CANDIDATES, RING_CELLS
+
+    engine = SequentialPlacementEngine(size=5, enforce_adjacency=True)
+    engine.start_new_level1(one_pos=0)
+    cells = _snake(5)
+    next(cells)
+    for idx in cells:
+        engine.try_place_on_cell(idx)
+    engine.start_level2()
+    assert engine.last_ring_number() == 25
+
+    for num in range(2, 26):
+        engine.next_number = num
+        allowed = {pos for pos in RING_CELLS if engine.check_ring_cell(*pos) is None}
+        assert allowed == set(RING_CANDIDATES[engine.number_pos[num]])
+
+    engine.next_number = 2
+    res = engine.place_on_ring(1, 0)
+    assert res.success is True
+    assert engine.place_on_ring(1, 0).success is False
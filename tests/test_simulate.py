@@ -0,0 +1,24 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from simulate import simulate
+
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+def test_results_do_not_depend_on_worker_count():
+    serial = simulate(300, player="random", workers=1, chunk=50, seed=4)
+    pooled = simulate(300, player="random", workers=2, chunk=50, seed=4)
+    assert serial.to_dict() == pooled.to_dict()
+    assert serial.games == 300
+    assert serial.level1_wins + sum(serial.level1_dead_ends.values()) == 300
+
+def test_heuristic_player_completes_level1():
+    stats = simulate(40, player="heuristic", workers=1, chunk=20, seed=1)
+    assert stats.level1_wins == 40
+    assert sum(stats.level1_scores.values()) == 40
+
+def test_simulator_does_not_import_pygame():
+    code = "import sys, simulate; assert 'pygame' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], cwd=SRC, check=True)
@@ -0,0 +1,21 @@
+import subprocess
+import sys
+from pathlib import Path
+
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+def _run(code):
+    subprocess.run([sys.executable, "-c", code], cwd=SRC, check=True)
+
+def test_headless_modules_do_not_import_pygame():
+    _run("import sys, main, game_logic, completion_logger, completion_store, completion_codec, completion_analytics\n"
+         "import sequential_placement_engine, path_builder, completion_leaderboard\n"
+         "import gui, gui.colors, gui.text_cache\n"
+         "assert 'pygame' not in sys.modules, 'pygame imported'")
+
+def test_gui_exports_load_on_first_access():
+    _run("import sys, gui\n"
+         "assert 'gui.window' not in sys.modules\n"
+         "from gui import GameWindow, BoardRenderer\n"
+         "assert GameWindow.__module__ == 'gui.window' and 'pygame' in sys.modules")
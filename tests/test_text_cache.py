@@ -0,0 +1,31 @@
+from gui.text_cache import TextCache
+
+
+class FakeFont:
+    def __init__(self):
+        self.calls = 0
+
+    def render(self, text, antialias, color):
+        self.calls += 1
+        return (text, color)
+
+def test_renders_each_key_once():
+    font = FakeFont()
+    cache = TextCache()
+    first = cache.render(font, "12", (0, 0, 0))
+    assert cache.render(font, "12", (0, 0, 0)) is first
+    cache.render(font, "12", (255, 0, 0))
+    assert font.calls == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+def test_evicts_least_recently_used():
+    font = FakeFont()
+    cache = TextCache(max_entries=2)
+    cache.prewarm(font, ["a", "b"], (0, 0, 0))
+    cache.render(font, "a", (0, 0, 0))   #"b" is now least recently used
+    cache.render(font, "c", (0, 0, 0))
+    assert len(cache) == 2
+    cache.render(font, "a", (0, 0, 0))
+    assert font.calls == 3
+    cache.render(font, "b", (0, 0, 0))
+    assert font.calls == 4